@@ -0,0 +1,90 @@
+"""Benchmark of the ACT/ACT ISDA accrual factor against the tenor.
+
+The closed-form implementation of
+:py:class:`daycountconventions.conventions.DCCACTACTISDA` is timed next to
+the former per-year loop, for tenors from one to a hundred years, both by
+constructing an instance and reading ``accrual_factor`` and by the
+``year_fraction`` class method, which, like the loop, creates no instance.
+The time of the closed form stays flat while the loop grows with the tenor:
+``year_fraction`` is faster than the loop from one year on, and
+``accrual_factor`` from about five years, below which constructing the
+instance costs about as much as the loop.
+
+Run from the repository root with::
+
+    python -m benchmarks.bench_act_act_isda
+
+"""
+import timeit
+from calendar import isleap
+from datetime import datetime
+
+from daycountconventions.conventions import DCCACTACTISDA
+
+TENORS = (1, 5, 10, 30, 50, 100)
+NUMBER = 20000
+REPEAT = 5
+
+
+def loop_accrual_factor(date_1, date_2):
+    r"""The former per-year loop implementation, kept as the baseline."""
+    leapyear_days = 0
+    nonleapyear_days = 0
+    if date_1.year < date_2.year:
+        if isleap(date_1.year):
+            leapyear_days += (datetime(date_1.year, 12, 31) - date_1).days + 1
+        else:
+            nonleapyear_days += (datetime(date_1.year, 12, 31) - date_1).days + 1
+        for year in range(date_1.year + 1, date_2.year):
+            if isleap(year):
+                leapyear_days += 366
+            else:
+                nonleapyear_days += 365
+        if isleap(date_2.year):
+            leapyear_days += (date_2 - datetime(date_2.year, 1, 1)).days
+        else:
+            nonleapyear_days += (date_2 - datetime(date_2.year, 1, 1)).days
+    else:
+        if isleap(date_1.year):
+            leapyear_days += (date_2 - date_1).days
+        else:
+            nonleapyear_days += (date_2 - date_1).days
+    return leapyear_days / 366. + nonleapyear_days / 365.
+
+
+def run(number=NUMBER, repeat=REPEAT):
+    r"""Time both implementations for every tenor.
+
+    Returns
+    -------
+    list of tuple
+        One ``(tenor, accrual_factor_seconds, year_fraction_seconds,
+        loop_seconds)`` tuple per tenor, where the timings are the shortest
+        per call of ``repeat`` interleaved runs.
+
+    """
+    date_1 = datetime(2000, 3, 15)
+    results = []
+    for tenor in TENORS:
+        date_2 = datetime(2000 + tenor, 9, 15)
+        statements = (lambda: DCCACTACTISDA(date_1, date_2).accrual_factor,
+                      lambda: DCCACTACTISDA.year_fraction(date_1, date_2),
+                      lambda: loop_accrual_factor(date_1, date_2))
+        best = [float('inf')] * len(statements)
+        for _ in range(repeat):
+            best = [min(seconds, timeit.timeit(statement, number=number) / number)
+                    for seconds, statement in zip(best, statements)]
+        results.append((tenor,) + tuple(best))
+    return results
+
+
+def main():
+    print('{:>6} {:>19} {:>18} {:>15}'.format('tenor', 'accrual_factor (us)', 'year_fraction (us)',
+                                            'year loop (us)'))
+    for tenor, accrual_factor, year_fraction, loop in run():
+        print('{:>6} {:>19.3f} {:>18.3f} {:>15.3f}'.format(tenor, accrual_factor * 1e6, year_fraction * 1e6,
+                                                         loop * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+"""Benchmark of the time to import the package in a fresh interpreter.
+
+Importing :py:mod:`daycountconventions` must load the scalar conventions
+only. The import is timed in new interpreters, next to the import of the
+NumPy batch backend, and the benchmark fails if the package import loads a
+heavy dependency or takes longer than a limit.
+
+Run from the repository root with::
+
+    python -m benchmarks.bench_import [--max-ms 50]
+
+"""
+import argparse
+import json
+import subprocess
+import sys
+
+HEAVY_MODULES = ('numpy', 'pandas', 'pyarrow')
+STATEMENTS = (
+    ('package', 'import daycountconventions'),
+    ('scalar', 'import daycountconventions; daycountconventions.resolve("ACT/360")'),
+    ('batch', 'import daycountconventions.batch'),
+)
+REPEAT = 5
+
+_SCRIPT = '''
+import json, sys, time
+beg = time.perf_counter()
+{statement}
+seconds = time.perf_counter() - beg
+print(json.dumps({{'seconds': seconds, 'heavy': sorted(set({heavy!r}) & set(sys.modules))}}))
+'''
+
+
+def time_import(statement, repeat=REPEAT):
+    r"""Time a statement in new interpreters.
+
+    Returns
+    -------
+    tuple
+        The shortest duration in seconds, and the sorted names of the heavy
+        modules loaded by the statement.
+
+    """
+    best, heavy = float('inf'), []
+    for _ in range(repeat):
+        output = subprocess.check_output([sys.executable, '-c', _SCRIPT.format(statement=statement,
+                                                                               heavy=HEAVY_MODULES)])
+        result = json.loads(output.decode())
+        best, heavy = min(best, result['seconds']), result['heavy']
+    return best, heavy
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.bench_import', description=__doc__.split('\n\n')[0])
+    parser.add_argument('--max-ms', type=float, default=50., help='the limit of the package import time')
+    parser.add_argument('--repeat', type=int, default=REPEAT)
+    args = parser.parse_args(argv)
+    status = 0
+    print('{:>8} {:>10}  {}'.format('import', 'time (ms)', 'heavy modules'))
+    for name, statement in STATEMENTS:
+        seconds, heavy = time_import(statement, args.repeat)
+        print('{:>8} {:>10.2f}  {}'.format(name, seconds * 1e3, ', '.join(heavy) or '-'))
+        if name != 'batch' and (heavy or seconds * 1e3 > args.max_ms):
+            status = 1
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
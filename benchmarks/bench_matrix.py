@@ -0,0 +1,74 @@
+"""Benchmark of the accrual factor matrix against one call per convention.
+
+:py:func:`daycountconventions.batch.accrual_factor_matrix` decomposes the
+dates into years, months, days and ordinals once, and evaluates the rule of
+every convention on that decomposition; the rules still compute their own
+leap days, month ends and year starts. It is timed next to one call of
+:py:func:`daycountconventions.batch.accrual_factors` per convention, which
+decomposes the dates again for each of them.
+
+Run from the repository root with::
+
+    python -m benchmarks.bench_matrix [--size 1000000]
+
+"""
+import argparse
+import sys
+import timeit
+
+import numpy as np
+
+from daycountconventions.batch import accrual_factor_matrix, accrual_factors
+
+CONVENTIONS = ('30/360', '30E/360', '30E+/360 ISDA', 'ACT/360', 'ACT/365 Fixed', 'ACT/365 A', 'NL/365',
+               'ACT/ACT ISDA')
+SIZE = 1000000
+REPEAT = 3
+SEED = 20170115
+
+
+def run(size=SIZE, conventions=CONVENTIONS, repeat=REPEAT):
+    r"""Time both ways of computing the accrual factors of several
+    conventions.
+
+    Returns
+    -------
+    tuple
+        The shortest durations in seconds of the matrix and of the calls
+        per convention.
+
+    """
+    random_state = np.random.RandomState(SEED)
+    starts = np.datetime64('1990-01-01') + random_state.randint(0, 40000, size)
+    ends = starts + random_state.randint(0, 4000, size)
+
+    def matrix():
+        accrual_factor_matrix(conventions, starts, ends)
+
+    def per_convention():
+        for convention in conventions:
+            accrual_factors(convention, starts, ends)
+
+    best_matrix, best_per_convention = float('inf'), float('inf')
+    for _ in range(repeat):
+        best_matrix = min(best_matrix, timeit.timeit(matrix, number=1))
+        best_per_convention = min(best_per_convention, timeit.timeit(per_convention, number=1))
+    return best_matrix, best_per_convention
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.bench_matrix', description=__doc__.split('\n\n')[0])
+    parser.add_argument('--size', type=int, default=SIZE, help='the number of date pairs')
+    parser.add_argument('--repeat', type=int, default=REPEAT)
+    args = parser.parse_args(argv)
+    matrix, per_convention = run(args.size, repeat=args.repeat)
+    print('{} conventions, {} date pairs'.format(len(CONVENTIONS), args.size))
+    print('{:>16} {:>10}'.format('', 'time (s)'))
+    print('{:>16} {:>10.3f}'.format('matrix', matrix))
+    print('{:>16} {:>10.3f}'.format('per convention', per_convention))
+    print('{:>16} {:>10.2f}'.format('speedup', per_convention / matrix))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""Benchmark guarding the speed of the scalar accrual factors.
+
+Reading the ``accrual_factor`` of an instance is timed for every
+convention of :py:mod:`daycountconventions.conventions` which needs no
+calendar or schedule, next to its reference implementation of
+:py:mod:`daycountconventions.reference`, which follows the definition with
+``datetime`` arithmetic as the conventions once did. The benchmark fails if
+the scalar path of a convention takes more than a fraction of the time of
+its reference: the branch-free rules of the NumPy path, evaluated on single
+dates, took about as long as the references.
+
+Run from the repository root with::
+
+    python -m benchmarks.bench_scalar [--max-ratio 0.9]
+
+"""
+import argparse
+import sys
+import timeit
+from datetime import date
+
+from daycountconventions import conventions
+from daycountconventions.reference import REFERENCES
+
+# A period within a year, one over a leap day, and one of ten years.
+PAIRS = (
+    (date(2017, 1, 15), date(2017, 3, 31)),
+    (date(2000, 1, 31), date(2001, 7, 31)),
+    (date(2003, 2, 28), date(2013, 8, 31)),
+)
+CASES = (
+    ('30/360', conventions.DCC30360, ()),
+    ('30E/360', conventions.DCC30E360, ()),
+    ('30E/360 ISDA', conventions.DCC30E360ISDA, (date(2013, 8, 31),)),
+    ('30E+/360 ISDA', conventions.DCC30EP360ISDA, ()),
+    ('ACT/360', conventions.DCCACT360, ()),
+    ('ACT/365 Fixed', conventions.DCCACT365Fixed, ()),
+    ('ACT/365 L', conventions.DCCACT365L, (date(2013, 8, 31), 'annual')),
+    ('ACT/365 A', conventions.DCCACT365A, ()),
+    ('NL/365', conventions.DCCNL365, ()),
+    ('ACT/ACT ISDA', conventions.DCCACTACTISDA, ()),
+)
+NUMBER = 20000
+REPEAT = 5
+
+
+def time_scalar(convention, arguments, number=NUMBER, repeat=REPEAT):
+    r"""Time the scalar path of a convention and its reference.
+
+    Returns
+    -------
+    tuple
+        The shortest durations in seconds of one evaluation of all
+        :py:data:`PAIRS`, by ``accrual_factor`` and by the reference.
+
+    """
+    reference = REFERENCES[convention]
+    instances = [convention(date_beg, date_end, *arguments) for date_beg, date_end in PAIRS]
+
+    def scalar():
+        for instance in instances:
+            instance.accrual_factor
+
+    def literal():
+        for date_beg, date_end in PAIRS:
+            reference(date_beg, date_end, *arguments)
+
+    # The two are interleaved so that a change of machine load affects both.
+    best_scalar, best_literal = float('inf'), float('inf')
+    for _ in range(repeat):
+        best_scalar = min(best_scalar, timeit.timeit(scalar, number=number) / number)
+        best_literal = min(best_literal, timeit.timeit(literal, number=number) / number)
+    return best_scalar, best_literal
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.bench_scalar', description=__doc__.split('\n\n')[0])
+    parser.add_argument('--max-ratio', type=float, default=0.9,
+                        help='the limit of the scalar time over the reference time')
+    parser.add_argument('--number', type=int, default=NUMBER)
+    parser.add_argument('--repeat', type=int, default=REPEAT)
+    args = parser.parse_args(argv)
+    status = 0
+    print('{:>14} {:>12} {:>15} {:>7}'.format('convention', 'scalar (us)', 'reference (us)', 'ratio'))
+    for name, convention, arguments in CASES:
+        scalar, literal = time_scalar(convention, arguments, args.number, args.repeat)
+        print('{:>14} {:>12.3f} {:>15.3f} {:>7.2f}'.format(name, scalar * 1e6, literal * 1e6, scalar / literal))
+        if scalar > args.max_ratio * literal:
+            status = 1
+    return status
+
+
+if __name__ == '__main__':
+    sys.exit(main())
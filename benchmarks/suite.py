@@ -0,0 +1,199 @@
+"""Benchmark suite of the day count conventions.
+
+Every convention of :py:mod:`daycountconventions.conventions` is timed along
+four dimensions:
+
+* ``scalar``: constructing an instance and reading ``accrual_factor``, per
+  date pair, for increasing numbers of pairs;
+* ``year_fraction``: the class method computing the factor without an
+  instance;
+* ``batch``: :py:func:`daycountconventions.batch.accrual_factors` for input
+  sizes from 1 to 10^7 pairs;
+* ``tenor``: a single scalar evaluation for tenors from 1 to 100 years.
+
+The results are written to a JSON file together with the versions of the
+environment, so that two runs can be compared::
+
+    python -m benchmarks.suite --output before.json
+    python -m benchmarks.suite --output after.json
+    python -m benchmarks.suite --compare before.json after.json
+
+"""
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+import numpy as np
+
+from daycountconventions import conventions
+from daycountconventions.batch import accrual_factors
+from daycountconventions.calendars import HolidayCalendar
+from daycountconventions.schedule import CouponSchedule
+
+BATCH_SIZES = tuple(10 ** k for k in range(8))
+SCALAR_SIZES = tuple(10 ** k for k in range(5))
+TENORS = (1, 5, 10, 30, 50, 100)
+REPEAT = 3
+SEED = 20170115
+
+_FIRST_DATE = date(1990, 1, 1)
+_LAST_DATE = date(2140, 12, 31)
+
+
+def _cases():
+    # (name, convention, scalar arguments after the two dates, batch keyword arguments)
+    calendar = HolidayCalendar([date(year, 12, 25) for year in range(_FIRST_DATE.year, _LAST_DATE.year + 1)],
+                               start=_FIRST_DATE, end=_LAST_DATE)
+    schedule = CouponSchedule.generate(_FIRST_DATE, _LAST_DATE, 4)
+    termination_date = date(2040, 2, 29)
+    return [
+        ('30/360', conventions.DCC30360, (), {}),
+        ('30E/360', conventions.DCC30E360, (), {}),
+        ('30E/360 ISDA', conventions.DCC30E360ISDA, (termination_date,), {'termination_date': termination_date}),
+        ('30E+/360 ISDA', conventions.DCC30EP360ISDA, (), {}),
+        ('ACT/360', conventions.DCCACT360, (), {}),
+        ('ACT/365 Fixed', conventions.DCCACT365Fixed, (), {}),
+        ('ACT/365 L', conventions.DCCACT365L, (termination_date, 'annual'),
+         {'coupon_end': termination_date, 'coupon_type': 'annual'}),
+        ('ACT/365 A', conventions.DCCACT365A, (), {}),
+        ('NL/365', conventions.DCCNL365, (), {}),
+        ('ACT/ACT ISDA', conventions.DCCACTACTISDA, (), {}),
+        ('BUS/252', conventions.DCCBusiness252, (calendar,), {'calendar': calendar}),
+        ('ACT/ACT ICMA', conventions.DCCACTACTICMA, (schedule,), {'schedule': schedule}),
+    ]
+
+
+def _date_pairs(size, random_state):
+    starts = np.datetime64('2000-01-01') + random_state.randint(0, 30 * 365, size)
+    ends = starts + random_state.randint(0, 10 * 365, size)
+    return starts, ends
+
+
+def _best_of(function, repeat=REPEAT):
+    best = float('inf')
+    for _ in range(repeat):
+        beg = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - beg)
+    return best
+
+
+def run(batch_sizes=BATCH_SIZES, scalar_sizes=SCALAR_SIZES, tenors=TENORS, names=None, repeat=REPEAT):
+    r"""Run the benchmarks.
+
+    Parameters
+    ----------
+    batch_sizes : sequence of int
+        The numbers of date pairs of the batch benchmarks.
+    scalar_sizes : sequence of int
+        The numbers of date pairs of the scalar and year_fraction benchmarks.
+    tenors : sequence of int
+        The tenors, in years, of the tenor benchmarks.
+    names : sequence of str, optional
+        The names of the conventions to benchmark (The default is all).
+    repeat : int
+        The number of runs of which the fastest is kept.
+
+    Returns
+    -------
+    list of dict
+        One record per benchmark, with the keys ``benchmark``,
+        ``convention``, ``size``, ``seconds`` and ``ns_per_pair``.
+
+    """
+    results = []
+
+    def record(benchmark, name, size, seconds):
+        results.append({'benchmark': benchmark, 'convention': name, 'size': size, 'seconds': seconds,
+                        'ns_per_pair': seconds / size * 1e9})
+
+    for name, convention, args, kwargs in _cases():
+        if names is not None and name not in names:
+            continue
+        random_state = np.random.RandomState(SEED)
+        for size in scalar_sizes:
+            starts, ends = _date_pairs(size, random_state)
+            pairs = list(zip(starts.astype(datetime).tolist(), ends.astype(datetime).tolist()))
+            record('scalar', name, size,
+                   _best_of(lambda: [convention(beg, end, *args).accrual_factor for beg, end in pairs], repeat))
+            record('year_fraction', name, size,
+                   _best_of(lambda: [convention.year_fraction(beg, end, *args) for beg, end in pairs], repeat))
+        for size in batch_sizes:
+            starts, ends = _date_pairs(size, random_state)
+            record('batch', name, size, _best_of(lambda: accrual_factors(convention, starts, ends, **kwargs), repeat))
+        for tenor in tenors:
+            beg = date(2001, 3, 15)
+            end = beg + timedelta(days=int(tenor * 365.25))
+            number = 1000
+            seconds = _best_of(lambda: [convention(beg, end, *args).accrual_factor for _ in range(number)], repeat)
+            results.append({'benchmark': 'tenor', 'convention': name, 'size': tenor, 'seconds': seconds / number,
+                            'ns_per_pair': seconds / number * 1e9})
+    return results
+
+
+def metadata():
+    r"""dict: The description of the environment the benchmarks ran in."""
+    try:
+        commit = subprocess.check_output(['git', 'rev-parse', 'HEAD'], stderr=subprocess.DEVNULL).decode().strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {'python': platform.python_version(), 'numpy': np.__version__, 'platform': platform.platform(),
+            'processor': platform.processor(), 'commit': commit,
+            'timestamp': datetime.now().isoformat(timespec='seconds')}
+
+
+def compare(baseline_path, current_path):
+    r"""Print the ratio of the current timings to the baseline timings.
+
+    Returns
+    -------
+    list of tuple
+        ``(benchmark, convention, size, ratio)`` for every benchmark present
+        in both files, where a ratio above 1 is a slowdown.
+
+    """
+    with open(baseline_path) as baseline_file:
+        baseline = json.load(baseline_file)['results']
+    with open(current_path) as current_file:
+        current = json.load(current_file)['results']
+    before = dict(((r['benchmark'], r['convention'], r['size']), r['seconds']) for r in baseline)
+    ratios = []
+    for r in current:
+        key = (r['benchmark'], r['convention'], r['size'])
+        if key in before and before[key] > 0:
+            ratios.append(key + (r['seconds'] / before[key],))
+    for benchmark, convention, size, ratio in ratios:
+        print('{:<14} {:<14} {:>9} {:>8.2f}x'.format(benchmark, convention, size, ratio))
+    return ratios
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.suite', description=__doc__.split('\n\n')[0])
+    parser.add_argument('--output', default='benchmark_results.json', help='the JSON file of the results')
+    parser.add_argument('--max-batch-size', type=int, default=BATCH_SIZES[-1])
+    parser.add_argument('--max-scalar-size', type=int, default=SCALAR_SIZES[-1])
+    parser.add_argument('--convention', action='append', dest='names', help='a convention to benchmark')
+    parser.add_argument('--repeat', type=int, default=REPEAT)
+    parser.add_argument('--compare', nargs=2, metavar=('BASELINE', 'CURRENT'),
+                        help='compare two result files instead of running the benchmarks')
+    args = parser.parse_args(argv)
+    if args.compare:
+        compare(*args.compare)
+        return 0
+    results = run(batch_sizes=[size for size in BATCH_SIZES if size <= args.max_batch_size],
+                  scalar_sizes=[size for size in SCALAR_SIZES if size <= args.max_scalar_size],
+                  names=args.names, repeat=args.repeat)
+    with open(args.output, 'w') as output_file:
+        json.dump({'metadata': metadata(), 'results': results}, output_file, indent=2)
+    for r in results:
+        print('{:<14} {:<14} {:>9} {:>12.1f} ns/pair'.format(r['benchmark'], r['convention'], r['size'],
+                                                             r['ns_per_pair']))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
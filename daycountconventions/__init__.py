@@ -1,4 +1,60 @@
 """This package provides the computation of accrual factor using
 several different day count conventions.
 
-"""
\ No newline at end of file
+Importing the package loads the convention classes and the registry only.
+The other modules, some of which depend on NumPy, pandas or pyarrow, and
+the names they provide below are loaded on first access, e.g.
+``daycountconventions.accrual_factors`` imports
+:py:mod:`daycountconventions.batch` and NumPy when it is first used.
+
+"""
+import importlib
+
+from .conventions import (DCC30360, DCC30E360, DCC30E360ISDA, DCC30EP360ISDA, DCCACT360, DCCACT365Fixed, DCCACT365L,
+                          DCCACT365A, DCCNL365, DCCACTACTISDA, DCCBusiness252, DCCACTACTICMA)
+from .registry import available_conventions, canonical_name, register, resolve
+
+# The names loaded on first access, and the modules providing them.
+_LAZY_NAMES = {
+    'AccrualCache': 'cache',
+    'AccrualClient': 'server',
+    'AccrualServer': 'server',
+    'AccrualStream': 'accrual',
+    'Cashflows': 'cashflows',
+    'CouponSchedule': 'schedule',
+    'HolidayCalendar': 'calendars',
+    'accrual_curve': 'accrual',
+    'accrual_factor_matrix': 'batch',
+    'accrual_factors': 'batch',
+    'accrual_periods': 'schedule',
+    'coupon_cashflows': 'cashflows',
+    'end_date': 'solver',
+    'end_dates': 'solver',
+    'parallel_accrual_factors': 'parallel',
+    'parse_dates': 'parsing',
+    'process_file': 'pipeline',
+    'read_dates': 'columnar',
+    'shifted_accrual_factors': 'scenarios',
+    'write_accrual_factors': 'columnar',
+}
+_LAZY_MODULES = ('accessor', 'accrual', 'batch', 'cache', 'calendars', 'cashflows', 'columnar', 'instrumentation', 'parallel',
+                 'parsing', 'pipeline', 'reference', 'scenarios', 'schedule', 'server', 'solver', 'validation')
+
+__all__ = ['DCC30360', 'DCC30E360', 'DCC30E360ISDA', 'DCC30EP360ISDA', 'DCCACT360', 'DCCACT365Fixed', 'DCCACT365L',
+           'DCCACT365A', 'DCCNL365', 'DCCACTACTISDA', 'DCCBusiness252', 'DCCACTACTICMA', 'available_conventions',
+           'canonical_name', 'register', 'resolve'] + sorted(_LAZY_NAMES)
+
+
+def __getattr__(name):
+    if name in _LAZY_NAMES:
+        value = getattr(importlib.import_module('.' + _LAZY_NAMES[name], __name__), name)
+    elif name in _LAZY_MODULES:
+        value = importlib.import_module('.' + name, __name__)
+    else:
+        raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_NAMES) | set(_LAZY_MODULES))
@@ -0,0 +1,56 @@
+"""Command-line entry point computing the accrual factors of a file.
+
+Run ``python -m daycountconventions --help`` for the usage.
+
+"""
+import argparse
+import sys
+
+from . import registry
+from .calendars import HolidayCalendar
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m daycountconventions',
+        description='Compute the accrual factors of the date pairs of a CSV or Parquet file. The output file holds '
+                    'the input columns followed by an accrual_factor column.')
+    parser.add_argument('input', nargs='?', help='the input file, read in chunks')
+    parser.add_argument('output', nargs='?', help='the output file, written chunk by chunk')
+    parser.add_argument('-c', '--convention', help='the convention of every row, instead of a convention column')
+    parser.add_argument('--chunk-size', type=int, default=100000, help='the number of rows read at once')
+    parser.add_argument('--start-column', default='start')
+    parser.add_argument('--end-column', default='end')
+    parser.add_argument('--convention-column', default='convention')
+    parser.add_argument('--termination-column', default='termination_date')
+    parser.add_argument('--coupon-end-column', default='coupon_end')
+    parser.add_argument('--coupon-type', choices=('semi-annual', 'annual'), default='semi-annual')
+    parser.add_argument('--calendar', help='a holiday file for BUS/252, with one YYYY-MM-DD date per line')
+    parser.add_argument('--list', action='store_true', help='list the supported conventions and exit')
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name in registry.available_conventions():
+            print(name)
+        return 0
+    if args.input is None or args.output is None:
+        parser.error('the input and output files are required')
+    # The pipeline depends on NumPy, which listing the conventions does not need.
+    from .pipeline import process_file
+
+    try:
+        calendar = HolidayCalendar.from_file(args.calendar) if args.calendar else None
+        rows = process_file(args.input, args.output, convention=args.convention, chunk_size=args.chunk_size,
+                            start_column=args.start_column, end_column=args.end_column,
+                            convention_column=args.convention_column, termination_column=args.termination_column,
+                            coupon_end_column=args.coupon_end_column, coupon_type=args.coupon_type,
+                            calendar=calendar)
+    except (IOError, ValueError) as error:
+        print('error: {}'.format(error), file=sys.stderr)
+        return 1
+    print('{} rows written to {}'.format(rows, args.output), file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
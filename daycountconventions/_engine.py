@@ -0,0 +1,123 @@
+"""The rules of the day count conventions, written on integer dates.
+
+Every rule takes the year, month, day and proleptic Gregorian ordinal (as
+returned by ``datetime.date.toordinal``) of the dates involved, and is
+written with arithmetic and the ``&``/``|`` operators only. The same rule
+therefore evaluates plain Python integers, for the classes in
+:py:mod:`daycountconventions.conventions`, and NumPy integer arrays, for
+:py:mod:`daycountconventions.batch`, with identical results.
+
+"""
+
+
+def is_leap(y):
+    return ((y % 4 == 0) & (y % 100 != 0)) | (y % 400 == 0)
+
+
+def year_start(y):
+    # The ordinal of 1 January of year y.
+    p = y - 1
+    return 365 * p + p // 4 - p // 100 + p // 400 + 1
+
+
+def leap_day(y):
+    # The ordinal of 29 February of year y, meaningful only if y is a leap year.
+    return year_start(y) + 59
+
+
+def leap_years_before(y):
+    # The number of leap years in [1, y).
+    p = y - 1
+    return p // 4 - p // 100 + p // 400
+
+
+def days_in_month(y, m):
+    return 28 + (m + m // 8) % 2 + 2 % m + 2 * (1 // m) + (m == 2) * is_leap(y)
+
+
+def leap_day_crossed(y1, o1, y2, o2):
+    # Whether 29 February of the year of either date lies in (o1, o2].
+    f1 = leap_day(y1)
+    f2 = leap_day(y2)
+    return (is_leap(y1) & (o1 < f1) & (f1 <= o2)) | (is_leap(y2) & (o1 < f2) & (f2 <= o2))
+
+
+def thirty_360(y1, m1, d1, o1, y2, m2, d2, o2):
+    d2 = d2 - (d2 == 31) * (d1 >= 30)
+    d1 = d1 - (d1 == 31)
+    return (360 * (y2 - y1) + 30 * (m2 - m1) + d2 - d1) / 360.
+
+
+def thirty_e_360(y1, m1, d1, o1, y2, m2, d2, o2):
+    d1 = d1 - (d1 == 31)
+    d2 = d2 - (d2 == 31)
+    return (360 * (y2 - y1) + 30 * (m2 - m1) + d2 - d1) / 360.
+
+
+def thirty_e_360_isda(y1, m1, d1, o1, y2, m2, d2, o2, ot):
+    end_of_february = (m2 == 2) & (d2 == 28 + is_leap(y2)) & (o2 != ot)
+    d1 = d1 + (30 - d1) * (d1 == days_in_month(y1, m1))
+    d2 = d2 + (30 - d2) * ((d2 == 31) | end_of_february)
+    return (360 * (y2 - y1) + 30 * (m2 - m1) + d2 - d1) / 360.
+
+
+def thirty_e_plus_360_isda(y1, m1, d1, o1, y2, m2, d2, o2):
+    # Rolling the 31st to the 1st of the next month; a December roll into
+    # month 13 weighs the same as January of the next year.
+    roll = d2 == 31
+    d1 = d1 - (d1 == 31)
+    d2 = d2 - 30 * roll
+    m2 = m2 + roll
+    return (360 * (y2 - y1) + 30 * (m2 - m1) + d2 - d1) / 360.
+
+
+def act_360(y1, m1, d1, o1, y2, m2, d2, o2):
+    return (o2 - o1) / 360.
+
+
+def act_365_fixed(y1, m1, d1, o1, y2, m2, d2, o2):
+    return (o2 - o1) / 365.
+
+
+def act_365_l(y1, m1, d1, o1, y2, m2, d2, o2, y3, o3, annual):
+    semi_annual_denominator = 365 + is_leap(y3)
+    annual_denominator = 365 + leap_day_crossed(y1, o1, y3, o3)
+    denominator = annual * annual_denominator + (1 - annual) * semi_annual_denominator
+    return (o2 - o1) / (1. * denominator)
+
+
+def act_365_a(y1, m1, d1, o1, y2, m2, d2, o2):
+    return (o2 - o1) / (365. + leap_day_crossed(y1, o1, y2, o2))
+
+
+def nl_365(y1, m1, d1, o1, y2, m2, d2, o2):
+    return (o2 - o1 - leap_day_crossed(y1, o1, y2, o2)) / 365.
+
+
+def act_act_isda(y1, m1, d1, o1, y2, m2, d2, o2):
+    l1 = 1 * is_leap(y1)
+    l2 = 1 * is_leap(y2)
+    first = year_start(y1 + 1) - o1
+    last = o2 - year_start(y2)
+    whole = y2 - y1 - 1
+    whole_leap = leap_years_before(y2) - leap_years_before(y1 + 1)
+    forward = 1 * (y1 < y2)
+    leap_days = forward * (l1 * first + 366 * whole_leap + l2 * last) + (1 - forward) * l1 * (o2 - o1)
+    nonleap_days = (forward * ((1 - l1) * first + 365 * (whole - whole_leap) + (1 - l2) * last)
+                    + (1 - forward) * (1 - l1) * (o2 - o1))
+    return leap_days / 366. + nonleap_days / 365.
+
+
+def business_252(y1, m1, d1, o1, y2, m2, d2, o2, counts, first):
+    # counts[i] is the number of business days in [first, first + i).
+    return (counts[o2 - first] - counts[o1 - first]) / 252.
+
+
+def act_act_icma(y1, m1, d1, o1, y2, m2, d2, o2, k1, k2, boundaries, lengths, frequency):
+    # The reference period k spans [boundaries[k], boundaries[k + 1]) and
+    # lasts lengths[k] days; o1 lies in period k1 and o2 ends period k2.
+    within = 1 * (k1 >= k2)
+    within_factor = (o2 - o1) / (frequency * lengths[k1])
+    across_factor = ((boundaries[k1 + 1] - o1) / (frequency * lengths[k1]) + (k2 - k1 - 1) / (1. * frequency)
+                     + (o2 - boundaries[k2]) / (frequency * lengths[k2]))
+    return within * within_factor + (1 - within) * across_factor
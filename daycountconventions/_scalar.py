@@ -0,0 +1,143 @@
+"""The rules of the day count conventions, written on date objects.
+
+These are the rules of :py:mod:`daycountconventions._engine` for a single
+pair of dates: the same integer arithmetic, hence the same results, but
+with ``if`` statements instead of evaluating every case, and reading only
+the parts of the dates each rule needs. They back the ``accrual_factor``
+property and the ``year_fraction`` class method of the conventions, while
+the branch-free rules of the engine evaluate NumPy arrays.
+
+"""
+# The number of days of each month in a common year.
+_MONTH_DAYS = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def is_leap(y):
+    return y % 4 == 0 and (y % 100 != 0 or y % 400 == 0)
+
+
+def year_start(y):
+    # The ordinal of 1 January of year y.
+    p = y - 1
+    return 365 * p + p // 4 - p // 100 + p // 400 + 1
+
+
+def leap_day_crossed(date_1, date_2):
+    # Whether 29 February of the year of either date lies in (date_1, date_2].
+    y1, y2 = date_1.year, date_2.year
+    if y2 < y1:
+        return False
+    if (date_1.month == 1 or date_1.month == 2 and date_1.day < 29) and is_leap(y1):
+        if y2 > y1 or date_2.month > 2 or date_2.day == 29 and date_2.month == 2:
+            return True
+    return y2 > y1 and (date_2.month > 2 or date_2.day == 29 and date_2.month == 2) and is_leap(y2)
+
+
+def thirty_360(date_beg, date_end):
+    d1 = date_beg.day
+    d2 = date_end.day
+    if d1 == 31:
+        d1 = 30
+    if d2 == 31 and d1 == 30:
+        d2 = 30
+    return (360 * (date_end.year - date_beg.year) + 30 * (date_end.month - date_beg.month) + d2 - d1) / 360.
+
+
+def thirty_e_360(date_beg, date_end):
+    d1 = date_beg.day
+    d2 = date_end.day
+    if d1 == 31:
+        d1 = 30
+    if d2 == 31:
+        d2 = 30
+    return (360 * (date_end.year - date_beg.year) + 30 * (date_end.month - date_beg.month) + d2 - d1) / 360.
+
+
+def thirty_e_360_isda(date_beg, date_end, termination_date):
+    y1, m1, d1 = date_beg.year, date_beg.month, date_beg.day
+    y2, m2, d2 = date_end.year, date_end.month, date_end.day
+    if d1 >= 28 and d1 == _MONTH_DAYS[m1] + (m1 == 2 and is_leap(y1)):
+        d1 = 30
+    if d2 == 31:
+        d2 = 30
+    elif m2 == 2 and d2 >= 28 and d2 == 28 + is_leap(y2) and date_end.toordinal() != termination_date.toordinal():
+        d2 = 30
+    return (360 * (y2 - y1) + 30 * (m2 - m1) + d2 - d1) / 360.
+
+
+def thirty_e_plus_360_isda(date_beg, date_end):
+    # Rolling the 31st to the 1st of the next month; a December roll into
+    # month 13 weighs the same as January of the next year.
+    d1 = date_beg.day
+    m2 = date_end.month
+    d2 = date_end.day
+    if d1 == 31:
+        d1 = 30
+    if d2 == 31:
+        d2 = 1
+        m2 += 1
+    return (360 * (date_end.year - date_beg.year) + 30 * (m2 - date_beg.month) + d2 - d1) / 360.
+
+
+def act_360(date_beg, date_end):
+    return (date_end.toordinal() - date_beg.toordinal()) / 360.
+
+
+def act_365_fixed(date_beg, date_end):
+    return (date_end.toordinal() - date_beg.toordinal()) / 365.
+
+
+def act_365_l(date_1, date_2, date_3, coupon_type):
+    o1 = date_1.toordinal()
+    if coupon_type == 'semi-annual':
+        leap = is_leap(date_3.year)
+    elif coupon_type == 'annual':
+        leap = leap_day_crossed(date_1, date_3)
+    else:
+        raise ValueError('The parameter "coupon_type" can only be either "semi-annual" or "annual"')
+    return (date_2.toordinal() - o1) / (366. if leap else 365.)
+
+
+def act_365_a(date_beg, date_end):
+    return (date_end.toordinal() - date_beg.toordinal()) / (366. if leap_day_crossed(date_beg, date_end) else 365.)
+
+
+def nl_365(date_beg, date_end):
+    return (date_end.toordinal() - date_beg.toordinal() - leap_day_crossed(date_beg, date_end)) / 365.
+
+
+def act_act_isda(date_beg, date_end):
+    y1, y2 = date_beg.year, date_end.year
+    o1, o2 = date_beg.toordinal(), date_end.toordinal()
+    if y1 >= y2:
+        return (o2 - o1) / (366. if is_leap(y1) else 365.)
+    # The days in leap years: the whole leap years in between, and the parts
+    # of the first and last years if they are leap; the others are common.
+    p1, p2 = y1, y2 - 1
+    leap_days = 366 * (p2 // 4 - p2 // 100 + p2 // 400 - p1 // 4 + p1 // 100 - p1 // 400)
+    if is_leap(y1):
+        leap_days += year_start(y1 + 1) - o1
+    if is_leap(y2):
+        leap_days += o2 - year_start(y2)
+    return leap_days / 366. + (o2 - o1 - leap_days) / 365.
+
+
+def business_252(date_beg, date_end, calendar):
+    o1, o2 = date_beg.toordinal(), date_end.toordinal()
+    calendar._check_range(min(o1, o2), max(o1, o2))
+    # counts[i] is the number of business days in [first, first + i).
+    counts, first = calendar._counts, calendar._first
+    return (counts[o2 - first] - counts[o1 - first]) / 252.
+
+
+def act_act_icma(date_beg, date_end, schedule):
+    o1, o2 = date_beg.toordinal(), date_end.toordinal()
+    k1, k2 = schedule._locate(o1, o2)
+    # The reference period k spans [boundaries[k], boundaries[k + 1]) and
+    # lasts lengths[k] days; o1 lies in period k1 and o2 ends period k2.
+    frequency, lengths = schedule._frequency, schedule._lengths
+    if k1 >= k2:
+        return (o2 - o1) / (frequency * lengths[k1])
+    boundaries = schedule._boundaries
+    return ((boundaries[k1 + 1] - o1) / (frequency * lengths[k1]) + (k2 - k1 - 1) / (1. * frequency)
+            + (o2 - boundaries[k2]) / (frequency * lengths[k2]))
@@ -1,8 +1,17 @@
+# Sets the attributes of the immutable instances, bound once for speed.
+_setattr = object.__setattr__
+
+
 class DayCountConvention(object):
     r"""
     An abstract class containing the most common components of
     frequently used day count conventions.
 
+    Instances are immutable and hold only their dates, so reading
+    ``accrual_factor`` never changes them and one instance can be shared
+    between threads. To compute an accrual factor without creating an
+    instance, use the class method ``year_fraction``.
+
     Parameters
     ----------
     date_beg : datetime.datetime
@@ -11,15 +20,21 @@ class DayCountConvention(object):
         The end date considered when computing accrual factor.
 
     """
+    __slots__ = ('_date_1', '_date_2')
+
     def __init__(self, date_beg, date_end):
-        self._date_1 = date_beg
-        self._date_2 = date_end
-        self._D1 = date_beg.day
-        self._D2 = date_end.day
-        self._M1 = date_beg.month
-        self._M2 = date_end.month
-        self._Y1 = date_beg.year
-        self._Y2 = date_end.year
+        _setattr(self, '_date_1', date_beg)
+        _setattr(self, '_date_2', date_end)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("'{}' object is immutable".format(type(self).__name__))
+
+    def __delattr__(self, name):
+        raise AttributeError("'{}' object is immutable".format(type(self).__name__))
+
+    def __setstate__(self, state):
+        for name, value in state[1].items():
+            _setattr(self, name, value)
 
     @property
     def convention_name(self):
@@ -35,7 +50,30 @@ class DayCountConvention(object):
         """
         raise NotImplementedError
 
-    def _date_equal(self, date_1, date_2):
-        if date_1.year == date_2.year and date_1.month == date_2.month and date_1.day == date_2.day:
-            return True
-        return False
+    @classmethod
+    def year_fraction(cls, date_beg, date_end):
+        r"""Compute the accrual factor between two dates without creating an
+        instance of the convention.
+
+        Parameters
+        ----------
+        date_beg : datetime.datetime
+            The beginning date considered when computing accrual factor.
+        date_end : datetime.datetime
+            The end date considered when computing accrual factor.
+
+        Returns
+        -------
+        float
+            The same value as the ``accrual_factor`` property of
+            ``cls(date_beg, date_end)``.
+
+        """
+        return cls._scalar_rule(date_beg, date_end)
+
+    @classmethod
+    def _scalar_rule(cls, date_beg, date_end):
+        # The subclasses provide their rule on date objects from
+        # daycountconventions._scalar; the others use their integer rule.
+        return cls._rule(date_beg.year, date_beg.month, date_beg.day, date_beg.toordinal(),
+                         date_end.year, date_end.month, date_end.day, date_end.toordinal())
@@ -0,0 +1,176 @@
+"""This module registers a ``dcc`` accessor on pandas Series and DataFrames,
+computing accrual factors with :py:func:`daycountconventions.batch.accrual_factors`
+instead of one convention instance per row.
+
+The accessor is registered when this module is imported::
+
+    import daycountconventions.accessor
+
+    trades['accrual_factor'] = trades.dcc.accrual_factor('start', 'end', convention='ACT/360')
+    trades['accrual_factor'] = trades.dcc.accrual_factor('start', 'end', convention_column='convention')
+    factors = trades['start'].dcc.accrual_factor(trades['end'], 'ACT/ACT ISDA')
+
+Rows with a missing date (``NaT``) get a missing accrual factor (``NaN``).
+
+"""
+import numpy as np
+import pandas as pd
+
+from . import conventions, registry
+from .batch import accrual_factors
+
+FACTOR_NAME = 'accrual_factor'
+
+_DATE_ARGUMENTS = ('termination_date', 'coupon_end')
+# The convention using each date argument.
+_DATE_ARGUMENT_CONVENTIONS = {'termination_date': conventions.DCC30E360ISDA, 'coupon_end': conventions.DCCACT365L}
+
+
+@pd.api.extensions.register_series_accessor('dcc')
+class SeriesAccessor(object):
+    r"""The ``dcc`` accessor of a Series of beginning dates.
+
+    Parameters
+    ----------
+    series : pandas.Series
+        The beginning dates, as ``datetime64`` values or date objects.
+
+    """
+    def __init__(self, series):
+        self._series = series
+
+    def accrual_factor(self, ends, convention, **kwargs):
+        r"""Compute the accrual factors from the dates of the Series.
+
+        Parameters
+        ----------
+        ends : pandas.Series or array_like
+            The end dates. A Series is aligned on the index of the beginning
+            dates.
+        convention : type or str
+            A day count convention class, or a name registered in
+            :py:mod:`daycountconventions.registry`.
+        **kwargs
+            The further arguments of
+            :py:func:`daycountconventions.batch.accrual_factors`, such as
+            ``termination_date`` or ``calendar``. Date arguments may be
+            Series, aligned on the index, or arrays with one date per row.
+
+        Returns
+        -------
+        pandas.Series
+            The float64 accrual factors, with the index of the Series.
+
+        """
+        index = self._series.index
+        columns = {'starts': self._series, 'ends': ends}
+        for name in _DATE_ARGUMENTS:
+            if kwargs.get(name) is not None and np.ndim(kwargs[name]) > 0:
+                columns[name] = kwargs.pop(name)
+        columns = dict((name, _dates(column, index)) for name, column in columns.items())
+        factors = _masked_factors(convention, columns, np.arange(len(index)), kwargs)
+        return pd.Series(factors, index=index, name=FACTOR_NAME)
+
+
+@pd.api.extensions.register_dataframe_accessor('dcc')
+class DataFrameAccessor(object):
+    r"""The ``dcc`` accessor of a DataFrame of date pairs.
+
+    Parameters
+    ----------
+    frame : pandas.DataFrame
+        The DataFrame, with one date pair per row.
+
+    """
+    def __init__(self, frame):
+        self._frame = frame
+
+    def accrual_factor(self, start_column='start', end_column='end', convention=None,
+                       convention_column='convention', termination_column='termination_date',
+                       coupon_end_column='coupon_end', coupon_type='semi-annual', calendar=None, schedule=None):
+        r"""Compute the accrual factors of the rows of the DataFrame.
+
+        Parameters
+        ----------
+        start_column, end_column : str
+            The columns of the beginning and end dates.
+        convention : type or str, optional
+            The day count convention of all rows. If omitted, the convention
+            of each row is read from ``convention_column``, and the rows are
+            computed in one batch per distinct convention.
+        convention_column : str
+            The column of the conventions, used without ``convention``.
+        termination_column : str
+            The column of the termination dates, used by the 30E/360 ISDA
+            convention if present.
+        coupon_end_column : str
+            The column of the coupon end dates, used by the ACT/365 L
+            convention if present.
+        coupon_type : {'semi-annual', 'annual'}
+            The coupon type used by the ACT/365 L convention.
+        calendar : daycountconventions.calendars.HolidayCalendar, optional
+            The holiday calendar used by the BUS/252 convention.
+        schedule : daycountconventions.schedule.CouponSchedule, optional
+            The coupon schedule used by the ACT/ACT ICMA convention.
+
+        Returns
+        -------
+        pandas.Series
+            The float64 accrual factors, with the index of the DataFrame.
+
+        Raises
+        ------
+        ValueError
+            If a column is missing, a convention is unknown, or an argument
+            required by a convention is missing.
+
+        """
+        frame = self._frame
+        required = (start_column, end_column) + (() if convention is not None else (convention_column,))
+        for column in required:
+            if column not in frame.columns:
+                raise ValueError('The column "{}" is missing from the DataFrame'.format(column))
+        columns = {'starts': _dates(frame[start_column]), 'ends': _dates(frame[end_column])}
+        for name, column in (('termination_date', termination_column), ('coupon_end', coupon_end_column)):
+            if column in frame.columns:
+                columns[name] = _dates(frame[column])
+        options = {'coupon_type': coupon_type, 'calendar': calendar, 'schedule': schedule}
+        if convention is not None:
+            factors = _masked_factors(convention, columns, np.arange(len(frame)), options)
+        else:
+            factors = np.empty(len(frame), dtype=np.float64)
+            names, inverse = np.unique(frame[convention_column].astype(str).values, return_inverse=True)
+            for k, name in enumerate(names):
+                index = np.flatnonzero(inverse == k)
+                factors[index] = _masked_factors(registry.resolve(name), columns, index, options)
+        return pd.Series(factors, index=frame.index, name=FACTOR_NAME)
+
+
+def _dates(values, index=None):
+    if isinstance(values, pd.Series) and index is not None:
+        values = values.reindex(index)
+    if isinstance(values, (pd.Series, pd.Index)) and getattr(values.dtype, 'tz', None) is not None:
+        values = values.dt.tz_localize(None) if isinstance(values, pd.Series) else values.tz_localize(None)
+    return np.asarray(values, dtype='datetime64[D]')
+
+
+def _masked_factors(convention, columns, index, options):
+    # The accrual factors of the rows in index, NaN where a date used by the
+    # convention is missing. The date arguments of other conventions are
+    # ignored, so they may be missing.
+    if isinstance(convention, str):
+        convention = registry.resolve(convention)
+    columns = dict((name, values) for name, values in columns.items()
+                   if _DATE_ARGUMENT_CONVENTIONS.get(name, convention) is convention)
+    valid = np.ones(len(index), dtype=bool)
+    for values in columns.values():
+        if values.ndim:
+            valid &= ~np.isnat(values[index])
+    factors = np.full(len(index), np.nan)
+    index = index[valid]
+    if len(index):
+        rows = dict((name, values[index] if values.ndim else values) for name, values in columns.items())
+        starts, ends = rows.pop('starts'), rows.pop('ends')
+        options = dict(options, **rows)
+        factors[valid] = accrual_factors(convention, starts, ends, **options)
+    return factors
@@ -0,0 +1,227 @@
+"""This module provides the accrual factors of a period start against a
+valuation date which advances day by day, e.g. for daily accrued interest
+reports.
+
+Instead of computing each accrual factor from the two dates, an
+:py:class:`AccrualStream` keeps the year, month, day and ordinal of the
+valuation date and steps them forward by one day, so each update is a few
+integer operations followed by the rule of the convention. The factors are
+computed from the integer day counts rather than by adding ``1/360`` per
+day, so they are identical to the ``accrual_factor`` property and do not
+drift over long periods.
+
+"""
+from datetime import date
+
+from . import _engine, conventions, registry
+
+# The first further argument required by each convention, and its name.
+_REQUIRED_ARGUMENTS = {
+    conventions.DCC30E360ISDA: ('termination_date', '30E/360 ISDA'),
+    conventions.DCCACT365L: ('coupon_end', 'ACT/365 L'),
+    conventions.DCCBusiness252: ('calendar', 'BUS/252'),
+    conventions.DCCACTACTICMA: ('schedule', 'ACT/ACT ICMA'),
+}
+
+
+class AccrualStream(object):
+    r"""The accrual factor of a fixed beginning date against an advancing
+    valuation date.
+
+    Parameters
+    ----------
+    convention : type or str
+        A day count convention class, or a name registered in
+        :py:mod:`daycountconventions.registry`.
+    date_beg : datetime.date
+        The beginning date considered when computing accrual factor, and the
+        first valuation date.
+    *args
+        The further arguments of the ``year_fraction`` method of the
+        convention, e.g. the ``termination_date`` of
+        :py:class:`daycountconventions.conventions.DCC30E360ISDA`.
+
+    Raises
+    ------
+    ValueError
+        If an argument required by the convention is missing or invalid.
+
+    Examples
+    --------
+    >>> stream = AccrualStream('ACT/360', date(2017, 1, 15))
+    >>> stream.advance()
+    0.002777777777777778
+    >>> stream.date
+    datetime.date(2017, 1, 16)
+
+    """
+    def __init__(self, convention, date_beg, *args):
+        if isinstance(convention, str):
+            convention = registry.resolve(convention)
+        self._convention = convention
+        self._rule = convention._rule
+        self._beg = (date_beg.year, date_beg.month, date_beg.day, date_beg.toordinal())
+        self._last = date.max.toordinal()
+        self._schedule = None
+        required = _REQUIRED_ARGUMENTS.get(convention)
+        if required is not None and not args:
+            raise ValueError('The parameter "{}" is required by the {} convention'.format(*required))
+        if convention is conventions.DCC30E360ISDA:
+            self._extra = (args[0].toordinal(),)
+        elif convention is conventions.DCCACT365L:
+            coupon_end = args[0]
+            coupon_type = args[1] if len(args) > 1 else 'semi-annual'
+            if coupon_type not in ('semi-annual', 'annual'):
+                raise ValueError('The parameter "coupon_type" can only be either "semi-annual" or "annual"')
+            self._extra = (coupon_end.year, coupon_end.toordinal(), coupon_type == 'annual')
+        elif convention is conventions.DCCBusiness252:
+            calendar = args[0]
+            calendar._check_range(self._beg[3], self._beg[3])
+            self._last = calendar._last
+            self._extra = (calendar._counts, calendar._first)
+        elif convention is conventions.DCCACTACTICMA:
+            self._schedule = args[0]
+            k1, self._k2 = self._schedule._locate(self._beg[3], self._beg[3])
+            self._last = self._schedule._boundaries[-1]
+            self._extra = (k1,)
+        else:
+            self._extra = ()
+        self._y, self._m, self._d, self._o = self._beg
+        self._month_days = _engine.days_in_month(self._y, self._m)
+        self._factor = self._compute()
+
+    @property
+    def convention(self):
+        r"""type: The day count convention class."""
+        return self._convention
+
+    @property
+    def date(self):
+        r"""datetime.date: The current valuation date."""
+        return date.fromordinal(self._o)
+
+    @property
+    def factor(self):
+        r"""float: The accrual factor from the beginning date to the current
+        valuation date."""
+        return self._factor
+
+    def accrued_interest(self, notional, rate):
+        r"""The interest accrued on a notional at a rate up to the current
+        valuation date.
+
+        Returns
+        -------
+        float
+            ``notional * rate * factor``.
+
+        """
+        return notional * rate * self._factor
+
+    def advance(self, days=1):
+        r"""Move the valuation date forward.
+
+        Parameters
+        ----------
+        days : int
+            The number of days, not negative (The default is 1). Moving by
+            one day only updates the current date; larger moves recompute it.
+
+        Returns
+        -------
+        float
+            The accrual factor at the new valuation date.
+
+        Raises
+        ------
+        ValueError
+            If ``days`` is negative, or the new valuation date is beyond the
+            calendar or schedule of the convention.
+
+        """
+        if days < 0:
+            raise ValueError('The valuation date can only move forward')
+        if self._o + days > self._last:
+            raise ValueError('The valuation date cannot move beyond {}'.format(date.fromordinal(self._last)))
+        if days == 1:
+            self._o += 1
+            if self._d < self._month_days:
+                self._d += 1
+            else:
+                self._d = 1
+                if self._m < 12:
+                    self._m += 1
+                else:
+                    self._m = 1
+                    self._y += 1
+                self._month_days = _engine.days_in_month(self._y, self._m)
+        elif days:
+            day = date.fromordinal(self._o + days)
+            self._y, self._m, self._d, self._o = day.year, day.month, day.day, day.toordinal()
+            self._month_days = _engine.days_in_month(self._y, self._m)
+        self._factor = self._compute()
+        return self._factor
+
+    def __iter__(self):
+        r"""Yield ``(date, factor)`` for the current valuation date and each
+        following day, up to the last date of the convention."""
+        while True:
+            yield date.fromordinal(self._o), self._factor
+            if self._o >= self._last:
+                return
+            self.advance()
+
+    def _compute(self):
+        if self._schedule is not None:
+            # The period ended by the valuation date moves on one boundary at a time.
+            boundaries = self._schedule._boundaries
+            while self._k2 + 1 < len(boundaries) and boundaries[self._k2 + 1] < self._o:
+                self._k2 += 1
+            return self._rule(*(self._beg + (self._y, self._m, self._d, self._o) + self._extra + (
+                self._k2, boundaries, self._schedule._lengths, self._schedule._frequency)))
+        return self._rule(*(self._beg + (self._y, self._m, self._d, self._o) + self._extra))
+
+
+def accrual_curve(convention, date_beg, date_end, *args, notional=1., rate=1., valuation_calendar=None):
+    r"""Compute the daily accrual factors, or accrued interest, of a period
+    in one pass.
+
+    Parameters
+    ----------
+    convention : type or str
+        A day count convention class, or a name registered in
+        :py:mod:`daycountconventions.registry`.
+    date_beg : datetime.date
+        The beginning of the period.
+    date_end : datetime.date
+        The last valuation date, included.
+    *args
+        The further arguments of the ``year_fraction`` method of the
+        convention.
+    notional : float, optional
+        Keyword only. The notional of the accrued interest (The default is
+        1).
+    rate : float, optional
+        Keyword only. The rate of the accrued interest (The default is 1, so
+        that the curve holds the accrual factors).
+    valuation_calendar : daycountconventions.calendars.HolidayCalendar, optional
+        Keyword only. If given, only the business days of this calendar are
+        included in the curve.
+
+    Returns
+    -------
+    list of tuple
+        ``(date, notional * rate * factor)`` for each valuation date from
+        ``date_beg`` to ``date_end``.
+
+    """
+    stream = AccrualStream(convention, date_beg, *args)
+    last = date_end.toordinal()
+    curve = []
+    for _ in range(last - date_beg.toordinal() + 1):
+        day = stream.date
+        if valuation_calendar is None or valuation_calendar.is_business_day(day):
+            curve.append((day, notional * rate * stream.factor))
+        if stream._o < last:
+            stream.advance()
+    return curve
@@ -0,0 +1,105 @@
+"""This module provides an opt-in cache of accrual factors for workloads in
+which the same date pairs are evaluated many times.
+
+"""
+from collections import OrderedDict
+from threading import Lock
+
+from . import instrumentation, registry
+
+
+class AccrualCache(object):
+    r"""A bounded least-recently-used cache of accrual factors.
+
+    Entries are keyed on the convention, the ordinals of the dates and any
+    further argument of the convention, such as ``termination_date`` for
+    :py:class:`daycountconventions.conventions.DCC30E360ISDA` or
+    ``coupon_type`` for
+    :py:class:`daycountconventions.conventions.DCCACT365L`. Calendars and
+    schedules are keyed by identity. The cache can be shared between
+    threads.
+
+    Parameters
+    ----------
+    maxsize : int
+        The maximum number of entries, beyond which the least recently used
+        entry is evicted (The default is 65536).
+
+    """
+    def __init__(self, maxsize=65536):
+        if maxsize <= 0:
+            raise ValueError('The parameter "maxsize" must be positive')
+        self._maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @instrumentation.instrument('cached', convention_position=1)
+    def year_fraction(self, convention, date_beg, date_end, *args):
+        r"""Compute an accrual factor, or return it from the cache.
+
+        Parameters
+        ----------
+        convention : type or str
+            A day count convention class, or a name registered in
+            :py:mod:`daycountconventions.registry`.
+        date_beg : datetime.datetime
+            The beginning date considered when computing accrual factor.
+        date_end : datetime.datetime
+            The end date considered when computing accrual factor.
+        *args
+            The further arguments of the ``year_fraction`` method of the
+            convention.
+
+        Returns
+        -------
+        float
+
+        """
+        if isinstance(convention, str):
+            convention = registry.resolve(convention)
+        key = (convention, date_beg.toordinal(), date_end.toordinal()) + tuple(
+            arg.toordinal() if hasattr(arg, 'toordinal') else arg for arg in args)
+        with self._lock:
+            try:
+                factor = self._entries[key]
+            except KeyError:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._entries.move_to_end(key)
+                return factor
+        factor = convention.year_fraction(date_beg, date_end, *args)
+        with self._lock:
+            self._entries[key] = factor
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+        return factor
+
+    def info(self):
+        r"""Report the statistics of the cache.
+
+        Returns
+        -------
+        dict
+            The numbers of ``hits``, ``misses`` and ``evictions`` since the
+            last :py:meth:`clear`, the current ``size`` and the ``maxsize``.
+
+        """
+        with self._lock:
+            return {'hits': self._hits, 'misses': self._misses, 'evictions': self._evictions,
+                    'size': len(self._entries), 'maxsize': self._maxsize}
+
+    def clear(self):
+        r"""Remove all entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
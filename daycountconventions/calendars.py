@@ -0,0 +1,161 @@
+"""This module provides holiday calendars for the business day conventions.
+
+"""
+from array import array
+from datetime import date, datetime
+
+
+class HolidayCalendar(object):
+    r"""A holiday calendar over a fixed range of dates.
+
+    On construction, the calendar counts the business days once for every
+    date of its range, so that the number of business days between any two
+    dates of the range is a subtraction of two precomputed counts.
+
+    Parameters
+    ----------
+    holidays : iterable of datetime.date
+        The holidays of the calendar. Holidays outside the range are
+        ignored.
+    start : datetime.date, optional
+        The first date covered by the calendar (The default is 1 January of
+        the year of the earliest holiday).
+    end : datetime.date, optional
+        The last date covered by the calendar (The default is 31 December of
+        the year of the latest holiday).
+    weekend : tuple of int
+        The days of the week which are not business days, with Monday as 0
+        and Sunday as 6 (The default is (5, 6), i.e. Saturday and Sunday).
+
+    Raises
+    ------
+    ValueError
+        If the range is empty.
+
+    """
+    def __init__(self, holidays, start=None, end=None, weekend=(5, 6)):
+        holidays = set(holiday.toordinal() for holiday in holidays)
+        if start is None or end is None:
+            if not holidays:
+                raise ValueError('The parameters "start" and "end" are required for a calendar without holidays')
+            if start is None:
+                start = date(date.fromordinal(min(holidays)).year, 1, 1)
+            if end is None:
+                end = date(date.fromordinal(max(holidays)).year, 12, 31)
+        first, last = start.toordinal(), end.toordinal()
+        if last < first:
+            raise ValueError('The end of the calendar precedes its start')
+        self._first = first
+        self._last = last
+        self._weekend = tuple(weekend)
+        self._holidays = frozenset(ordinal for ordinal in holidays if first <= ordinal <= last)
+        # _counts[i] is the number of business days in [first, first + i).
+        self._counts = array('q', [0])
+        count = 0
+        for ordinal in range(first, last + 1):
+            if (ordinal + 6) % 7 not in self._weekend and ordinal not in self._holidays:
+                count += 1
+            self._counts.append(count)
+
+    @classmethod
+    def from_file(cls, path, start=None, end=None, weekend=(5, 6)):
+        r"""Load a holiday calendar from a text file.
+
+        The file contains one holiday per line in the format ``YYYY-MM-DD``.
+        Blank lines and everything following a ``#`` are ignored.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file.
+        start, end, weekend
+            See :py:class:`HolidayCalendar`.
+
+        Returns
+        -------
+        HolidayCalendar
+
+        Raises
+        ------
+        ValueError
+            If a line is not a valid date.
+
+        """
+        holidays = []
+        with open(path) as holiday_file:
+            for line_number, line in enumerate(holiday_file, 1):
+                line = line.split('#', 1)[0].strip()
+                if not line:
+                    continue
+                try:
+                    holidays.append(datetime.strptime(line, '%Y-%m-%d').date())
+                except ValueError:
+                    raise ValueError('Invalid date "{}" on line {} of {}'.format(line, line_number, path))
+        return cls(holidays, start=start, end=end, weekend=weekend)
+
+    @property
+    def start(self):
+        r"""datetime.date: The first date covered by the calendar."""
+        return date.fromordinal(self._first)
+
+    @property
+    def end(self):
+        r"""datetime.date: The last date covered by the calendar."""
+        return date.fromordinal(self._last)
+
+    @property
+    def holidays(self):
+        r"""list of datetime.date: The holidays within the calendar range."""
+        return [date.fromordinal(ordinal) for ordinal in sorted(self._holidays)]
+
+    def is_business_day(self, day):
+        r"""Whether a date is a business day.
+
+        Parameters
+        ----------
+        day : datetime.date
+            A date within the calendar range.
+
+        Returns
+        -------
+        bool
+
+        """
+        index = self._index(day.toordinal())
+        return self._counts[index + 1] > self._counts[index]
+
+    def business_days(self, date_1, date_2):
+        r"""The number of business days from ``date_1`` (included) to
+        ``date_2`` (excluded).
+
+        Parameters
+        ----------
+        date_1 : datetime.date
+            A date within the calendar range.
+        date_2 : datetime.date
+            A date within the calendar range.
+
+        Returns
+        -------
+        int
+            The number of business days, negative if ``date_2`` precedes
+            ``date_1``.
+
+        Raises
+        ------
+        ValueError
+            If a date is outside the calendar range.
+
+        """
+        return self._counts[self._index(date_2.toordinal())] - self._counts[self._index(date_1.toordinal())]
+
+    def _index(self, ordinal):
+        self._check_range(ordinal, ordinal)
+        return ordinal - self._first
+
+    def _check_range(self, lowest, highest):
+        # Raise if any ordinal in [lowest, highest] is outside the calendar.
+        if lowest < self._first or highest > self._last:
+            outside = lowest if lowest < self._first else highest
+            raise ValueError('The date {} is outside the calendar range {} to {}'.format(
+                date.fromordinal(outside), self.start, self.end))
@@ -0,0 +1,104 @@
+"""This module provides the computation of the coupon amounts and accrued
+interest of many coupon periods at once, using NumPy.
+
+The coupon amount of a period is ``notional * (rate + spread) * factor``,
+with the accrual factor of the whole period, and its accrued interest at a
+valuation date is the same product with the accrual factor from the start of
+the period to the valuation date, for the periods running at that date::
+
+    from daycountconventions.cashflows import coupon_cashflows
+
+    flows = coupon_cashflows('ACT/360', starts, ends, notionals, fixings, valuation_date, spread=0.0025)
+    flows.amount.sum(), flows.accrued_interest.sum()
+
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from . import conventions, registry
+from .batch import _decompose, _rule_factors
+
+Cashflows = namedtuple('Cashflows', ['accrual_factor', 'amount', 'accrued_interest'])
+Cashflows.__doc__ = r"""The float64 arrays of the accrual factors, coupon amounts and accrued
+interest of coupon periods."""
+
+
+def coupon_cashflows(convention, starts, ends, notionals, rates, valuation_date, spread=0., termination_date=None,
+                     coupon_type='semi-annual', calendar=None, schedule=None):
+    r"""Compute the coupon amounts and accrued interest of coupon periods.
+
+    The beginning dates are decomposed once for both the accrual factors of
+    the periods and those up to the valuation date, and no convention
+    instance is created.
+
+    Parameters
+    ----------
+    convention : type or str
+        A day count convention class, or a name registered in
+        :py:mod:`daycountconventions.registry`.
+    starts, ends : array_like
+        The beginning and end dates of the periods, convertible to
+        ``datetime64[D]``.
+    notionals : array_like
+        The notional of each period, or of all of them.
+    rates : array_like
+        The fixed rate, or the rate fixed for each period of a floating leg.
+    valuation_date : array_like
+        The date the interest is accrued to, for all periods or for each
+        of them.
+    spread : array_like
+        The spread added to the rates (The default is 0).
+    termination_date : array_like, optional
+        The termination date(s), required by
+        :py:class:`daycountconventions.conventions.DCC30E360ISDA`.
+    coupon_type : {'semi-annual', 'annual'}
+        The coupon type used by
+        :py:class:`daycountconventions.conventions.DCCACT365L`, whose coupon
+        end dates are the end dates of the periods (The default is
+        'semi-annual').
+    calendar : daycountconventions.calendars.HolidayCalendar, optional
+        The holiday calendar, required by
+        :py:class:`daycountconventions.conventions.DCCBusiness252`.
+    schedule : daycountconventions.schedule.CouponSchedule, optional
+        The coupon schedule, required by
+        :py:class:`daycountconventions.conventions.DCCACTACTICMA`.
+
+    Returns
+    -------
+    Cashflows
+        The accrual factors and coupon amounts of the periods, and their
+        interest accrued at the valuation date: zero for the periods which
+        start after it or end on or before it, with the broadcast shape of
+        the inputs.
+
+    Raises
+    ------
+    ValueError
+        If the convention is not supported, an argument required by the
+        convention is missing, or a date is outside the range of the
+        calendar or schedule.
+
+    """
+    if isinstance(convention, str):
+        convention = registry.resolve(convention)
+    if not isinstance(convention, type) or getattr(convention, '_rule', None) is None:
+        raise ValueError('Unsupported day count convention: {!r}'.format(convention))
+    starts = np.asarray(starts, dtype='datetime64[D]')
+    ends = np.asarray(ends, dtype='datetime64[D]')
+    valuation_date = np.asarray(valuation_date, dtype='datetime64[D]')
+    starts, ends, valuation_date = np.broadcast_arrays(starts, ends, valuation_date)
+    running = (starts <= valuation_date) & (valuation_date < ends)
+    beg = _decompose(starts)
+    options = {'termination_date': termination_date, 'coupon_end': None, 'coupon_type': coupon_type,
+               'calendar': calendar, 'schedule': schedule}
+    if convention is conventions.DCCACT365L:
+        options['coupon_end'] = ends
+    factors = _rule_factors(convention, beg + _decompose(ends), **options)
+    # The periods not running are accrued over no day, keeping the dates in
+    # the range of a calendar or schedule, and zeroed below.
+    accrued = _rule_factors(convention, beg + _decompose(np.where(running, valuation_date, starts)), **options)
+    interest = np.asarray(notionals, dtype=np.float64) * (np.asarray(rates, dtype=np.float64) + spread)
+    amounts = interest * factors
+    return Cashflows(np.broadcast_to(factors, amounts.shape).copy(), amounts,
+                     np.where(running, interest * accrued, 0.))
@@ -0,0 +1,168 @@
+"""This module provides the computation of accrual factors between columnar
+files, without converting any date to a Python object.
+
+Date columns are read from NumPy ``.npy`` files, memory-mapped, or from the
+``date32`` columns of Arrow IPC (Feather version 2) files, memory-mapped and
+viewed as ``int32`` days since 1970-01-01, which
+:py:func:`daycountconventions.batch.accrual_factors` accepts as is. The
+accrual factors are computed one chunk at a time and written into a
+memory-mapped float64 ``.npy`` file, or appended to an Arrow IPC file, so
+the memory use depends on the chunk size only.
+
+"""
+import numpy as np
+
+from . import registry
+from .batch import accrual_factors
+
+ARROW_EXTENSIONS = ('.arrow', '.feather', '.ipc')
+FACTOR_COLUMN = 'accrual_factor'
+
+_DATE_ARGUMENTS = ('termination_date', 'coupon_end')
+
+
+def read_dates(path, column=None):
+    r"""Read a column of dates without copying it.
+
+    Parameters
+    ----------
+    path : str
+        A ``.npy`` file of ``datetime64[D]`` dates or of integer days since
+        1970-01-01, or an Arrow IPC file (``.arrow``, ``.feather`` or
+        ``.ipc``).
+    column : str, optional
+        The ``date32`` column of an Arrow file, which can be omitted if the
+        file has a single column.
+
+    Returns
+    -------
+    numpy.ndarray
+        A read-only array backed by the memory-mapped file: ``datetime64[D]``
+        or integers for ``.npy`` files, and ``int32`` days since 1970-01-01
+        for Arrow files. An Arrow column written in several record batches,
+        or compressed, is copied into a single array.
+
+    Raises
+    ------
+    ValueError
+        If the column is missing, is not a date column, or has null values.
+
+    """
+    if _is_arrow(path):
+        return _read_arrow_dates(path, column)
+    dates = np.load(path, mmap_mode='r')
+    if dates.dtype != np.dtype('datetime64[D]') and dates.dtype.kind not in 'iu':
+        raise ValueError('The array of {} holds {} values instead of dates'.format(path, dates.dtype))
+    return dates
+
+
+def write_accrual_factors(convention, starts, ends, output_path, chunk_size=1000000, **kwargs):
+    r"""Compute the accrual factors of date columns into a file.
+
+    Parameters
+    ----------
+    convention : type or str
+        A day count convention class, or a name registered in
+        :py:mod:`daycountconventions.registry`.
+    starts, ends : array_like or str
+        The beginning and end dates, as arrays, e.g. returned by
+        :py:func:`read_dates`, or as paths of ``.npy`` files.
+    output_path : str
+        A ``.npy`` file, created as a memory-mapped float64 array, or an
+        Arrow IPC file with a single ``accrual_factor`` column.
+    chunk_size : int
+        The number of date pairs computed at once (The default is 1000000).
+    **kwargs
+        The further arguments of
+        :py:func:`daycountconventions.batch.accrual_factors`, such as
+        ``termination_date`` or ``calendar``. Date arguments may be arrays
+        with one date per pair.
+
+    Returns
+    -------
+    numpy.memmap or int
+        The memory-mapped accrual factors of a ``.npy`` output, or the number
+        of rows of an Arrow output.
+
+    Raises
+    ------
+    ValueError
+        If the date columns have different lengths, or as
+        :py:func:`daycountconventions.batch.accrual_factors`.
+
+    """
+    if chunk_size <= 0:
+        raise ValueError('The parameter "chunk_size" must be positive')
+    if isinstance(convention, str):
+        convention = registry.resolve(convention)
+    starts = read_dates(starts) if isinstance(starts, str) else np.asarray(starts)
+    ends = read_dates(ends) if isinstance(ends, str) else np.asarray(ends)
+    if starts.ndim != 1 or starts.shape != ends.shape:
+        raise ValueError('The beginning and end dates must be columns of the same length')
+    columns = {}
+    for name in _DATE_ARGUMENTS:
+        value = kwargs.get(name)
+        if value is not None and np.ndim(value) > 0:
+            columns[name] = np.asarray(value)
+            if columns[name].shape != starts.shape:
+                raise ValueError('The parameter "{}" must have one date per pair'.format(name))
+
+    def chunks():
+        for beg in range(0, len(starts), chunk_size):
+            end = min(beg + chunk_size, len(starts))
+            options = dict(kwargs)
+            options.update((name, column[beg:end]) for name, column in columns.items())
+            yield beg, end, accrual_factors(convention, starts[beg:end], ends[beg:end], **options)
+
+    if _is_arrow(output_path):
+        return _write_arrow_factors(output_path, chunks())
+    factors = np.lib.format.open_memmap(output_path, mode='w+', dtype=np.float64, shape=starts.shape)
+    for beg, end, chunk in chunks():
+        factors[beg:end] = chunk
+    factors.flush()
+    return factors
+
+
+def _is_arrow(path):
+    return str(path).lower().endswith(ARROW_EXTENSIONS)
+
+
+def _read_arrow_dates(path, column):
+    import pyarrow as pa
+
+    table = pa.ipc.open_file(pa.memory_map(str(path))).read_all()
+    if column is None:
+        if table.num_columns != 1:
+            raise ValueError('The column of dates of {} must be given among {}'.format(
+                path, ', '.join(table.column_names)))
+        column = table.column_names[0]
+    if column not in table.column_names:
+        raise ValueError('The column "{}" is missing from {}'.format(column, path))
+    dates = table.column(column)
+    if dates.type != pa.date32():
+        raise ValueError('The column "{}" of {} holds {} values instead of date32'.format(column, path, dates.type))
+    if dates.null_count:
+        raise ValueError('The column "{}" of {} has null dates'.format(column, path))
+    arrays = [_date32_view(chunk) for chunk in dates.chunks]
+    if len(arrays) == 1:
+        return arrays[0]
+    return np.concatenate(arrays) if arrays else np.empty(0, dtype=np.int32)
+
+
+def _date32_view(array):
+    # The data buffer of a date32 array holds int32 days since 1970-01-01.
+    days = np.frombuffer(array.buffers()[1], dtype=np.int32, count=array.offset + len(array))[array.offset:]
+    days.flags.writeable = False
+    return days
+
+
+def _write_arrow_factors(path, chunks):
+    import pyarrow as pa
+
+    schema = pa.schema([(FACTOR_COLUMN, pa.float64())])
+    rows = 0
+    with pa.OSFile(str(path), 'wb') as sink, pa.ipc.new_file(sink, schema) as writer:
+        for beg, end, factors in chunks:
+            writer.write_batch(pa.record_batch([pa.array(factors)], schema=schema))
+            rows = end
+    return rows
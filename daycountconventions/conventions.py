@@ -1,6 +1,5 @@
-from abc import DayCountConvention
-from calendar import monthrange, isleap
-from datetime import timedelta, datetime
+from . import _engine, _scalar
+from .abc import DayCountConvention, _setattr
 
 
 class DCC30360(DayCountConvention):
@@ -14,6 +13,10 @@ class DCC30360(DayCountConvention):
     superclass of this class.
 
     """
+    _rule = staticmethod(_engine.thirty_360)
+    _scalar_rule = staticmethod(_scalar.thirty_360)
+    __slots__ = ()
+
     @property
     def convention_name(self):
         r"""str: A property for the name of the convention.
@@ -40,13 +43,7 @@ class DCC30360(DayCountConvention):
           :math:`D_2` to 30.
 
         """
-        self._adjust_dates()
-        return (360. * (self._Y2 - self._Y1) + 30. * (self._M2 - self._M1) + self._D2 - self._D1)/360.
-
-    def _adjust_dates(self):
-        new_D1 = 30 if self._D1 == 31 else self._D1
-        new_D2 = 30 if self._D2 == 31 and (self._D1 == 30 or self._D1 == 31) else self._D2
-        self._D1, self._D2 = new_D1, new_D2
+        return _scalar.thirty_360(self._date_1, self._date_2)
 
 
 class DCC30E360(DayCountConvention):
@@ -56,6 +53,10 @@ class DCC30E360(DayCountConvention):
     Also known as *Eurobond basis*.
 
     """
+    _rule = staticmethod(_engine.thirty_e_360)
+    _scalar_rule = staticmethod(_scalar.thirty_e_360)
+    __slots__ = ()
+
     @property
     def convention_name(self):
         r"""str: A property for the name of the convention.
@@ -81,13 +82,7 @@ class DCC30E360(DayCountConvention):
         * If :math:`D_2` is 31, then change :math:`D_2` to 30.
 
         """
-        self._adjust_dates()
-        return (360. * (self._Y2 - self._Y1) + 30. * (self._M2 - self._M1) + self._D2 - self._D1)/360.
-
-    def _adjust_dates(self):
-        new_D1 = 30 if self._D1 == 31 else self._D1
-        new_D2 = 30 if self._D2 == 31 else self._D2
-        self._D1, self._D2 = new_D1, new_D2
+        return _scalar.thirty_e_360(self._date_1, self._date_2)
 
 
 class DCC30E360ISDA(DayCountConvention):
@@ -104,9 +99,13 @@ class DCC30E360ISDA(DayCountConvention):
         The termination date considered when computing accrual factor.
 
     """
+    _rule = staticmethod(_engine.thirty_e_360_isda)
+    __slots__ = ('_termination_date',)
+
     def __init__(self, date_beg, date_end, termination_date):
-        super(DCC30E360ISDA, self).__init__(date_beg, date_end)
-        self._termination_date = termination_date
+        _setattr(self, '_date_1', date_beg)
+        _setattr(self, '_date_2', date_end)
+        _setattr(self, '_termination_date', termination_date)
 
     @property
     def convention_name(self):
@@ -117,6 +116,29 @@ class DCC30E360ISDA(DayCountConvention):
         """
         return "30E/360 ISDA"
 
+    @classmethod
+    def year_fraction(cls, date_beg, date_end, termination_date):
+        r"""Compute the accrual factor between two dates without creating an
+        instance of the convention.
+
+        Parameters
+        ----------
+        date_beg : datetime.datetime
+            The beginning date considered when computing accrual factor.
+        date_end : datetime.datetime
+            The end date considered when computing accrual factor.
+        termination_date : datetime.datetime
+            The termination date considered when computing accrual factor.
+
+        Returns
+        -------
+        float
+            The same value as the ``accrual_factor`` property of
+            ``cls(date_beg, date_end, termination_date)``.
+
+        """
+        return _scalar.thirty_e_360_isda(date_beg, date_end, termination_date)
+
     @property
     def accrual_factor(self):
         r"""float: A property which gives the accrual factor.
@@ -134,14 +156,7 @@ class DCC30E360ISDA(DayCountConvention):
           date, or `D_2` is 31, then change :math:`D_2` to 30.
 
         """
-        self._adjust_dates()
-        return (360. * (self._Y2 - self._Y1) + 30. * (self._M2 - self._M1) + self._D2 - self._D1)/360.
-
-    def _adjust_dates(self):
-        new_D1 = 30 if self._D1 == monthrange(self._Y1, self._M1)[1] else self._D1
-        new_D2 = 30 if self._D2 == 31 or (self._M2 == 2 and self._D2 == monthrange(self._Y2, self._M2)[1]
-                                          and not self._date_equal(self._date_2, self._termination_date)) else self._D2
-        self._D1, self._D2 = new_D1, new_D2
+        return _scalar.thirty_e_360_isda(self._date_1, self._date_2, self._termination_date)
 
 
 class DCC30EP360ISDA(DayCountConvention):
@@ -151,6 +166,10 @@ class DCC30EP360ISDA(DayCountConvention):
     Also known as *30E+/360*.
 
     """
+    _rule = staticmethod(_engine.thirty_e_plus_360_isda)
+    _scalar_rule = staticmethod(_scalar.thirty_e_plus_360_isda)
+    __slots__ = ()
+
     @property
     def convention_name(self):
         r"""str: A property for the name of the convention.
@@ -177,16 +196,7 @@ class DCC30EP360ISDA(DayCountConvention):
           :math:`M_2` to :math:`M_2+1`.
 
         """
-        self._adjust_dates()
-        return (360. * (self._Y2 - self._Y1) + 30. * (self._M2 - self._M1) + self._D2 - self._D1)/360.
-
-    def _adjust_dates(self):
-        new_D1 = 30 if self._D1 == 31 else self._D1
-        if self._D2 == 31:
-            new_date_2 = self._date_2 + timedelta(days=1)
-            new_D2, new_M2, new_Y2 = new_date_2.day, new_date_2.month, new_date_2.year
-            self._D2, self._M2, self.Y2, self._date_2 = new_D2, new_M2, new_Y2, new_date_2
-        self._D1 = new_D1
+        return _scalar.thirty_e_plus_360_isda(self._date_1, self._date_2)
 
 
 class DCCACT360(DayCountConvention):
@@ -196,6 +206,10 @@ class DCCACT360(DayCountConvention):
     Also known as *Money Market basis*, *Actual 360*, *French*.
 
     """
+    _rule = staticmethod(_engine.act_360)
+    _scalar_rule = staticmethod(_scalar.act_360)
+    __slots__ = ()
+
     @property
     def convention_name(self):
         r"""str: A property for the name of the convention.
@@ -219,7 +233,7 @@ class DCCACT360(DayCountConvention):
         date considered respectively.
 
         """
-        return (self._date_2 - self._date_1).days/360.
+        return _scalar.act_360(self._date_1, self._date_2)
 
 
 class DCCACT365Fixed(DayCountConvention):
@@ -229,6 +243,10 @@ class DCCACT365Fixed(DayCountConvention):
     Also known as *English Money Market basis*.
 
     """
+    _rule = staticmethod(_engine.act_365_fixed)
+    _scalar_rule = staticmethod(_scalar.act_365_fixed)
+    __slots__ = ()
+
     @property
     def convention_name(self):
         r"""str: A property for the name of the convention.
@@ -252,10 +270,10 @@ class DCCACT365Fixed(DayCountConvention):
         date considered respectively.
 
         """
-        return (self._date_2 - self._date_1).days/365.
+        return _scalar.act_365_fixed(self._date_1, self._date_2)
 
 
-class DCCACT365L():
+class DCCACT365L(DayCountConvention):
     r"""*ACT/365 L* Day Count Convention. As defined in ICMA Rule 251.1(i).
 
     Also known as *ACT/365 Leap Year*. This day count convention was originally
@@ -274,11 +292,22 @@ class DCCACT365L():
         The coupon type considered (The default is 'semi-annual').
 
     """
+    _rule = staticmethod(_engine.act_365_l)
+    __slots__ = ('_date_3', '_coupon_type')
+
     def __init__(self, date_1, date_2, date_3, coupon_type='semi-annual'):
-        self._date_1 = date_1
-        self._date_2 = date_2
-        self._date_3 = date_3
-        self.coupon_type = coupon_type
+        _setattr(self, '_date_1', date_1)
+        _setattr(self, '_date_2', date_2)
+        _setattr(self, '_date_3', date_3)
+        _setattr(self, '_coupon_type', coupon_type)
+
+    @property
+    def coupon_type(self):
+        r"""str: The coupon type considered, either ``semi-annual`` or
+        ``annual``.
+
+        """
+        return self._coupon_type
 
     @property
     def convention_name(self):
@@ -289,6 +318,36 @@ class DCCACT365L():
         """
         return "ACT/365 L"
 
+    @classmethod
+    def year_fraction(cls, date_1, date_2, date_3, coupon_type='semi-annual'):
+        r"""Compute the accrual factor of a coupon without creating an
+        instance of the convention.
+
+        Parameters
+        ----------
+        date_1 : datetime.datetime
+            The coupon start date.
+        date_2 : datetime.datetime
+            The accrual factor date.
+        date_3 : datetime.datetime
+            The coupon end date.
+        coupon_type : {'semi-annual', 'annual'}
+            The coupon type considered (The default is 'semi-annual').
+
+        Returns
+        -------
+        float
+            The same value as the ``accrual_factor`` property of
+            ``cls(date_1, date_2, date_3, coupon_type)``.
+
+        Raises
+        ------
+        ValueError
+            If ``coupon_type`` is neither 'semi-annual' nor 'annual'.
+
+        """
+        return _scalar.act_365_l(date_1, date_2, date_3, coupon_type)
+
     @property
     def accrual_factor(self):
         r"""float: A property which gives the accrual factor.
@@ -317,18 +376,7 @@ class DCCACT365L():
            \end{cases}
 
         """
-        if self.coupon_type == 'semi-annual':
-            return (self._date_2 - self._date_1).days/(365. + 1*isleap(self._date_3.year))
-        elif self.coupon_type == 'annual':
-            if isleap(self._date_1.year) and self._date_1 < datetime(self._date_1.year, 2, 29) <= self._date_3:
-                denominator = 366.
-            elif isleap(self._date_3.year) and self._date_1 < datetime(self._date_3.year, 2, 29) <= self._date_3:
-                denominator = 366.
-            else:
-                denominator = 365.
-            return (self._date_2 - self._date_1).days/denominator
-        else:
-            raise ValueError('The parameter "coupon_type" can only be either "semi-annual" or "annual"')
+        return _scalar.act_365_l(self._date_1, self._date_2, self._date_3, self._coupon_type)
 
 
 class DCCACT365A(DayCountConvention):
@@ -337,6 +385,10 @@ class DCCACT365A(DayCountConvention):
     Also known as *ACT/365 Actual*.
 
     """
+    _rule = staticmethod(_engine.act_365_a)
+    _scalar_rule = staticmethod(_scalar.act_365_a)
+    __slots__ = ()
+
     @property
     def convention_name(self):
         r"""str: A property for the name of the convention.
@@ -365,13 +417,7 @@ class DCCACT365A(DayCountConvention):
            \end{cases}
 
         """
-        if isleap(self._date_1.year) and self._date_1 < datetime(self._date_1.year, 2, 29) <= self._date_2:
-            denominator = 366.
-        elif isleap(self._date_2.year) and self._date_1 < datetime(self._date_2.year, 2, 29) <= self._date_2:
-            denominator = 366.
-        else:
-            denominator = 365.
-        return (self._date_2 - self._date_1).days / denominator
+        return _scalar.act_365_a(self._date_1, self._date_2)
 
 
 class DCCNL365(DayCountConvention):
@@ -380,6 +426,10 @@ class DCCNL365(DayCountConvention):
     Also known as *ACT/365 No Leap Year*.
 
     """
+    _rule = staticmethod(_engine.nl_365)
+    _scalar_rule = staticmethod(_scalar.nl_365)
+    __slots__ = ()
+
     @property
     def convention_name(self):
         r"""str: A property for the name of the convention.
@@ -408,13 +458,7 @@ class DCCNL365(DayCountConvention):
            \end{cases}
 
         """
-        if isleap(self._date_1.year) and self._date_1 < datetime(self._date_1.year, 2, 29) <= self._date_2:
-            numerator = (self._date_2 - self._date_1).days - 1
-        elif isleap(self._date_2.year) and self._date_1 < datetime(self._date_2.year, 2, 29) <= self._date_2:
-            numerator = (self._date_2 - self._date_1).days - 1
-        else:
-            numerator = (self._date_2 - self._date_1).days
-        return numerator / 365.
+        return _scalar.nl_365(self._date_1, self._date_2)
 
 
 class DCCACTACTISDA(DayCountConvention):
@@ -422,6 +466,10 @@ class DCCACTACTISDA(DayCountConvention):
     4.16(b) in 2016 ISDA Definitions.
 
     """
+    _rule = staticmethod(_engine.act_act_isda)
+    _scalar_rule = staticmethod(_scalar.act_act_isda)
+    __slots__ = ()
+
     @property
     def convention_name(self):
         r"""str: A property for the name of the convention.
@@ -453,38 +501,175 @@ class DCCACTACTISDA(DayCountConvention):
         * For :math:`d_1=30-Dec-2011` and :math:`d_2=2-Jan-2012`,
           :math:`DaysInNonLeapYears=2` and :math:`DaysInLeapYears=1`.
 
+        The whole years between the two dates are counted in closed form,
+        so the cost of the computation does not depend on the tenor.
+
+        """
+        return _scalar.act_act_isda(self._date_1, self._date_2)
+
+
+class DCCBusiness252(DayCountConvention):
+    r"""*BUS/252* Day Count Convention.
+
+    Also known as *Business/252*. This day count convention is mostly used
+    for Brazilian instruments.
+
+    Parameters
+    ----------
+    date_beg : datetime.datetime
+        The beginning date considered when computing accrual factor.
+    date_end : datetime.datetime
+        The end date considered when computing accrual factor.
+    calendar : daycountconventions.calendars.HolidayCalendar
+        The holiday calendar defining the business days. Both dates must be
+        within its range.
+
+    """
+    _rule = staticmethod(_engine.business_252)
+    __slots__ = ('_calendar',)
+
+    def __init__(self, date_beg, date_end, calendar):
+        _setattr(self, '_date_1', date_beg)
+        _setattr(self, '_date_2', date_end)
+        _setattr(self, '_calendar', calendar)
+
+    @property
+    def convention_name(self):
+        r"""str: A property for the name of the convention.
+
+        This property has a constant value ``BUS/252``.
+
+        """
+        return "BUS/252"
+
+    @classmethod
+    def year_fraction(cls, date_beg, date_end, calendar):
+        r"""Compute the accrual factor between two dates without creating an
+        instance of the convention.
+
+        Parameters
+        ----------
+        date_beg : datetime.datetime
+            The beginning date considered when computing accrual factor.
+        date_end : datetime.datetime
+            The end date considered when computing accrual factor.
+        calendar : daycountconventions.calendars.HolidayCalendar
+            The holiday calendar defining the business days.
+
+        Returns
+        -------
+        float
+            The same value as the ``accrual_factor`` property of
+            ``cls(date_beg, date_end, calendar)``.
+
+        Raises
+        ------
+        ValueError
+            If a date is outside the range of the calendar.
+
+        """
+        return _scalar.business_252(date_beg, date_end, calendar)
+
+    @property
+    def accrual_factor(self):
+        r"""float: A property which gives the accrual factor.
+
+        Notes
+        -----
+        The accrual factor follows:
+
+        .. math:: \frac{BusinessDays}{252}
+
+        where :math:`BusinessDays` is the number of business days of the
+        calendar between :math:`d_1` and :math:`d_2`, with :math:`d_1`
+        included and :math:`d_2` excluded.
+
+        The calendar precomputes the cumulative number of business days over
+        its range, so the cost of the computation does not depend on the
+        length of the period.
+
+        """
+        return _scalar.business_252(self._date_1, self._date_2, self._calendar)
+
+
+class DCCACTACTICMA(DayCountConvention):
+    r"""*ACT/ACT ICMA* Day Count Convention. As defined in ICMA Rule 251.1(iii).
+
+    Also known as *ACT/ACT ISMA*. Unlike the other conventions, the accrual
+    factor depends on the coupon periods of the instrument, which are given
+    by a coupon schedule.
+
+    Parameters
+    ----------
+    date_beg : datetime.datetime
+        The beginning date considered when computing accrual factor.
+    date_end : datetime.datetime
+        The end date considered when computing accrual factor.
+    schedule : daycountconventions.schedule.CouponSchedule
+        The coupon schedule defining the reference periods and the coupon
+        frequency. Both dates must be within the schedule.
+
+    """
+    _rule = staticmethod(_engine.act_act_icma)
+    __slots__ = ('_schedule',)
+
+    def __init__(self, date_beg, date_end, schedule):
+        _setattr(self, '_date_1', date_beg)
+        _setattr(self, '_date_2', date_end)
+        _setattr(self, '_schedule', schedule)
+
+    @property
+    def convention_name(self):
+        r"""str: A property for the name of the convention.
+
+        This property has a constant value ``ACT/ACT ICMA``.
+
+        """
+        return "ACT/ACT ICMA"
+
+    @classmethod
+    def year_fraction(cls, date_beg, date_end, schedule):
+        r"""Compute the accrual factor between two dates without creating an
+        instance of the convention.
+
+        Parameters
+        ----------
+        date_beg : datetime.datetime
+            The beginning date considered when computing accrual factor.
+        date_end : datetime.datetime
+            The end date considered when computing accrual factor.
+        schedule : daycountconventions.schedule.CouponSchedule
+            The coupon schedule defining the reference periods.
+
+        Returns
+        -------
+        float
+            The same value as the ``accrual_factor`` property of
+            ``cls(date_beg, date_end, schedule)``.
+
+        Raises
+        ------
+        ValueError
+            If a date is outside the schedule, or ``date_end`` precedes
+            ``date_beg``.
+
+        """
+        return _scalar.act_act_icma(date_beg, date_end, schedule)
+
+    @property
+    def accrual_factor(self):
+        r"""float: A property which gives the accrual factor.
+
+        Notes
+        -----
+        When :math:`d_1` and :math:`d_2` are within the same reference
+        period :math:`[r_1, r_2)`, the accrual factor follows:
+
+        .. math:: \frac{d_2-d_1}{F(r_2-r_1)}
+
+        where :math:`F` is the coupon frequency. When the dates span several
+        reference periods, the accrual factor is the sum of this formula
+        over the part of each period between :math:`d_1` and :math:`d_2`.
+
         """
-        leapyear_days = 0
-        nonleapyear_days = 0
-
-        if self._date_1.year < self._date_2.year:
-            if isleap(self._date_1.year):
-                leapyear_days += (datetime(self._date_1.year, 12, 31) - self._date_1).days + 1
-            else:
-                nonleapyear_days += (datetime(self._date_1.year, 12, 31) - self._date_1).days + 1
-            for year in range(self._date_1.year+1, self._date_2.year):
-                if isleap(year):
-                    leapyear_days += 366
-                else:
-                    nonleapyear_days += 365
-            if isleap(self._date_2.year):
-                leapyear_days += (self._date_2 - datetime(self._date_2.year, 1, 1)).days
-            else:
-                nonleapyear_days += (self._date_2 - datetime(self._date_2.year, 1, 1)).days
-        else:
-            if isleap(self._date_1.year):
-                leapyear_days += (self._date_2 - self._date_1).days
-            else:
-                nonleapyear_days += (self._date_2 - self._date_1).days
-
-        return leapyear_days / 366. + nonleapyear_days / 365.
-
-
-# class DCCACTACTICMA():
-#     def __init__(self):
-#         raise NotImplementedError
-#
-#
-# class DCCBusiness252():
-#     def __init__(self):
-#         raise NotImplementedError
+        return _scalar.act_act_icma(self._date_1, self._date_2, self._schedule)
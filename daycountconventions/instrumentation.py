@@ -0,0 +1,233 @@
+"""This module provides opt-in instrumentation of the computation of accrual
+factors.
+
+When enabled, every computation is recorded per convention and per path:
+
+* ``scalar``: the ``accrual_factor`` property and the ``year_fraction``
+  class method of a registered convention;
+* ``batch``: the array functions, which compute their accrual factors with
+  :py:func:`daycountconventions.batch.accrual_factors` or on decomposed
+  dates through the same instrumented helper; the shards computed by the
+  worker processes of
+  :py:func:`daycountconventions.parallel.parallel_accrual_factors` are
+  recorded as one call of the calling process;
+* ``cached``: :py:meth:`daycountconventions.cache.AccrualCache.year_fraction`,
+  whose misses are also recorded as ``scalar``.
+
+For each of them the number of calls, the number of accrual factors, the
+cumulative time and a histogram of the batch sizes by power of ten are
+kept. The scalar path is instrumented by replacing the ``accrual_factor``
+properties and ``year_fraction`` methods while enabled, and the other paths
+check a module flag, so the cost is close to nothing when disabled::
+
+    from daycountconventions import instrumentation
+
+    with instrumentation.instrumented():
+        run_report()
+    print(instrumentation.to_json())
+
+"""
+import inspect
+import json
+from contextlib import contextmanager
+from functools import wraps
+from threading import Lock
+from time import perf_counter
+
+PATHS = ('scalar', 'batch', 'cached')
+
+_enabled = False
+_lock = Lock()
+_statistics = {}
+# The accrual_factor and year_fraction attributes replaced by enable, restored
+# by disable.
+_originals = {}
+
+
+def enable():
+    r"""Start recording the computations of accrual factors.
+
+    The conventions registered later are instrumented on their batch and
+    cached paths only, until the next call to :py:func:`enable`.
+
+    """
+    global _enabled
+    from . import registry
+
+    with _lock:
+        for convention in list(registry._CANONICAL_NAMES):
+            if convention not in _originals:
+                _originals[convention] = (convention.__dict__.get('accrual_factor'),
+                                          convention.__dict__.get('year_fraction'))
+                convention.accrual_factor = property(_instrument_property(convention.accrual_factor.fget))
+                convention.year_fraction = classmethod(_instrument_scalar(convention.year_fraction.__func__))
+        _enabled = True
+
+
+def disable():
+    r"""Stop recording, keeping the statistics recorded so far."""
+    global _enabled
+    with _lock:
+        _enabled = False
+        for convention, originals in _originals.items():
+            for name, original in zip(('accrual_factor', 'year_fraction'), originals):
+                if original is None:
+                    delattr(convention, name)
+                else:
+                    setattr(convention, name, original)
+        _originals.clear()
+
+
+def is_enabled():
+    r"""bool: Whether the computations are being recorded."""
+    return _enabled
+
+
+def reset():
+    r"""Discard the statistics recorded so far."""
+    with _lock:
+        _statistics.clear()
+
+
+@contextmanager
+def instrumented(reset_statistics=True):
+    r"""Record the computations within a ``with`` block.
+
+    Parameters
+    ----------
+    reset_statistics : bool
+        Whether to discard the statistics recorded before the block (The
+        default is True).
+
+    """
+    if reset_statistics:
+        reset()
+    enable()
+    try:
+        yield
+    finally:
+        disable()
+
+
+def snapshot():
+    r"""Report the statistics recorded so far.
+
+    Returns
+    -------
+    dict
+        Maps each convention name to a dict mapping each path it was
+        computed on to its statistics: the numbers of ``calls`` and
+        ``items`` (accrual factors), the cumulative ``seconds``, the
+        ``max_size`` of a call, and ``sizes``, the number of calls per
+        power of ten of the size, keyed by its lower bound as a string.
+
+    """
+    with _lock:
+        return dict((name, dict((path, dict(entry, sizes=dict(entry['sizes'])))
+                                for path, entry in paths.items()))
+                    for name, paths in _statistics.items())
+
+
+def to_json(**kwargs):
+    r"""Report the statistics recorded so far as JSON.
+
+    Parameters
+    ----------
+    **kwargs
+        The further arguments of ``json.dumps``, e.g. ``indent``.
+
+    Returns
+    -------
+    str
+        The JSON serialization of :py:func:`snapshot`.
+
+    """
+    return json.dumps(snapshot(), sort_keys=True, **kwargs)
+
+
+def record(convention, path, size, seconds):
+    r"""Record a computation.
+
+    Parameters
+    ----------
+    convention : type or str
+        The day count convention class, or its name.
+    path : str
+        One of :py:data:`PATHS`.
+    size : int
+        The number of accrual factors computed.
+    seconds : float
+        The duration of the computation.
+
+    """
+    name = _name(convention)
+    bucket = '0' if size < 1 else str(10 ** (len(str(int(size))) - 1))
+    with _lock:
+        entry = _statistics.setdefault(name, {}).setdefault(
+            path, {'calls': 0, 'items': 0, 'seconds': 0., 'max_size': 0, 'sizes': {}})
+        entry['calls'] += 1
+        entry['items'] += size
+        entry['seconds'] += seconds
+        entry['max_size'] = max(entry['max_size'], size)
+        entry['sizes'][bucket] = entry['sizes'].get(bucket, 0) + 1
+
+
+def instrument(path, convention_position=0):
+    r"""Decorate a function computing accrual factors so that its calls are
+    recorded while the instrumentation is enabled.
+
+    Parameters
+    ----------
+    path : str
+        One of :py:data:`PATHS`.
+    convention_position : int
+        The position of the convention among the parameters of the function,
+        which may also be passed by keyword.
+
+    """
+    def decorator(function):
+        signature = inspect.signature(function)
+        name = list(signature.parameters)[convention_position]
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return function(*args, **kwargs)
+            beg = perf_counter()
+            result = function(*args, **kwargs)
+            convention = signature.bind(*args, **kwargs).arguments[name]
+            record(convention, path, getattr(result, 'size', 1), perf_counter() - beg)
+            return result
+        return wrapper
+    return decorator
+
+
+def _instrument_scalar(year_fraction):
+    @wraps(year_fraction)
+    def instrumented_year_fraction(cls, *args, **kwargs):
+        beg = perf_counter()
+        result = year_fraction(cls, *args, **kwargs)
+        record(cls, 'scalar', 1, perf_counter() - beg)
+        return result
+    return instrumented_year_fraction
+
+
+def _instrument_property(accrual_factor):
+    @wraps(accrual_factor)
+    def instrumented_accrual_factor(self):
+        beg = perf_counter()
+        result = accrual_factor(self)
+        record(type(self), 'scalar', 1, perf_counter() - beg)
+        return result
+    return instrumented_accrual_factor
+
+
+def _name(convention):
+    from . import registry
+
+    try:
+        if isinstance(convention, str):
+            convention = registry.resolve(convention)
+        return registry.canonical_name(convention)
+    except ValueError:
+        return getattr(convention, '__name__', str(convention))
@@ -0,0 +1,142 @@
+"""This module provides the computation of accrual factors for very large
+arrays on several processes.
+
+The date arrays are copied once into shared memory, as integers, and each
+worker process computes the accrual factors of a contiguous shard with
+:py:func:`daycountconventions.batch.accrual_factors`, writing them into a
+shared output array. No date or result is pickled between processes.
+
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from time import perf_counter
+
+import numpy as np
+
+from . import instrumentation, registry
+from .batch import accrual_factors
+
+DEFAULT_CHUNK_SIZE = 1000000
+DEFAULT_MIN_PARALLEL_SIZE = 200000
+
+_DATE_ARGUMENTS = ('termination_date', 'coupon_end')
+
+# The convention and options of the worker process, set by _initialize.
+_worker_state = {}
+
+
+def parallel_accrual_factors(convention, starts, ends, workers=None, chunk_size=DEFAULT_CHUNK_SIZE,
+                             min_parallel_size=DEFAULT_MIN_PARALLEL_SIZE, mp_context=None, **kwargs):
+    r"""Compute the accrual factors of many date pairs on a pool of processes.
+
+    Parameters
+    ----------
+    convention : type or str
+        A day count convention class, or a name registered in
+        :py:mod:`daycountconventions.registry`.
+    starts : array_like
+        The beginning dates, convertible to ``datetime64[D]``.
+    ends : array_like
+        The end dates, convertible to ``datetime64[D]``.
+    workers : int, optional
+        The number of worker processes (The default is the number of CPUs).
+    chunk_size : int
+        The number of date pairs of each shard (The default is 1000000).
+    min_parallel_size : int
+        The number of date pairs below which the computation runs in the
+        calling process (The default is 200000).
+    mp_context : multiprocessing.context.BaseContext, optional
+        The multiprocessing context used to start the workers.
+    **kwargs
+        The further arguments of
+        :py:func:`daycountconventions.batch.accrual_factors`, such as
+        ``termination_date`` or ``calendar``. Date arguments may be arrays
+        with one date per pair.
+
+    Returns
+    -------
+    numpy.ndarray
+        A float64 array of accrual factors, identical to the result of
+        :py:func:`daycountconventions.batch.accrual_factors`.
+
+    """
+    if chunk_size <= 0:
+        raise ValueError('The parameter "chunk_size" must be positive')
+    if isinstance(convention, str):
+        convention = registry.resolve(convention)
+    starts = np.asarray(starts, dtype='datetime64[D]')
+    ends = np.asarray(ends, dtype='datetime64[D]')
+    starts, ends = np.broadcast_arrays(starts, ends)
+    workers = workers or os.cpu_count() or 1
+    if starts.size < min_parallel_size or workers == 1 or starts.ndim == 0:
+        return accrual_factors(convention, starts, ends, **kwargs)
+
+    shape = starts.shape
+    columns = {'starts': starts, 'ends': ends}
+    options = dict(kwargs)
+    for name in _DATE_ARGUMENTS:
+        value = options.get(name)
+        if value is not None and np.ndim(value) > 0:
+            columns[name] = np.broadcast_to(np.asarray(value, dtype='datetime64[D]'), shape)
+            del options[name]
+
+    blocks = []
+    try:
+        inputs = {}
+        for name, column in columns.items():
+            block = _create_block(column.size * 8)
+            blocks.append(block)
+            np.ndarray((column.size,), dtype=np.int64, buffer=block.buf)[:] = column.reshape(-1).view(np.int64)
+            inputs[name] = block.name
+        output_block = _create_block(starts.size * 8)
+        blocks.append(output_block)
+        bounds = [(beg, min(beg + chunk_size, starts.size)) for beg in range(0, starts.size, chunk_size)]
+        started = perf_counter()
+        with ProcessPoolExecutor(max_workers=min(workers, len(bounds)), mp_context=mp_context,
+                                 initializer=_initialize, initargs=(convention, options)) as executor:
+            for future in [executor.submit(_compute_shard, inputs, output_block.name, starts.size, beg, end)
+                           for beg, end in bounds]:
+                future.result()
+        # The workers do not share the instrumentation of this process, so
+        # the computation of all shards is recorded here as one call.
+        if instrumentation.is_enabled():
+            instrumentation.record(convention, 'batch', starts.size, perf_counter() - started)
+        return np.ndarray((starts.size,), dtype=np.float64, buffer=output_block.buf).reshape(shape).copy()
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def _create_block(size):
+    return shared_memory.SharedMemory(create=True, size=max(1, size))
+
+
+def _initialize(convention, options):
+    _worker_state['convention'] = convention
+    _worker_state['options'] = options
+
+
+def _compute_shard(inputs, output_name, size, beg, end):
+    # The views on the shared blocks are copied, so that the blocks can be
+    # closed whatever happens to the computation.
+    columns = {}
+    for name, block_name in inputs.items():
+        block = shared_memory.SharedMemory(name=block_name)
+        try:
+            shard = np.ndarray((size,), dtype=np.int64, buffer=block.buf)[beg:end]
+            columns[name] = shard.view('datetime64[D]').copy()
+            del shard
+        finally:
+            block.close()
+    options = dict(_worker_state['options'])
+    for name in _DATE_ARGUMENTS:
+        if name in columns:
+            options[name] = columns[name]
+    factors = accrual_factors(_worker_state['convention'], columns['starts'], columns['ends'], **options)
+    block = shared_memory.SharedMemory(name=output_name)
+    try:
+        np.ndarray((size,), dtype=np.float64, buffer=block.buf)[beg:end] = factors
+    finally:
+        block.close()
@@ -0,0 +1,120 @@
+"""This module provides the parsing of ISO 8601 dates (``YYYY-MM-DD``) in
+bulk, using NumPy.
+
+The characters of all dates are read as one integer matrix, without a
+Python object or a call to ``strptime`` per date, and checked and converted
+with array operations. The dates are returned as ``datetime64[D]`` values,
+which :py:func:`daycountconventions.batch.accrual_factors` accepts, or as
+proleptic Gregorian ordinals::
+
+    from daycountconventions.parsing import parse_dates
+
+    starts = parse_dates(['2017-01-15', '2017-02-28'])
+    ends = parse_dates(open('ends.txt', 'rb').read())
+
+"""
+import mmap
+
+import numpy as np
+
+from . import _engine
+from .batch import _EPOCH_ORDINAL
+
+_WIDTH = 10
+_DIGITS = (0, 1, 2, 3, 5, 6, 8, 9)
+_SEPARATORS = (4, 7)
+# The number of days before the first day of each month, in a common year.
+_DAYS_BEFORE_MONTH = np.array([0, 0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334], dtype=np.int64)
+
+
+def parse_dates(values, ordinals=False):
+    r"""Parse ISO 8601 dates in the format ``YYYY-MM-DD``.
+
+    Parameters
+    ----------
+    values : array_like or bytes
+        The dates: a sequence or array of strings or bytes, or a buffer
+        (``bytes``, ``bytearray``, ``memoryview`` or ``mmap``) of ASCII dates
+        separated by whitespace, such as the content of a file with one date
+        per line.
+    ordinals : bool
+        Whether to return the proleptic Gregorian ordinals of the dates, as
+        returned by ``datetime.date.toordinal``, instead of ``datetime64[D]``
+        values (The default is False).
+
+    Returns
+    -------
+    numpy.ndarray
+        The ``datetime64[D]`` dates, or their int64 ordinals, with the shape
+        of the values (one dimension for a buffer).
+
+    Raises
+    ------
+    ValueError
+        If a value is not a valid date in the format ``YYYY-MM-DD``. The
+        message gives the index of the first invalid value, in the flattened
+        values, and the number of invalid values.
+
+    """
+    codes, shape = _character_codes(values)
+    digits = codes[:, _DIGITS].astype(np.int64) - ord('0')
+    valid = np.all((digits >= 0) & (digits <= 9), axis=1)
+    valid &= np.all(codes[:, _SEPARATORS] == ord('-'), axis=1)
+    if codes.shape[1] > _WIDTH:
+        valid &= np.all(codes[:, _WIDTH:] == 0, axis=1)
+    y = digits[:, 0] * 1000 + digits[:, 1] * 100 + digits[:, 2] * 10 + digits[:, 3]
+    m = digits[:, 4] * 10 + digits[:, 5]
+    d = digits[:, 6] * 10 + digits[:, 7]
+    valid &= (y >= 1) & (m >= 1) & (m <= 12)
+    # Keep the invalid rows in range of the month table and the day check.
+    m = np.where(valid, m, 1)
+    valid &= (d >= 1) & (d <= _engine.days_in_month(y, m))
+    if not np.all(valid):
+        invalid = np.flatnonzero(~valid)
+        raise ValueError('Invalid date {!r} at row {} ({} invalid value{})'.format(
+            _text(codes[invalid[0]]), invalid[0], len(invalid), 's' if len(invalid) > 1 else ''))
+    result = _engine.year_start(y) + _DAYS_BEFORE_MONTH[m] + (m > 2) * _engine.is_leap(y) + d - 1
+    if not ordinals:
+        result = (result - _EPOCH_ORDINAL).astype('datetime64[D]')
+    return result.reshape(shape)
+
+
+def _character_codes(values):
+    # The matrix of the character codes of the values, one row per value and
+    # at least _WIDTH columns, padded with zeros, and the shape of the values.
+    if isinstance(values, (bytes, bytearray, memoryview, mmap.mmap)):
+        return _buffer_codes(values), (-1,)
+    values = np.asarray(values)
+    if not values.size:
+        values = values.astype('S{}'.format(_WIDTH))
+    elif values.dtype.kind == 'O':
+        values = values.astype('U')
+    if values.dtype.kind == 'S':
+        code_type = np.uint8
+    elif values.dtype.kind == 'U':
+        code_type = np.uint32
+    else:
+        raise ValueError('The dates must be strings or bytes, not {} values'.format(values.dtype))
+    shape = values.shape
+    width = values.dtype.itemsize // np.dtype(code_type).itemsize
+    codes = np.ascontiguousarray(values).reshape(-1).view(code_type).reshape(-1, width)
+    if width < _WIDTH:
+        codes = np.pad(codes, ((0, 0), (0, _WIDTH - width)))
+    return codes, shape
+
+
+def _buffer_codes(buffer):
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    if len(data) % (_WIDTH + 1) == _WIDTH:
+        data = np.append(data, np.uint8(ord('\n')))
+    # The common layout of one date per line is viewed without a copy.
+    if len(data) % (_WIDTH + 1) == 0 and np.all(data[_WIDTH::_WIDTH + 1] == ord('\n')):
+        return data.reshape(-1, _WIDTH + 1)[:, :_WIDTH]
+    values = np.array(bytes(buffer).split(), dtype='S')
+    if not values.size:
+        return np.zeros((0, _WIDTH), dtype=np.uint8)
+    return _character_codes(values)[0]
+
+
+def _text(codes):
+    return ''.join(chr(code) for code in codes if code)
@@ -0,0 +1,203 @@
+"""This module provides the computation of accrual factors for files of date
+pairs which may not fit in memory.
+
+The input is read in chunks of a fixed number of rows, the accrual factors
+of each chunk are computed with :py:func:`daycountconventions.batch.accrual_factors`
+and the chunk is written out before the next one is read, so the memory use
+does not depend on the size of the input. CSV files are supported with the
+standard library only, and Parquet files with pyarrow.
+
+"""
+import csv
+
+import numpy as np
+
+from . import conventions, registry
+from .batch import accrual_factors
+
+FACTOR_COLUMN = 'accrual_factor'
+
+
+def process_file(input_path, output_path, convention=None, chunk_size=100000, start_column='start',
+                 end_column='end', convention_column='convention', termination_column='termination_date',
+                 coupon_end_column='coupon_end', coupon_type='semi-annual', calendar=None):
+    r"""Compute the accrual factors of all rows of a file.
+
+    The output file contains the columns of the input file, followed by an
+    ``accrual_factor`` column which replaces any column of that name. The
+    format of each file is given by its extension, ``.parquet`` for Parquet
+    and CSV otherwise.
+
+    Parameters
+    ----------
+    input_path : str
+        The path of the input file, with a header row for CSV files.
+    output_path : str
+        The path of the output file.
+    convention : type or str, optional
+        The day count convention of all rows. If omitted, the convention of
+        each row is read from ``convention_column`` and resolved once per
+        distinct name and chunk.
+    chunk_size : int
+        The number of rows read at once (The default is 100000).
+    start_column, end_column : str
+        The columns of the beginning and end dates, in the format
+        ``YYYY-MM-DD`` for CSV files.
+    convention_column : str
+        The column of the convention names, used without ``convention``.
+    termination_column : str
+        The column of the termination dates, used by the 30E/360 ISDA
+        convention.
+    coupon_end_column : str
+        The column of the coupon end dates, used by the ACT/365 L
+        convention.
+    coupon_type : {'semi-annual', 'annual'}
+        The coupon type used by the ACT/365 L convention.
+    calendar : daycountconventions.calendars.HolidayCalendar, optional
+        The holiday calendar used by the BUS/252 convention.
+
+    Returns
+    -------
+    int
+        The number of rows processed.
+
+    Raises
+    ------
+    ValueError
+        If a column is missing, a row of a CSV file has not as many fields
+        as the header, a date is invalid or missing from a row, a
+        convention is unknown, or an argument required by a convention is
+        missing. Rows are numbered from 1, not counting the header.
+
+    """
+    if chunk_size <= 0:
+        raise ValueError('The parameter "chunk_size" must be positive')
+    if isinstance(convention, str):
+        convention = registry.resolve(convention)
+    options = {'start_column': start_column, 'end_column': end_column, 'termination_column': termination_column,
+               'coupon_end_column': coupon_end_column, 'coupon_type': coupon_type, 'calendar': calendar}
+    rows = 0
+    writer = None
+    try:
+        for header, columns in _read_chunks(input_path, chunk_size):
+            for column in (start_column, end_column) + (() if convention is not None else (convention_column,)):
+                if column not in columns:
+                    raise ValueError('The column "{}" is missing from {}'.format(column, input_path))
+            size = len(columns[start_column])
+            if convention is not None:
+                factors = _chunk_factors(convention, columns, np.arange(size), options, rows, input_path)
+            else:
+                factors = np.empty(size, dtype=np.float64)
+                names, inverse = np.unique(columns[convention_column].astype(str), return_inverse=True)
+                for k, name in enumerate(names):
+                    index = np.flatnonzero(inverse == k)
+                    factors[index] = _chunk_factors(registry.resolve(name), columns, index, options, rows,
+                                                    input_path)
+            if writer is None:
+                writer = _open_writer(output_path, header)
+            writer.write(columns, factors)
+            rows += len(factors)
+    finally:
+        if writer is not None:
+            writer.close()
+    if writer is None:
+        _open_writer(output_path, []).close()
+    return rows
+
+
+def _chunk_factors(convention, columns, index, options, first_row, path):
+    # The rows of the chunk in index, the first row of the chunk being row
+    # first_row + 1 of the file, not counting the header.
+    def dates(column):
+        if column not in columns:
+            return None
+        values = np.asarray(columns[column][index], dtype='datetime64[D]')
+        missing = np.flatnonzero(np.isnat(values))
+        if len(missing):
+            raise ValueError('The column "{}" has a missing date in row {} of {}'.format(
+                column, first_row + index[missing[0]] + 1, path))
+        return values
+
+    # The termination and coupon end dates are read for the conventions
+    # using them only, so that they may be blank for the other rows.
+    return accrual_factors(convention, dates(options['start_column']), dates(options['end_column']),
+                           termination_date=dates(options['termination_column'])
+                           if convention is conventions.DCC30E360ISDA else None,
+                           coupon_end=dates(options['coupon_end_column'])
+                           if convention is conventions.DCCACT365L else None,
+                           coupon_type=options['coupon_type'], calendar=options['calendar'])
+
+
+def _is_parquet(path):
+    return str(path).lower().endswith('.parquet')
+
+
+def _read_chunks(path, chunk_size):
+    # Yield (header, columns) where columns maps each name to an array.
+    if _is_parquet(path):
+        import pyarrow.parquet as pq
+
+        parquet_file = pq.ParquetFile(path)
+        header = parquet_file.schema_arrow.names
+        for record_batch in parquet_file.iter_batches(batch_size=chunk_size):
+            yield header, dict((name, record_batch.column(name).to_numpy(zero_copy_only=False)) for name in header)
+        return
+    with open(path, newline='') as input_file:
+        reader = csv.reader(input_file)
+        header = next(reader, [])
+        first_row = 0
+        while True:
+            rows = [row for _, row in zip(range(chunk_size), reader)]
+            if not rows:
+                return
+            # Transposing rows of other widths would truncate the columns.
+            if any(len(row) != len(header) for row in rows):
+                number, row = next((number, row) for number, row in enumerate(rows, first_row + 1)
+                                   if len(row) != len(header))
+                raise ValueError('Row {} of {} has {} fields, expected {}'.format(number, path, len(row),
+                                                                                  len(header)))
+            first_row += len(rows)
+            yield header, dict(zip(header, (np.array(column) for column in zip(*rows))))
+
+
+def _open_writer(path, header):
+    if _is_parquet(path):
+        return _ParquetWriter(path)
+    return _CsvWriter(path, header)
+
+
+class _CsvWriter(object):
+
+    def __init__(self, path, header):
+        self._file = open(path, 'w', newline='')
+        self._writer = csv.writer(self._file)
+        self._header = [name for name in header if name != FACTOR_COLUMN]
+        self._writer.writerow(self._header + [FACTOR_COLUMN])
+
+    def write(self, columns, factors):
+        self._writer.writerows(zip(*([columns[name] for name in self._header] + [factors.tolist()])))
+
+    def close(self):
+        self._file.close()
+
+
+class _ParquetWriter(object):
+
+    def __init__(self, path):
+        self._path = path
+        self._writer = None
+
+    def write(self, columns, factors):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        arrays = dict((name, pa.array(values)) for name, values in columns.items())
+        arrays[FACTOR_COLUMN] = pa.array(factors)
+        table = pa.table(arrays)
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self._path, table.schema)
+        self._writer.write_table(table)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
@@ -0,0 +1,162 @@
+"""Reference implementations of the day count conventions.
+
+Each function computes the accrual factor of one date pair by following the
+definition of its convention literally, with ``datetime`` arithmetic and
+explicit loops. They are slow, and exist only to validate the optimized
+rules of :py:mod:`daycountconventions._engine` and
+:py:mod:`daycountconventions._scalar` (see
+:py:mod:`daycountconventions.validation`). Every function takes the same
+arguments as the ``year_fraction`` method of its convention, with
+``date_beg`` not after ``date_end``.
+
+"""
+from calendar import isleap, monthrange
+from datetime import date, timedelta
+
+from . import conventions
+
+
+def _as_date(day):
+    return date(day.year, day.month, day.day)
+
+
+def _thirty(y1, m1, d1, y2, m2, d2):
+    return (360. * (y2 - y1) + 30. * (m2 - m1) + d2 - d1) / 360.
+
+
+def _leap_day_between(date_1, date_3):
+    # Whether 29 February of the year of date_1 or date_3 is in (date_1, date_3].
+    for year in (date_1.year, date_3.year):
+        if isleap(year) and date_1 < date(year, 2, 29) <= date_3:
+            return True
+    return False
+
+
+def thirty_360(date_beg, date_end):
+    r"""*30/360*, see :py:class:`daycountconventions.conventions.DCC30360`."""
+    d1 = 30 if date_beg.day == 31 else date_beg.day
+    d2 = 30 if date_end.day == 31 and date_beg.day in (30, 31) else date_end.day
+    return _thirty(date_beg.year, date_beg.month, d1, date_end.year, date_end.month, d2)
+
+
+def thirty_e_360(date_beg, date_end):
+    r"""*30E/360*, see :py:class:`daycountconventions.conventions.DCC30E360`."""
+    d1 = 30 if date_beg.day == 31 else date_beg.day
+    d2 = 30 if date_end.day == 31 else date_end.day
+    return _thirty(date_beg.year, date_beg.month, d1, date_end.year, date_end.month, d2)
+
+
+def thirty_e_360_isda(date_beg, date_end, termination_date):
+    r"""*30E/360 ISDA*, see
+    :py:class:`daycountconventions.conventions.DCC30E360ISDA`."""
+    d1 = 30 if date_beg.day == monthrange(date_beg.year, date_beg.month)[1] else date_beg.day
+    end_of_february = (date_end.month == 2 and date_end.day == monthrange(date_end.year, 2)[1]
+                       and _as_date(date_end) != _as_date(termination_date))
+    d2 = 30 if date_end.day == 31 or end_of_february else date_end.day
+    return _thirty(date_beg.year, date_beg.month, d1, date_end.year, date_end.month, d2)
+
+
+def thirty_e_plus_360_isda(date_beg, date_end):
+    r"""*30E+/360 ISDA*, see
+    :py:class:`daycountconventions.conventions.DCC30EP360ISDA`."""
+    d1 = 30 if date_beg.day == 31 else date_beg.day
+    if date_end.day == 31:
+        date_end = date_end + timedelta(days=1)
+    return _thirty(date_beg.year, date_beg.month, d1, date_end.year, date_end.month, date_end.day)
+
+
+def act_360(date_beg, date_end):
+    r"""*ACT/360*, see :py:class:`daycountconventions.conventions.DCCACT360`."""
+    return (_as_date(date_end) - _as_date(date_beg)).days / 360.
+
+
+def act_365_fixed(date_beg, date_end):
+    r"""*ACT/365 Fixed*, see
+    :py:class:`daycountconventions.conventions.DCCACT365Fixed`."""
+    return (_as_date(date_end) - _as_date(date_beg)).days / 365.
+
+
+def act_365_l(date_1, date_2, date_3, coupon_type='semi-annual'):
+    r"""*ACT/365 L*, see :py:class:`daycountconventions.conventions.DCCACT365L`."""
+    date_1, date_2, date_3 = _as_date(date_1), _as_date(date_2), _as_date(date_3)
+    if coupon_type == 'semi-annual':
+        denominator = 366. if isleap(date_3.year) else 365.
+    elif coupon_type == 'annual':
+        denominator = 366. if _leap_day_between(date_1, date_3) else 365.
+    else:
+        raise ValueError('The parameter "coupon_type" can only be either "semi-annual" or "annual"')
+    return (date_2 - date_1).days / denominator
+
+
+def act_365_a(date_beg, date_end):
+    r"""*ACT/365 A*, see :py:class:`daycountconventions.conventions.DCCACT365A`."""
+    date_beg, date_end = _as_date(date_beg), _as_date(date_end)
+    denominator = 366. if _leap_day_between(date_beg, date_end) else 365.
+    return (date_end - date_beg).days / denominator
+
+
+def nl_365(date_beg, date_end):
+    r"""*NL/365*, see :py:class:`daycountconventions.conventions.DCCNL365`."""
+    date_beg, date_end = _as_date(date_beg), _as_date(date_end)
+    numerator = (date_end - date_beg).days
+    if _leap_day_between(date_beg, date_end):
+        numerator -= 1
+    return numerator / 365.
+
+
+def act_act_isda(date_beg, date_end):
+    r"""*ACT/ACT ISDA*, see
+    :py:class:`daycountconventions.conventions.DCCACTACTISDA`."""
+    date_beg, date_end = _as_date(date_beg), _as_date(date_end)
+    leapyear_days = 0
+    nonleapyear_days = 0
+    for year in range(date_beg.year, date_end.year + 1):
+        days = (min(date_end, date(year + 1, 1, 1)) - max(date_beg, date(year, 1, 1))).days
+        if isleap(year):
+            leapyear_days += days
+        else:
+            nonleapyear_days += days
+    return leapyear_days / 366. + nonleapyear_days / 365.
+
+
+def business_252(date_beg, date_end, calendar):
+    r"""*BUS/252*, see :py:class:`daycountconventions.conventions.DCCBusiness252`."""
+    date_beg, date_end = _as_date(date_beg), _as_date(date_end)
+    holidays = set(calendar.holidays)
+    business_days = 0
+    day = date_beg
+    while day < date_end:
+        if day.weekday() not in calendar._weekend and day not in holidays:
+            business_days += 1
+        day += timedelta(days=1)
+    return business_days / 252.
+
+
+def act_act_icma(date_beg, date_end, schedule):
+    r"""*ACT/ACT ICMA*, see
+    :py:class:`daycountconventions.conventions.DCCACTACTICMA`."""
+    date_beg, date_end = _as_date(date_beg), _as_date(date_end)
+    dates = schedule.dates
+    factor = 0.
+    for period_beg, period_end in zip(dates[:-1], dates[1:]):
+        days = (min(date_end, period_end) - max(date_beg, period_beg)).days
+        if days > 0:
+            factor += days / (schedule.frequency * (period_end - period_beg).days)
+    return factor
+
+
+#: The reference implementation of each convention class.
+REFERENCES = {
+    conventions.DCC30360: thirty_360,
+    conventions.DCC30E360: thirty_e_360,
+    conventions.DCC30E360ISDA: thirty_e_360_isda,
+    conventions.DCC30EP360ISDA: thirty_e_plus_360_isda,
+    conventions.DCCACT360: act_360,
+    conventions.DCCACT365Fixed: act_365_fixed,
+    conventions.DCCACT365L: act_365_l,
+    conventions.DCCACT365A: act_365_a,
+    conventions.DCCNL365: nl_365,
+    conventions.DCCACTACTISDA: act_act_isda,
+    conventions.DCCBusiness252: business_252,
+    conventions.DCCACTACTICMA: act_act_icma,
+}
@@ -0,0 +1,105 @@
+"""This module provides the lookup of day count conventions by name.
+
+Every convention is registered under its canonical name, i.e. the value of
+its ``convention_name`` property, and under the other names it is known
+by. Names are matched case-insensitively and regardless of repeated
+whitespace.
+
+"""
+from functools import lru_cache
+
+from . import conventions
+
+_CONVENTIONS = {}
+_CANONICAL_NAMES = {}
+
+
+def register(convention, name, aliases=()):
+    r"""Register a day count convention under a canonical name and aliases.
+
+    Parameters
+    ----------
+    convention : type
+        A day count convention class.
+    name : str
+        The canonical name of the convention.
+    aliases : iterable of str, optional
+        Other names the convention is known by.
+
+    Raises
+    ------
+    ValueError
+        If one of the names is already registered for another convention.
+
+    """
+    keys = [_normalize(alias) for alias in (name,) + tuple(aliases)]
+    for key in keys:
+        if _CONVENTIONS.get(key, convention) is not convention:
+            raise ValueError('The name "{}" is already registered for {}'.format(key, _CONVENTIONS[key].__name__))
+    for key in keys:
+        _CONVENTIONS[key] = convention
+    _CANONICAL_NAMES[convention] = name
+    resolve.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def resolve(name):
+    r"""Find the day count convention registered under a name.
+
+    The result is cached per distinct string, so resolving the same name
+    for every record of a feed costs a single dictionary lookup.
+
+    Parameters
+    ----------
+    name : str
+        A canonical name or alias, e.g. ``30/360``, ``ACT/365 Fixed`` or
+        ``Bond basis``.
+
+    Returns
+    -------
+    type
+        The convention class. Its ``year_fraction`` class method computes
+        accrual factors without creating instances, and the class can be
+        passed to :py:func:`daycountconventions.batch.accrual_factors`.
+
+    Raises
+    ------
+    ValueError
+        If no convention is registered under the name.
+
+    """
+    try:
+        return _CONVENTIONS[_normalize(name)]
+    except KeyError:
+        raise ValueError('Unknown day count convention: "{}"'.format(name))
+
+
+def canonical_name(convention):
+    r"""str: The canonical name a convention class is registered under."""
+    try:
+        return _CANONICAL_NAMES[convention]
+    except KeyError:
+        raise ValueError('Unregistered day count convention: {!r}'.format(convention))
+
+
+def available_conventions():
+    r"""list of str: The canonical names of all registered conventions."""
+    return sorted(_CANONICAL_NAMES.values())
+
+
+def _normalize(name):
+    return ' '.join(name.split()).upper()
+
+
+register(conventions.DCC30360, '30/360', aliases=('30/360 US', '30U/360', 'Bond basis', '360/360'))
+register(conventions.DCC30E360, '30E/360', aliases=('Eurobond basis',))
+register(conventions.DCC30E360ISDA, '30E/360 ISDA')
+register(conventions.DCC30EP360ISDA, '30E+/360 ISDA', aliases=('30E+/360',))
+register(conventions.DCCACT360, 'ACT/360', aliases=('Money Market basis', 'Actual 360', 'French'))
+register(conventions.DCCACT365Fixed, 'ACT/365 Fixed', aliases=('English Money Market basis',))
+register(conventions.DCCACT365L, 'ACT/365 L', aliases=('ACT/365 Leap Year',))
+register(conventions.DCCACT365A, 'ACT/365 A', aliases=('ACT/365 Actual',))
+register(conventions.DCCNL365, 'NL/365', aliases=('ACT/365 No Leap Year',))
+register(conventions.DCCACTACTISDA, 'ACT/ACT ISDA')
+register(conventions.DCCBusiness252, 'BUS/252', aliases=('Business/252', 'BD/252'))
+register(conventions.DCCACTACTICMA, 'ACT/ACT ICMA', aliases=('ACT/ACT ISMA',))
@@ -0,0 +1,94 @@
+"""This module provides the accrual factors of periods whose dates are
+shifted by a grid of days, for the risk of date rolls and holiday shifts,
+using NumPy.
+
+The shifted beginning and end dates of the periods are decomposed into
+years, months, days and ordinals once per shift, not once per pair of
+shifts, and the rule of the convention is evaluated on every pair of
+shifted dates by broadcasting::
+
+    from daycountconventions.scenarios import shifted_accrual_factors
+
+    grid = shifted_accrual_factors('30/360', starts, ends, 3)
+    grid[:, 3, 3]  # the base accrual factors
+    grid[:, 3, 4]  # the end dates moved one day later
+
+"""
+import numpy as np
+
+from . import registry
+from .batch import _decompose, _rule_factors
+
+_DATE_ARGUMENTS = ('termination_date', 'coupon_end')
+
+
+def shifted_accrual_factors(convention, starts, ends, shifts, end_shifts=None, termination_date=None,
+                            coupon_end=None, coupon_type='semi-annual', calendar=None, schedule=None):
+    r"""Compute the accrual factors of periods for every combination of
+    shifts of their beginning and end dates.
+
+    Parameters
+    ----------
+    convention : type or str
+        A day count convention class, or a name registered in
+        :py:mod:`daycountconventions.registry`.
+    starts, ends : array_like
+        The beginning and end dates of the periods, convertible to
+        ``datetime64[D]``.
+    shifts : int or array_like
+        The shifts in days of the beginning dates: an integer ``k`` for the
+        shifts ``-k`` to ``k``, or a sequence of shifts.
+    end_shifts : int or array_like, optional
+        The shifts in days of the end dates, as ``shifts`` (The default is
+        the shifts of the beginning dates).
+    termination_date, coupon_end : array_like, optional
+        The date(s) required by
+        :py:class:`daycountconventions.conventions.DCC30E360ISDA` and
+        :py:class:`daycountconventions.conventions.DCCACT365L`, for all
+        periods or for each of them, which are not shifted.
+    coupon_type, calendar, schedule
+        The further arguments of
+        :py:func:`daycountconventions.batch.accrual_factors`.
+
+    Returns
+    -------
+    numpy.ndarray
+        A float64 array of shape ``(periods, len(shifts), len(end_shifts))``,
+        whose element ``[i, j, k]`` is the accrual factor of period ``i``
+        with its beginning date shifted by ``shifts[j]`` days and its end
+        date by ``end_shifts[k]`` days.
+
+    Raises
+    ------
+    ValueError
+        If the convention is not supported, a shift is negative when given
+        as an integer, an argument required by the convention is missing,
+        or a shifted date is outside the range of the calendar or schedule.
+
+    """
+    if isinstance(convention, str):
+        convention = registry.resolve(convention)
+    if not isinstance(convention, type) or getattr(convention, '_rule', None) is None:
+        raise ValueError('Unsupported day count convention: {!r}'.format(convention))
+    shifts = _shift_grid(shifts)
+    end_shifts = shifts if end_shifts is None else _shift_grid(end_shifts)
+    starts, ends = np.broadcast_arrays(np.asarray(starts, dtype='datetime64[D]').reshape(-1),
+                                       np.asarray(ends, dtype='datetime64[D]').reshape(-1))
+    beg = tuple(values[:, :, np.newaxis] for values in _decompose(starts[:, np.newaxis] + shifts))
+    end = tuple(values[:, np.newaxis, :] for values in _decompose(ends[:, np.newaxis] + end_shifts))
+    options = {'termination_date': termination_date, 'coupon_end': coupon_end}
+    for name in _DATE_ARGUMENTS:
+        if options[name] is not None and np.ndim(options[name]) > 0:
+            options[name] = np.broadcast_to(np.asarray(options[name], dtype='datetime64[D]'),
+                                            starts.shape)[:, np.newaxis, np.newaxis]
+    factors = _rule_factors(convention, beg + end, coupon_type=coupon_type, calendar=calendar, schedule=schedule,
+                            **options)
+    return np.array(np.broadcast_to(factors, (len(starts), len(shifts), len(end_shifts))), dtype=np.float64)
+
+
+def _shift_grid(shifts):
+    if np.ndim(shifts) == 0:
+        if shifts < 0:
+            raise ValueError('The number of shifts must not be negative')
+        return np.arange(-shifts, shifts + 1).astype('timedelta64[D]')
+    return np.asarray(shifts, dtype=np.int64).reshape(-1).astype('timedelta64[D]')
@@ -0,0 +1,312 @@
+"""This module provides coupon schedules for the conventions which depend on
+the coupon periods of an instrument.
+
+"""
+from bisect import bisect_left, bisect_right
+from calendar import monthrange
+from datetime import date
+
+from . import conventions, registry
+from .conventions import DCCACTACTICMA
+
+STUB_TYPES = ('short_front', 'long_front', 'short_back', 'long_back')
+
+
+class CouponSchedule(object):
+    r"""The regular coupon periods of an instrument.
+
+    The schedule is defined by its coupon dates, including quasi-coupon
+    dates for irregular first or last periods, and its coupon frequency.
+    The boundaries and lengths of all reference periods are computed once
+    on construction, so accrual factors for any number of dates within the
+    schedule only locate the periods by bisection.
+
+    Parameters
+    ----------
+    dates : sequence of datetime.date
+        The coupon dates, in strictly increasing order.
+    frequency : int
+        The number of coupon periods per year.
+
+    Raises
+    ------
+    ValueError
+        If there are fewer than two dates, the dates are not strictly
+        increasing, or the frequency is not positive.
+
+    """
+    def __init__(self, dates, frequency):
+        boundaries = [coupon_date.toordinal() for coupon_date in dates]
+        if len(boundaries) < 2:
+            raise ValueError('A coupon schedule requires at least two dates')
+        if any(beg >= end for beg, end in zip(boundaries[:-1], boundaries[1:])):
+            raise ValueError('The coupon dates must be strictly increasing')
+        if frequency <= 0:
+            raise ValueError('The parameter "frequency" must be positive')
+        self._boundaries = boundaries
+        self._lengths = [end - beg for beg, end in zip(boundaries[:-1], boundaries[1:])]
+        self._frequency = frequency
+
+    @classmethod
+    def generate(cls, effective_date, termination_date, frequency, stub='short_front', end_of_month=False):
+        r"""Build the coupon schedule of an instrument from its dates.
+
+        The schedule contains all regular coupon dates between the effective
+        and termination dates, plus the quasi-coupon dates which bound the
+        reference period of any stub. See :py:func:`accrual_periods` for the
+        parameters.
+
+        Returns
+        -------
+        CouponSchedule
+
+        """
+        grid = _CouponGrid(effective_date, termination_date, frequency, stub, end_of_month)
+        return cls(grid.reference_dates(), frequency)
+
+    @property
+    def dates(self):
+        r"""list of datetime.date: The coupon dates of the schedule."""
+        return [date.fromordinal(ordinal) for ordinal in self._boundaries]
+
+    @property
+    def frequency(self):
+        r"""int: The number of coupon periods per year."""
+        return self._frequency
+
+    def reference_period(self, day):
+        r"""Find the reference period containing a date.
+
+        Parameters
+        ----------
+        day : datetime.date
+            A date within the schedule, the last coupon date excluded.
+
+        Returns
+        -------
+        tuple of datetime.date
+            The start (included) and end (excluded) of the period.
+
+        """
+        ordinal = day.toordinal()
+        self._check_range(ordinal, ordinal)
+        if ordinal == self._boundaries[-1]:
+            raise ValueError('The last coupon date {} does not start a reference period'.format(day))
+        k = bisect_right(self._boundaries, ordinal) - 1
+        return date.fromordinal(self._boundaries[k]), date.fromordinal(self._boundaries[k + 1])
+
+    def accrual_factor(self, date_beg, date_end):
+        r"""Compute the ACT/ACT ICMA accrual factor between two dates.
+
+        See :py:class:`daycountconventions.conventions.DCCACTACTICMA`.
+
+        """
+        return DCCACTACTICMA.year_fraction(date_beg, date_end, self)
+
+    def accrual_factors(self, starts, ends):
+        r"""Compute the ACT/ACT ICMA accrual factors of arrays of dates, e.g.
+        of all cashflows of a bond.
+
+        See :py:func:`daycountconventions.batch.accrual_factors`.
+
+        """
+        from .batch import accrual_factors
+        return accrual_factors(DCCACTACTICMA, starts, ends, schedule=self)
+
+    def _locate(self, ordinal_1, ordinal_2):
+        # The period containing ordinal_1 and the period ended by ordinal_2.
+        if ordinal_2 < ordinal_1:
+            raise ValueError('The end date {} precedes the beginning date {}'.format(
+                date.fromordinal(ordinal_2), date.fromordinal(ordinal_1)))
+        self._check_range(ordinal_1, ordinal_2)
+        k1 = min(bisect_right(self._boundaries, ordinal_1), len(self._lengths)) - 1
+        return k1, bisect_left(self._boundaries, ordinal_2) - 1
+
+    def _check_range(self, lowest, highest):
+        # Raise if any ordinal in [lowest, highest] is outside the schedule.
+        if lowest < self._boundaries[0] or highest > self._boundaries[-1]:
+            outside = lowest if lowest < self._boundaries[0] else highest
+            raise ValueError('The date {} is outside the coupon schedule {} to {}'.format(
+                date.fromordinal(outside), date.fromordinal(self._boundaries[0]),
+                date.fromordinal(self._boundaries[-1])))
+
+
+def accrual_periods(effective_date, termination_date, frequency, convention, stub='short_front',
+                    end_of_month=False, calendar=None):
+    r"""Generate the accrual periods of a coupon schedule with their accrual
+    factors.
+
+    The periods are produced lazily, one at a time, so no list of periods
+    is built even for long schedules; only ACT/ACT ICMA builds the coupon
+    schedule of all reference dates, once.
+
+    Parameters
+    ----------
+    effective_date : datetime.date
+        The start date of the first period.
+    termination_date : datetime.date
+        The end date of the last period. It is also passed to the conventions
+        which need it, such as
+        :py:class:`daycountconventions.conventions.DCC30E360ISDA`.
+    frequency : {1, 2, 3, 4, 6, 12}
+        The number of coupon periods per year.
+    convention : type or str
+        A day count convention class, or a name registered in
+        :py:mod:`daycountconventions.registry`.
+    stub : {'short_front', 'long_front', 'short_back', 'long_back'}
+        Where an irregular period is placed, and whether it is shorter than
+        a regular period or merged with the adjacent regular period (The
+        default is 'short_front', i.e. the dates are rolled backward from the
+        termination date).
+    end_of_month : bool
+        Whether every coupon date is the last day of its month when the
+        date the schedule is rolled from is (The default is False).
+    calendar : daycountconventions.calendars.HolidayCalendar, optional
+        The holiday calendar, required by
+        :py:class:`daycountconventions.conventions.DCCBusiness252`.
+
+    Yields
+    ------
+    tuple
+        ``(start, end, accrual_factor)`` for each period, in chronological
+        order. For :py:class:`daycountconventions.conventions.DCCACT365L` the
+        coupon type is annual when the frequency is 1 and semi-annual
+        otherwise, and for
+        :py:class:`daycountconventions.conventions.DCCACTACTICMA` stubs are
+        measured against their notional reference periods.
+
+    Raises
+    ------
+    ValueError
+        If an argument is invalid.
+
+    """
+    grid = _CouponGrid(effective_date, termination_date, frequency, stub, end_of_month)
+    convention = _resolve(convention, calendar)
+    termination_date = grid.termination_date
+    coupon_type = 'annual' if frequency == 1 else 'semi-annual'
+    # The stubs are measured against the quasi-coupon dates of the grid, so
+    # one schedule of all reference dates serves every period.
+    if convention is conventions.DCCACTACTICMA:
+        coupon_schedule = CouponSchedule(grid.reference_dates(), frequency)
+    for start, end in grid.periods():
+        if convention is conventions.DCC30E360ISDA:
+            factor = convention.year_fraction(start, end, termination_date)
+        elif convention is conventions.DCCACT365L:
+            factor = convention.year_fraction(start, end, end, coupon_type)
+        elif convention is conventions.DCCBusiness252:
+            factor = convention.year_fraction(start, end, calendar)
+        elif convention is conventions.DCCACTACTICMA:
+            factor = convention.year_fraction(start, end, coupon_schedule)
+        else:
+            factor = convention.year_fraction(start, end)
+        yield start, end, factor
+
+
+def accrual_period_arrays(effective_date, termination_date, frequency, convention, stub='short_front',
+                          end_of_month=False, calendar=None):
+    r"""Compute the accrual periods of a coupon schedule as arrays.
+
+    The accrual factors are computed in one call to
+    :py:func:`daycountconventions.batch.accrual_factors`. See
+    :py:func:`accrual_periods` for the parameters.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        The ``datetime64[D]`` start and end dates of the periods, and their
+        float64 accrual factors.
+
+    """
+    import numpy as np
+    from .batch import accrual_factors
+
+    grid = _CouponGrid(effective_date, termination_date, frequency, stub, end_of_month)
+    convention = _resolve(convention, calendar)
+    boundaries = np.array(grid.boundaries(), dtype='datetime64[D]')
+    starts, ends = boundaries[:-1], boundaries[1:]
+    if convention is conventions.DCCACTACTICMA:
+        factors = accrual_factors(convention, starts, ends,
+                                  schedule=CouponSchedule(grid.reference_dates(), frequency))
+    else:
+        factors = accrual_factors(convention, starts, ends, termination_date=grid.termination_date,
+                                  coupon_end=ends, coupon_type='annual' if frequency == 1 else 'semi-annual',
+                                  calendar=calendar)
+    return starts, ends, factors
+
+
+def _resolve(convention, calendar):
+    if isinstance(convention, str):
+        convention = registry.resolve(convention)
+    if convention is conventions.DCCBusiness252 and calendar is None:
+        raise ValueError('The parameter "calendar" is required by the BUS/252 convention')
+    return convention
+
+
+class _CouponGrid(object):
+    # The coupon dates rolled from the termination date (front stubs) or the
+    # effective date (back stubs). Grid date k is the anchor shifted by k
+    # periods, toward the other end of the schedule; regular dates are
+    # grid dates 0 to n.
+
+    def __init__(self, effective_date, termination_date, frequency, stub, end_of_month):
+        if frequency not in (1, 2, 3, 4, 6, 12):
+            raise ValueError('The parameter "frequency" can only be one of 1, 2, 3, 4, 6 or 12')
+        if stub not in STUB_TYPES:
+            raise ValueError('The parameter "stub" can only be one of {}'.format(', '.join(STUB_TYPES)))
+        self.effective_date = date.fromordinal(effective_date.toordinal())
+        self.termination_date = date.fromordinal(termination_date.toordinal())
+        if self.termination_date <= self.effective_date:
+            raise ValueError('The termination date must follow the effective date')
+        self._front = stub.endswith('_front')
+        self._long = stub.startswith('long_')
+        if self._front:
+            self._anchor, self._step = self.termination_date, -12 // frequency
+            far = self.effective_date
+        else:
+            self._anchor, self._step = self.effective_date, 12 // frequency
+            far = self.termination_date
+        self._end_of_month = end_of_month and self._anchor.day == monthrange(self._anchor.year, self._anchor.month)[1]
+        months = (self.termination_date.year - self.effective_date.year) * 12 + (
+            self.termination_date.month - self.effective_date.month)
+        n = months // abs(self._step) + 1
+        while self._beyond(self._date(n), far):
+            n -= 1
+        self._n = n
+        self._stub = self._date(n) != far
+
+    def boundaries(self):
+        return [start for start, _ in self.periods()] + [self.termination_date]
+
+    def reference_dates(self):
+        # Every grid date needed to measure the periods, quasi-coupon dates
+        # included, in chronological order.
+        last = self._n + 1 if self._stub else self._n
+        dates = [self._date(k) for k in range(last + 1)]
+        return dates[::-1] if self._front else dates
+
+    def periods(self):
+        # Yield (start, end) in chronological order.
+        n = self._n
+        merged = self._stub and self._long and n >= 1
+        regular = range(n, 0, -1) if self._front else range(1, n + 1)
+        if self._front and self._stub:
+            yield self.effective_date, self._date(n - 1 if merged else n)
+        for k in regular:
+            if merged and k == n:
+                continue
+            if self._front:
+                yield self._date(k), self._date(k - 1)
+            else:
+                yield self._date(k - 1), self._date(k)
+        if not self._front and self._stub:
+            yield self._date(n - 1 if merged else n), self.termination_date
+
+    def _date(self, k):
+        months = self._anchor.year * 12 + self._anchor.month - 1 + k * self._step
+        year, month = months // 12, months % 12 + 1
+        last_day = monthrange(year, month)[1]
+        return date(year, month, last_day if self._end_of_month else min(self._anchor.day, last_day))
+
+    def _beyond(self, day, far):
+        return day < far if self._front else day > far
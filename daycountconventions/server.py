@@ -0,0 +1,394 @@
+"""This module provides an asyncio service computing accrual factors, and its
+client, for processes which should not import the package themselves.
+
+The protocol is line-delimited JSON over TCP or a Unix socket. Each request
+is one JSON object per line::
+
+    {"id": 1, "convention": "ACT/360", "start": "2017-01-15", "end": "2017-03-31"}
+
+with the optional members ``termination_date``, ``coupon_end`` and
+``coupon_type`` of :py:func:`daycountconventions.batch.accrual_factors`,
+and each response is one line with the same ``id`` and either an
+``accrual_factor`` or an ``error``::
+
+    {"id": 1, "accrual_factor": 0.20833333333333334}
+
+Responses are written as soon as they are computed, so they may come back
+in another order than the requests. The requests which arrive within a short
+window, from any connection, are computed together in one call to
+:py:func:`daycountconventions.batch.accrual_factors` per convention.
+
+Run ``python -m daycountconventions.server --help`` for the usage of the
+server.
+
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import sys
+from datetime import date
+
+import numpy as np
+
+from .batch import accrual_factors
+from .calendars import HolidayCalendar
+
+DEFAULT_PORT = 8765
+DEFAULT_WINDOW = 0.001
+DEFAULT_MAX_BATCH_SIZE = 10000
+
+_DATE_ARGUMENTS = ('termination_date', 'coupon_end')
+
+
+class AccrualServer(object):
+    r"""A service computing the accrual factors of JSON requests in
+    micro-batches.
+
+    Parameters
+    ----------
+    window : float
+        The number of seconds a request waits for others to be computed with
+        (The default is 0.001).
+    max_batch_size : int
+        The number of waiting requests from which they are computed at once,
+        before the end of the window (The default is 10000).
+    calendar : daycountconventions.calendars.HolidayCalendar, optional
+        The holiday calendar of the BUS/252 requests.
+
+    """
+    def __init__(self, window=DEFAULT_WINDOW, max_batch_size=DEFAULT_MAX_BATCH_SIZE, calendar=None):
+        if window < 0:
+            raise ValueError('The parameter "window" must not be negative')
+        if max_batch_size <= 0:
+            raise ValueError('The parameter "max_batch_size" must be positive')
+        self._window = window
+        self._max_batch_size = max_batch_size
+        self._calendar = calendar
+        self._pending = []
+        self._flush_handle = None
+        self._server = None
+        self._request_count = 0
+        self._batch_count = 0
+
+    @property
+    def request_count(self):
+        r"""int: The number of requests computed."""
+        return self._request_count
+
+    @property
+    def batch_count(self):
+        r"""int: The number of micro-batches computed."""
+        return self._batch_count
+
+    async def start(self, host='127.0.0.1', port=DEFAULT_PORT):
+        r"""Start listening on a TCP port.
+
+        Parameters
+        ----------
+        host : str
+            The interface (The default is the loopback interface).
+        port : int
+            The port, or 0 for a free port (The default is 8765).
+
+        Returns
+        -------
+        tuple
+            The host and port listened on.
+
+        """
+        self._server = await asyncio.start_server(self._handle, host, port)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def start_unix(self, path):
+        r"""Start listening on a Unix socket.
+
+        Parameters
+        ----------
+        path : str
+            The path of the socket.
+
+        """
+        self._server = await asyncio.start_unix_server(self._handle, path)
+
+    async def serve_forever(self):
+        r"""Serve the requests until cancelled."""
+        await self._server.serve_forever()
+
+    async def close(self):
+        r"""Stop listening and compute the waiting requests."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        self._flush()
+
+    def submit(self, request):
+        r"""Queue a request for the next micro-batch.
+
+        Parameters
+        ----------
+        request : dict
+            The request, with the members described in the module.
+
+        Returns
+        -------
+        asyncio.Future
+            The accrual factor, or a ValueError.
+
+        Raises
+        ------
+        ValueError
+            If a member is missing, or a date is not a string in the format
+            ``YYYY-MM-DD``.
+
+        """
+        for name in ('convention', 'start', 'end'):
+            if name not in request:
+                raise ValueError('The request has no "{}"'.format(name))
+        for name in ('start', 'end') + _DATE_ARGUMENTS:
+            if name in request:
+                _check_date(request[name], name)
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((request, future))
+        if len(self._pending) >= self._max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(self._window, self._flush)
+        return future
+
+    def _flush(self):
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        self._batch_count += 1
+        self._request_count += len(pending)
+        try:
+            groups = {}
+            for request, future in pending:
+                key = (str(request['convention']), str(request.get('coupon_type', 'semi-annual'))) + tuple(
+                    name in request for name in _DATE_ARGUMENTS)
+                groups.setdefault(key, []).append((request, future))
+            for group in groups.values():
+                try:
+                    factors = self._compute([request for request, _ in group])
+                except Exception:
+                    # Compute the requests one by one to find the invalid ones.
+                    for request, future in group:
+                        try:
+                            factor = self._compute([request])[0]
+                        except Exception as error:
+                            _set(future, exception=ValueError(str(error)))
+                        else:
+                            _set(future, result=float(factor))
+                else:
+                    for (_, future), factor in zip(group, factors.tolist()):
+                        _set(future, result=factor)
+        finally:
+            # No request is left waiting, whatever happened above.
+            for _, future in pending:
+                _set(future, exception=ValueError('The request could not be computed'))
+
+    def _compute(self, requests):
+        first = requests[0]
+        kwargs = dict((name, np.array([request[name] for request in requests], dtype='datetime64[D]'))
+                      for name in _DATE_ARGUMENTS if name in first)
+        return accrual_factors(str(first['convention']),
+                               np.array([request['start'] for request in requests], dtype='datetime64[D]'),
+                               np.array([request['end'] for request in requests], dtype='datetime64[D]'),
+                               coupon_type=first.get('coupon_type', 'semi-annual'), calendar=self._calendar,
+                               **kwargs)
+
+    async def _handle(self, reader, writer):
+        tasks = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                task = asyncio.ensure_future(self._respond(line, writer))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+                await writer.drain()
+            if tasks:
+                await asyncio.gather(*tasks)
+        finally:
+            writer.close()
+
+    async def _respond(self, line, writer):
+        identifier = None
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError('A request must be a JSON object')
+            identifier = request.get('id')
+            response = {'id': identifier, 'accrual_factor': await self.submit(request)}
+        except ValueError as error:
+            response = {'id': identifier, 'error': str(error)}
+        if not writer.is_closing():
+            writer.write(json.dumps(response).encode() + b'\n')
+
+
+class AccrualClient(object):
+    r"""A client of :py:class:`AccrualServer`, sending the requests of
+    concurrent tasks over one connection.
+
+    Use :py:meth:`connect` or :py:meth:`connect_unix` to create a client.
+
+    """
+    def __init__(self, reader, writer):
+        self._reader = reader
+        self._writer = writer
+        self._ids = itertools.count()
+        self._futures = {}
+        self._receiver = asyncio.ensure_future(self._receive())
+
+    @classmethod
+    async def connect(cls, host='127.0.0.1', port=DEFAULT_PORT):
+        r"""Connect to a server on a TCP port.
+
+        Returns
+        -------
+        AccrualClient
+
+        """
+        return cls(*(await asyncio.open_connection(host, port)))
+
+    @classmethod
+    async def connect_unix(cls, path):
+        r"""Connect to a server on a Unix socket.
+
+        Returns
+        -------
+        AccrualClient
+
+        """
+        return cls(*(await asyncio.open_unix_connection(path)))
+
+    async def accrual_factor(self, convention, start, end, **options):
+        r"""Compute an accrual factor on the server.
+
+        Parameters
+        ----------
+        convention : str
+            A name registered in :py:mod:`daycountconventions.registry`.
+        start, end : datetime.date or str
+            The beginning and end dates, or their representations in the
+            format ``YYYY-MM-DD``. The time of a datetime is ignored.
+        **options
+            ``termination_date``, ``coupon_end`` or ``coupon_type``.
+
+        Returns
+        -------
+        float
+
+        Raises
+        ------
+        ValueError
+            If the server could not compute the request.
+        ConnectionError
+            If the connection was closed.
+
+        """
+        if self._receiver.done():
+            raise ConnectionError('The connection to the server was closed')
+        identifier = next(self._ids)
+        request = {'id': identifier, 'convention': convention, 'start': start, 'end': end}
+        request.update(options)
+        request = dict((name, _iso_date(value)) for name, value in request.items())
+        future = asyncio.get_running_loop().create_future()
+        self._futures[identifier] = future
+        self._writer.write(json.dumps(request).encode() + b'\n')
+        await self._writer.drain()
+        return await future
+
+    async def close(self):
+        r"""Close the connection."""
+        self._writer.close()
+        await self._writer.wait_closed()
+        self._receiver.cancel()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def _receive(self):
+        try:
+            while True:
+                line = await self._reader.readline()
+                if not line:
+                    break
+                response = json.loads(line)
+                future = self._futures.pop(response.get('id'), None)
+                if future is None:
+                    continue
+                if 'error' in response:
+                    _set(future, exception=ValueError(response['error']))
+                else:
+                    _set(future, result=response['accrual_factor'])
+        finally:
+            for future in self._futures.values():
+                _set(future, exception=ConnectionError('The connection to the server was closed'))
+            self._futures.clear()
+
+
+def _iso_date(value):
+    # The ISO 8601 date of a date or datetime, or the value itself.
+    if isinstance(value, date):
+        return date(value.year, value.month, value.day).isoformat()
+    return value
+
+
+def _check_date(value, name):
+    try:
+        valid = isinstance(value, str) and date.fromisoformat(value).isoformat() == value
+    except ValueError:
+        valid = False
+    if not valid:
+        raise ValueError('The "{}" of the request is not a date in the format YYYY-MM-DD: {!r}'.format(name, value))
+
+
+def _set(future, result=None, exception=None):
+    if future.done():
+        return
+    if exception is not None:
+        future.set_exception(exception)
+    else:
+        future.set_result(result)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m daycountconventions.server',
+                                     description='Serve accrual factors over line-delimited JSON.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    parser.add_argument('--unix', help='listen on this Unix socket instead of a TCP port')
+    parser.add_argument('--window', type=float, default=DEFAULT_WINDOW * 1000.,
+                        help='the micro-batching window in milliseconds')
+    parser.add_argument('--max-batch-size', type=int, default=DEFAULT_MAX_BATCH_SIZE)
+    parser.add_argument('--calendar', help='a holiday file for BUS/252, with one YYYY-MM-DD date per line')
+    args = parser.parse_args(argv)
+
+    async def serve():
+        calendar = HolidayCalendar.from_file(args.calendar) if args.calendar else None
+        server = AccrualServer(window=args.window / 1000., max_batch_size=args.max_batch_size, calendar=calendar)
+        if args.unix:
+            await server.start_unix(args.unix)
+            print('Listening on {}'.format(args.unix), file=sys.stderr)
+        else:
+            print('Listening on {}:{}'.format(*(await server.start(args.host, args.port))), file=sys.stderr)
+        await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
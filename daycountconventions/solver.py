@@ -0,0 +1,230 @@
+"""This module provides the inverse of the accrual factor: the end date at
+which an accrual factor starting on a given date reaches a target, e.g. to
+search roll dates or calibrate tenors.
+
+The accrual factor of most conventions is a non-decreasing function of the
+end date, and the end date is found by bisection over date ordinals. The
+conventions whose accrual factor has a simple structure are solved directly:
+
+* ACT/360, ACT/365 Fixed and ACT/365 L are linear in the number of days;
+* ACT/365 A and NL/365 are within one day per leap day of the ACT/365
+  Fixed solution, which is a lower bound of the end date;
+* ACT/ACT ISDA counts exactly one per whole calendar year, so only the
+  fractions of the first and last years have to be solved.
+
+"""
+from datetime import date
+from math import ceil, floor
+
+from . import conventions, registry
+
+_LINEAR = (conventions.DCCACT360, conventions.DCCACT365Fixed, conventions.DCCACT365L)
+_LEAP_ADJUSTED = (conventions.DCCACT365A, conventions.DCCNL365)
+_MAX_ORDINAL = date.max.toordinal()
+
+
+def end_date(convention, date_beg, factor, *args):
+    r"""Find the earliest end date at which the accrual factor reaches a
+    target.
+
+    Parameters
+    ----------
+    convention : type or str
+        A day count convention class, or a name registered in
+        :py:mod:`daycountconventions.registry`.
+    date_beg : datetime.date
+        The beginning date considered when computing accrual factor.
+    factor : float
+        The target accrual factor, not negative.
+    *args
+        The further arguments of the ``year_fraction`` method of the
+        convention, e.g. the ``termination_date`` of
+        :py:class:`daycountconventions.conventions.DCC30E360ISDA`, or the
+        coupon end date and coupon type of
+        :py:class:`daycountconventions.conventions.DCCACT365L`.
+
+    Returns
+    -------
+    datetime.date
+        The earliest date ``date_end``, not before ``date_beg``, such that
+        ``convention.year_fraction(date_beg, date_end, *args) >= factor``.
+        When ``factor`` was itself computed as the accrual factor of some
+        end date, that end date or an earlier date with the same accrual
+        factor is returned.
+
+    Raises
+    ------
+    ValueError
+        If the target is negative, or is not reached within the range of
+        dates, calendar or schedule.
+
+    """
+    if isinstance(convention, str):
+        convention = registry.resolve(convention)
+    if factor < 0:
+        raise ValueError('The target accrual factor must not be negative')
+    first = date_beg.toordinal()
+    last = _last_ordinal(convention, args)
+
+    def accrual_factor(ordinal):
+        return convention.year_fraction(date_beg, date.fromordinal(ordinal), *args)
+
+    if accrual_factor(first) >= factor:
+        # Rolling the 31st makes the 30E+/360 ISDA factor positive at first.
+        return date_beg
+    if convention in _LINEAR:
+        ordinal = _refine(accrual_factor, first + int(ceil(factor / accrual_factor(first + 1))), factor, first, last)
+    elif convention in _LEAP_ADJUSTED:
+        # No end date before the ACT/365 Fixed solution reaches the target.
+        ordinal = min(first + int(ceil(factor * 365.)), last)
+        ordinal = _refine(lambda o: (o - first) / 365., ordinal, factor, first, last)
+        while accrual_factor(ordinal) < factor:
+            ordinal = _next(ordinal, factor, last)
+    elif convention is conventions.DCCACTACTISDA:
+        ordinal = _refine(accrual_factor, _act_act_isda_estimate(date_beg, factor), factor, first, last)
+    else:
+        ordinal = _bisect(accrual_factor, factor, first, last)
+    return date.fromordinal(ordinal)
+
+
+def end_dates(convention, starts, factors, **kwargs):
+    r"""Find the earliest end dates at which the accrual factors of many
+    beginning dates reach their targets.
+
+    The end dates are found by bisection over date ordinals, evaluating the
+    accrual factors of all beginning dates at once with
+    :py:func:`daycountconventions.batch.accrual_factors`; ACT/365 A and
+    NL/365 are solved from their ACT/365 Fixed lower bound instead.
+
+    Parameters
+    ----------
+    convention : type or str
+        A day count convention class, or a name registered in
+        :py:mod:`daycountconventions.registry`.
+    starts : array_like
+        The beginning dates, convertible to ``datetime64[D]``.
+    factors : array_like
+        The target accrual factors, not negative.
+    **kwargs
+        The further arguments of
+        :py:func:`daycountconventions.batch.accrual_factors`, such as
+        ``termination_date`` or ``calendar``.
+
+    Returns
+    -------
+    numpy.ndarray
+        The ``datetime64[D]`` end dates, identical to the results of
+        :py:func:`end_date`, with the broadcast shape of the inputs.
+
+    Raises
+    ------
+    ValueError
+        If a target is negative, or is not reached within the range of
+        dates, calendar or schedule.
+
+    """
+    import numpy as np
+    from .batch import _EPOCH_ORDINAL, _to_ordinals, accrual_factors
+
+    if isinstance(convention, str):
+        convention = registry.resolve(convention)
+    starts = np.asarray(starts, dtype='datetime64[D]')
+    factors = np.asarray(factors, dtype=np.float64)
+    starts, factors = np.broadcast_arrays(starts, factors)
+    if np.any(factors < 0):
+        raise ValueError('The target accrual factor must not be negative')
+    first = _to_ordinals(starts)
+    last = _last_ordinal(convention, (kwargs.get('calendar'), kwargs.get('schedule')))
+
+    def accrual_factor(ordinals):
+        return accrual_factors(convention, starts, (ordinals - _EPOCH_ORDINAL).astype('datetime64[D]'), **kwargs)
+
+    if convention in _LEAP_ADJUSTED:
+        ordinals = np.minimum(first + np.ceil(factors * 365.).astype(np.int64), last)
+        ordinals -= (ordinals > first) & ((ordinals - 1 - first) / 365. >= factors)
+        ordinals += (ordinals - first) / 365. < factors
+        while True:
+            short = accrual_factor(ordinals) < factors
+            if not short.any():
+                break
+            if np.any(short & (ordinals >= last)):
+                raise ValueError('The target accrual factor is not reached by {}'.format(date.fromordinal(last)))
+            ordinals += short
+        return (ordinals - _EPOCH_ORDINAL).astype('datetime64[D]')
+
+    # Bisection keeping accrual_factor(low) < factors <= accrual_factor(high),
+    # after doubling the bracket until it contains the target.
+    reached = accrual_factor(first) >= factors
+    low = first.copy()
+    high = np.minimum(first + np.ceil(factors * 366.).astype(np.int64) + 1, last)
+    while True:
+        short = accrual_factor(high) < factors
+        if not short.any():
+            break
+        if np.any(short & (high >= last)):
+            raise ValueError('The target accrual factor is not reached by {}'.format(date.fromordinal(last)))
+        low = np.where(short, high, low)
+        high = np.where(short, np.minimum(first + 2 * (high - first), last), high)
+    high = np.where(reached, first + 1, high)
+    while np.any(high - low > 1):
+        middle = low + (high - low) // 2
+        above = accrual_factor(middle) >= factors
+        high = np.where(above, middle, high)
+        low = np.where(above, low, middle)
+    return (np.where(reached, first, high) - _EPOCH_ORDINAL).astype('datetime64[D]')
+
+
+def _last_ordinal(convention, args):
+    # The last ordinal at which the accrual factor can be computed.
+    if convention is conventions.DCCBusiness252 and args and args[0] is not None:
+        return args[0]._last
+    if convention is conventions.DCCACTACTICMA and args and args[-1] is not None:
+        return args[-1]._boundaries[-1]
+    return _MAX_ORDINAL
+
+
+def _next(ordinal, factor, last):
+    if ordinal >= last:
+        raise ValueError('The target accrual factor {} is not reached by {}'.format(factor, date.fromordinal(last)))
+    return ordinal + 1
+
+
+def _refine(accrual_factor, ordinal, factor, first, last):
+    # Move an estimate of the solution of a non-decreasing accrual factor to
+    # the earliest ordinal reaching the target.
+    ordinal = max(first, min(ordinal, last))
+    while ordinal > first and accrual_factor(ordinal - 1) >= factor:
+        ordinal -= 1
+    while accrual_factor(ordinal) < factor:
+        ordinal = _next(ordinal, factor, last)
+    return ordinal
+
+
+def _bisect(accrual_factor, factor, first, last):
+    low, high = first, min(first + int(ceil(factor * 366.)) + 1, last)
+    while accrual_factor(high) < factor:
+        if high >= last:
+            raise ValueError('The target accrual factor {} is not reached by {}'.format(
+                factor, date.fromordinal(last)))
+        low, high = high, min(first + 2 * (high - first), last)
+    while high - low > 1:
+        middle = (low + high) // 2
+        if accrual_factor(middle) >= factor:
+            high = middle
+        else:
+            low = middle
+    return high
+
+
+def _act_act_isda_estimate(date_beg, factor):
+    # Each whole calendar year counts exactly one.
+    year = date_beg.year
+    first_year = (date(year + 1, 1, 1) - date(year, 1, 1)).days
+    remaining = factor - (date(year + 1, 1, 1).toordinal() - date_beg.toordinal()) / float(first_year)
+    if remaining <= 0:
+        return date_beg.toordinal() + int(ceil(factor * first_year))
+    year += 1 + int(floor(remaining))
+    if year > date.max.year:
+        return _MAX_ORDINAL
+    days = (date(year + 1, 1, 1) - date(year, 1, 1)).days if year < date.max.year else 365
+    return date(year, 1, 1).toordinal() + int(ceil((remaining - floor(remaining)) * days))
@@ -0,0 +1,261 @@
+"""This module provides a differential test harness comparing the optimized
+computation paths of the day count conventions with the reference
+implementations of :py:mod:`daycountconventions.reference`.
+
+Three paths are checked for every date pair:
+
+* ``accrual_factor``: the property of an instance of the convention;
+* ``year_fraction``: the class method of the convention;
+* ``batch``: :py:func:`daycountconventions.batch.accrual_factors`, checked
+  only if NumPy is installed.
+
+The date pairs are either all pairs of a window of dates
+(:py:func:`exhaustive_check`) or pairs drawn at random from it
+(:py:func:`randomized_check`), and the first pair on which a path disagrees
+with the reference is reported.
+
+"""
+import random
+from collections import namedtuple
+from datetime import date
+
+from . import conventions, registry
+from .reference import REFERENCES
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+PATHS = ('accrual_factor', 'year_fraction', 'batch')
+
+# The keyword arguments of batch.accrual_factors matching the further
+# arguments of the year_fraction method of each convention.
+_BATCH_KEYWORDS = {
+    conventions.DCC30E360ISDA: ('termination_date',),
+    conventions.DCCACT365L: ('coupon_end', 'coupon_type'),
+    conventions.DCCBusiness252: ('calendar',),
+    conventions.DCCACTACTICMA: ('schedule',),
+}
+
+
+class Mismatch(namedtuple('Mismatch', ['convention', 'path', 'date_beg', 'date_end', 'arguments', 'expected',
+                                       'actual'])):
+    r"""A date pair on which a computation path disagrees with the reference
+    implementation.
+
+    Attributes
+    ----------
+    convention : type
+        The day count convention class.
+    path : str
+        The computation path, one of :py:data:`PATHS`.
+    date_beg, date_end : datetime.date
+        The date pair.
+    arguments : tuple
+        The further arguments of the convention.
+    expected : float
+        The accrual factor of the reference implementation.
+    actual : float
+        The accrual factor of the computation path.
+
+    """
+    __slots__ = ()
+
+    def __str__(self):
+        return '{} ({}) from {} to {}{}: expected {!r}, got {!r}'.format(
+            registry.canonical_name(self.convention), self.path, self.date_beg, self.date_end,
+            ''.join(', {}'.format(argument) for argument in self.arguments), self.expected, self.actual)
+
+
+def differential_check(convention, pairs, arguments=(), paths=None, tolerance=0., chunk_size=10000):
+    r"""Compare the computation paths of a convention with its reference
+    implementation on date pairs.
+
+    Parameters
+    ----------
+    convention : type or str
+        A day count convention class, or a name registered in
+        :py:mod:`daycountconventions.registry`.
+    pairs : iterable of tuple
+        The ``(date_beg, date_end)`` pairs of ``datetime.date``, with
+        ``date_beg`` not after ``date_end``.
+    arguments : tuple or callable
+        The further arguments of the ``year_fraction`` method of the
+        convention, e.g. ``(termination_date,)`` for
+        :py:class:`daycountconventions.conventions.DCC30E360ISDA`, or a
+        function of ``date_beg`` and ``date_end`` returning them for each
+        pair (The default is no argument).
+    paths : sequence of str, optional
+        The computation paths to check (The default is all paths of
+        :py:data:`PATHS`, without ``batch`` if NumPy is not installed).
+    tolerance : float
+        The largest absolute difference accepted between a path and the
+        reference (The default is 0, i.e. identical results). The ACT/ACT
+        ICMA reference adds the periods one by one, and may differ from the
+        optimized paths in the last bit.
+    chunk_size : int
+        The number of pairs computed at once by the batch path.
+
+    Returns
+    -------
+    Mismatch or None
+        The first mismatch, in the order of the pairs and then of the paths,
+        or None if all paths agree with the reference on all pairs.
+
+    """
+    if isinstance(convention, str):
+        convention = registry.resolve(convention)
+    if paths is None:
+        paths = PATHS if numpy is not None else PATHS[:-1]
+    unknown = set(paths) - set(PATHS)
+    if unknown:
+        raise ValueError('Unknown computation paths: {}'.format(', '.join(sorted(unknown))))
+    if chunk_size <= 0:
+        raise ValueError('The parameter "chunk_size" must be positive')
+    reference = REFERENCES[convention]
+    pairs = iter(pairs)
+    while True:
+        chunk = [pair for _, pair in zip(range(chunk_size), pairs)]
+        if not chunk:
+            return None
+        rows = [tuple(arguments(date_beg, date_end)) if callable(arguments) else tuple(arguments)
+                for date_beg, date_end in chunk]
+        batch_factors = _batch_factors(convention, chunk, rows) if 'batch' in paths else None
+        for index, ((date_beg, date_end), args) in enumerate(zip(chunk, rows)):
+            expected = reference(date_beg, date_end, *args)
+            for path in paths:
+                if path == 'accrual_factor':
+                    actual = convention(date_beg, date_end, *args).accrual_factor
+                elif path == 'year_fraction':
+                    actual = convention.year_fraction(date_beg, date_end, *args)
+                else:
+                    actual = float(batch_factors[index])
+                if not abs(actual - expected) <= tolerance:
+                    return Mismatch(convention, path, date_beg, date_end, args, expected, actual)
+
+
+def exhaustive_check(convention, first, last, max_days=None, arguments=(), **options):
+    r"""Compare the computation paths of a convention with its reference
+    implementation on all date pairs of a window.
+
+    Parameters
+    ----------
+    convention : type or str
+        See :py:func:`differential_check`.
+    first, last : datetime.date
+        The first and last dates of the window.
+    max_days : int, optional
+        The largest number of days between the dates of a pair (The default
+        is the length of the window).
+    arguments : tuple or callable
+        See :py:func:`differential_check`.
+    **options
+        The further options of :py:func:`differential_check`.
+
+    Returns
+    -------
+    Mismatch or None
+
+    """
+    return differential_check(convention, exhaustive_pairs(first, last, max_days), arguments, **options)
+
+
+def randomized_check(convention, first, last, size, max_days=None, seed=None, arguments=(), **options):
+    r"""Compare the computation paths of a convention with its reference
+    implementation on date pairs drawn at random from a window.
+
+    Parameters
+    ----------
+    convention : type or str
+        See :py:func:`differential_check`.
+    first, last : datetime.date
+        The first and last dates of the window.
+    size : int
+        The number of pairs.
+    max_days : int, optional
+        The largest number of days between the dates of a pair (The default
+        is the length of the window).
+    seed : int, optional
+        The seed of the random pairs, to reproduce a run.
+    arguments : tuple or callable
+        See :py:func:`differential_check`.
+    **options
+        The further options of :py:func:`differential_check`.
+
+    Returns
+    -------
+    Mismatch or None
+
+    """
+    return differential_check(convention, random_pairs(first, last, size, max_days, seed), arguments, **options)
+
+
+def exhaustive_pairs(first, last, max_days=None):
+    r"""Generate all date pairs of a window.
+
+    Parameters
+    ----------
+    first, last : datetime.date
+        The first and last dates of the window.
+    max_days : int, optional
+        The largest number of days between the dates of a pair.
+
+    Yields
+    ------
+    tuple of datetime.date
+        The pairs ``(date_beg, date_end)`` with
+        ``first <= date_beg <= date_end <= last``, by increasing
+        ``date_beg`` then ``date_end``.
+
+    """
+    first, last = first.toordinal(), last.toordinal()
+    span = last - first if max_days is None else max_days
+    for ordinal_1 in range(first, last + 1):
+        date_beg = date.fromordinal(ordinal_1)
+        for ordinal_2 in range(ordinal_1, min(ordinal_1 + span, last) + 1):
+            yield date_beg, date.fromordinal(ordinal_2)
+
+
+def random_pairs(first, last, size, max_days=None, seed=None):
+    r"""Generate date pairs drawn uniformly from a window.
+
+    See :py:func:`randomized_check` for the parameters.
+
+    Yields
+    ------
+    tuple of datetime.date
+        The pairs ``(date_beg, date_end)`` with
+        ``first <= date_beg <= date_end <= last``.
+
+    """
+    random_state = random.Random(seed)
+    first, last = first.toordinal(), last.toordinal()
+    span = last - first if max_days is None else max_days
+    for _ in range(size):
+        ordinal_1 = random_state.randint(first, last)
+        ordinal_2 = random_state.randint(ordinal_1, min(ordinal_1 + span, last))
+        yield date.fromordinal(ordinal_1), date.fromordinal(ordinal_2)
+
+
+def _batch_factors(convention, pairs, rows):
+    from .batch import accrual_factors
+
+    keywords = _BATCH_KEYWORDS.get(convention, ())
+    factors = numpy.empty(len(pairs), dtype=numpy.float64)
+    # The batch path takes one calendar, schedule or coupon type per call,
+    # so the pairs are grouped on the arguments which are not dates.
+    groups = {}
+    for index, args in enumerate(rows):
+        key = tuple(None if isinstance(arg, date) else arg for arg in args)
+        groups.setdefault(key, []).append(index)
+    for key, indices in groups.items():
+        kwargs = {}
+        for position, (name, value) in enumerate(zip(keywords, key)):
+            if value is None:
+                value = numpy.array([rows[index][position] for index in indices], dtype='datetime64[D]')
+            kwargs[name] = value
+        starts = numpy.array([pairs[index][0] for index in indices], dtype='datetime64[D]')
+        ends = numpy.array([pairs[index][1] for index in indices], dtype='datetime64[D]')
+        factors[indices] = accrual_factors(convention, starts, ends, **kwargs)
+    return factors
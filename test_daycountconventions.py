@@ -1,6 +1,34 @@
+import asyncio
+import csv
+import json
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
 import unittest
-from daycountconventions import conventions
-from datetime import datetime
+import daycountconventions
+from daycountconventions import (accrual, cache, calendars, conventions, instrumentation, reference, registry, schedule,
+                                 solver, validation)
+from datetime import date, datetime, timedelta
+
+try:
+    import numpy as np
+    from daycountconventions import batch, cashflows, columnar, parallel, parsing, pipeline, scenarios, server
+    from daycountconventions.__main__ import main
+except ImportError:
+    np = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+try:
+    import pandas as pd
+    import daycountconventions.accessor
+except ImportError:
+    pd = None
 
 
 class DayCountConventionTestCase(unittest.TestCase):
@@ -81,8 +109,1106 @@ class DayCountConventionTestCase(unittest.TestCase):
             conv = conventions.DCCACTACTISDA(date_tuple[0], date_tuple[1])
             self.assertAlmostEqual(conv.accrual_factor, result[idx], places=5)
 
+    def test_DCCBusiness252(self):
+        calendar = calendars.HolidayCalendar([datetime.strptime(holiday, '%Y-%m-%d')
+                                              for holiday in ('2017-02-27', '2017-02-28', '2017-04-14')])
+        result = [52. / 252., 41. / 252., 19. / 252.]
+        for idx, date_tuple in enumerate(self.test_data):
+            conv = conventions.DCCBusiness252(date_tuple[0], date_tuple[1], calendar)
+            self.assertAlmostEqual(conv.accrual_factor, result[idx], places=5)
+        with self.assertRaises(ValueError):
+            conventions.DCCBusiness252.year_fraction(self.test_data[0][0], datetime(2018, 1, 1), calendar)
+
+    def test_DCCACTACTISDA_year_boundaries(self):
+        test_data = [('2010-12-30', '2011-01-02'), ('2011-12-30', '2012-01-02'), ('2011-12-30', '2041-01-02'),
+                     ('2012-01-02', '2011-12-30')]
+        result = [3. / 365., 2. / 365. + 1. / 366., 29. + 3. / 365., -3. / 366.]
+        for idx, date_tuple in enumerate(test_data):
+            conv = conventions.DCCACTACTISDA(datetime.strptime(date_tuple[0], '%Y-%m-%d'),
+                                             datetime.strptime(date_tuple[1], '%Y-%m-%d'))
+            self.assertAlmostEqual(conv.accrual_factor, result[idx], places=10)
+
+    def test_accrual_factor_is_idempotent(self):
+        termination_date = datetime.strptime('2017-04-01', '%Y-%m-%d')
+        for date_tuple in self.test_data:
+            for conv in (conventions.DCC30360(date_tuple[0], date_tuple[1]),
+                         conventions.DCC30E360(date_tuple[0], date_tuple[1]),
+                         conventions.DCC30E360ISDA(date_tuple[0], date_tuple[1], termination_date),
+                         conventions.DCC30EP360ISDA(date_tuple[0], date_tuple[1])):
+                self.assertEqual(conv.accrual_factor, conv.accrual_factor)
+
+    def test_immutable(self):
+        date_3 = datetime.strptime('2017-04-01', '%Y-%m-%d')
+        for conv in (conventions.DCC30360(self.test_data[0][0], self.test_data[0][1]),
+                     conventions.DCC30E360ISDA(self.test_data[0][0], self.test_data[0][1], date_3),
+                     conventions.DCCACT365L(self.test_data[0][0], self.test_data[0][1], date_3)):
+            self.assertFalse(hasattr(conv, '__dict__'))
+            with self.assertRaises(AttributeError):
+                conv._date_1 = date_3
+            with self.assertRaises(AttributeError):
+                del conv._date_2
+            copy = pickle.loads(pickle.dumps(conv))
+            self.assertEqual(copy.accrual_factor, conv.accrual_factor)
+
+    def test_year_fraction(self):
+        date_3 = datetime.strptime('2017-04-01', '%Y-%m-%d')
+        for date_tuple in self.test_data:
+            for convention in (conventions.DCC30360, conventions.DCC30E360, conventions.DCC30EP360ISDA,
+                               conventions.DCCACT360, conventions.DCCACT365Fixed, conventions.DCCACT365A,
+                               conventions.DCCNL365, conventions.DCCACTACTISDA):
+                self.assertEqual(convention.year_fraction(date_tuple[0], date_tuple[1]),
+                                 convention(date_tuple[0], date_tuple[1]).accrual_factor)
+            self.assertEqual(conventions.DCC30E360ISDA.year_fraction(date_tuple[0], date_tuple[1], date_3),
+                             conventions.DCC30E360ISDA(date_tuple[0], date_tuple[1], date_3).accrual_factor)
+            self.assertEqual(conventions.DCCACT365L.year_fraction(date_tuple[0], date_tuple[1], date_3, 'annual'),
+                             conventions.DCCACT365L(date_tuple[0], date_tuple[1], date_3, 'annual').accrual_factor)
+            with self.assertRaises(ValueError):
+                conventions.DCCACT365L.year_fraction(date_tuple[0], date_tuple[1], date_3, 'error_input')
+
+
+class RegistryTestCase(unittest.TestCase):
+
+    def test_canonical_names(self):
+        date_1 = datetime.strptime('2017-01-15', '%Y-%m-%d')
+        date_2 = datetime.strptime('2017-03-31', '%Y-%m-%d')
+        for name in registry.available_conventions():
+            convention = registry.resolve(name)
+            self.assertEqual(registry.canonical_name(convention), name)
+            if convention in (conventions.DCC30E360ISDA, conventions.DCCACT365L):
+                conv = convention(date_1, date_2, date_2)
+            elif convention is conventions.DCCBusiness252:
+                conv = convention(date_1, date_2, calendars.HolidayCalendar([date_1, date_2]))
+            elif convention is conventions.DCCACTACTICMA:
+                conv = convention(date_1, date_2, schedule.CouponSchedule([date_1, date_2], 4))
+            else:
+                conv = convention(date_1, date_2)
+            self.assertEqual(conv.convention_name, name)
+
+    def test_aliases(self):
+        self.assertIs(registry.resolve('Bond basis'), conventions.DCC30360)
+        self.assertIs(registry.resolve('  bond   BASIS '), conventions.DCC30360)
+        self.assertIs(registry.resolve('Eurobond basis'), conventions.DCC30E360)
+        self.assertIs(registry.resolve('30E+/360'), conventions.DCC30EP360ISDA)
+        self.assertIs(registry.resolve('Money Market basis'), conventions.DCCACT360)
+        self.assertIs(registry.resolve('act/365 fixed'), conventions.DCCACT365Fixed)
+
+    def test_unknown_name(self):
+        with self.assertRaises(ValueError):
+            registry.resolve('ACT/ACT ICMA 2')
+        with self.assertRaises(ValueError):
+            registry.register(conventions.DCCACT365Fixed, 'ACT/360')
+
+
+class HolidayCalendarTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.holiday_file = tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False)
+        self.holiday_file.write('# Carnival\n2017-02-27\n2017-02-28\n\n2017-04-14  # Good Friday\n')
+        self.holiday_file.close()
+
+    def tearDown(self):
+        os.remove(self.holiday_file.name)
+
+    def test_from_file(self):
+        calendar = calendars.HolidayCalendar.from_file(self.holiday_file.name)
+        self.assertEqual(calendar.start, datetime(2017, 1, 1).date())
+        self.assertEqual(calendar.end, datetime(2017, 12, 31).date())
+        self.assertEqual(len(calendar.holidays), 3)
+        self.assertFalse(calendar.is_business_day(datetime(2017, 2, 27)))
+        self.assertFalse(calendar.is_business_day(datetime(2017, 3, 4)))
+        self.assertTrue(calendar.is_business_day(datetime(2017, 3, 1)))
+        self.assertEqual(calendar.business_days(datetime(2017, 2, 24), datetime(2017, 3, 2)), 2)
+        self.assertEqual(calendar.business_days(datetime(2017, 3, 2), datetime(2017, 2, 24)), -2)
+        self.assertEqual(calendar.business_days(datetime(2017, 1, 1), datetime(2017, 12, 31)), 257)
+
+    def test_invalid_input(self):
+        with open(self.holiday_file.name, 'a') as holiday_file:
+            holiday_file.write('2017-02-30\n')
+        with self.assertRaises(ValueError):
+            calendars.HolidayCalendar.from_file(self.holiday_file.name)
+        with self.assertRaises(ValueError):
+            calendars.HolidayCalendar([])
+        calendar = calendars.HolidayCalendar([], start=datetime(2017, 1, 1), end=datetime(2017, 1, 31))
+        with self.assertRaises(ValueError):
+            calendar.business_days(datetime(2017, 1, 1), datetime(2017, 2, 1))
+
+
+class CouponScheduleTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.schedule = schedule.CouponSchedule([datetime.strptime(coupon_date, '%Y-%m-%d') for coupon_date in
+                                                 ('2016-01-15', '2016-07-15', '2017-01-15', '2017-07-15')], 2)
+        self.test_data = []
+        self.test_data.append((datetime.strptime('2016-01-15', '%Y-%m-%d'), datetime.strptime('2016-07-15', '%Y-%m-%d')))
+        self.test_data.append((datetime.strptime('2016-03-01', '%Y-%m-%d'), datetime.strptime('2016-05-01', '%Y-%m-%d')))
+        self.test_data.append((datetime.strptime('2016-06-15', '%Y-%m-%d'), datetime.strptime('2016-08-15', '%Y-%m-%d')))
+        self.test_data.append((datetime.strptime('2016-01-15', '%Y-%m-%d'), datetime.strptime('2017-07-15', '%Y-%m-%d')))
+        self.test_data.append((datetime.strptime('2017-07-15', '%Y-%m-%d'), datetime.strptime('2017-07-15', '%Y-%m-%d')))
+        self.result = [0.5, 61. / 364., 30. / 364. + 31. / 368., 1.5, 0.]
+
+    def tearDown(self):
+        pass
+
+    def test_DCCACTACTICMA(self):
+        for idx, date_tuple in enumerate(self.test_data):
+            conv = conventions.DCCACTACTICMA(date_tuple[0], date_tuple[1], self.schedule)
+            self.assertAlmostEqual(conv.accrual_factor, self.result[idx], places=10)
+            self.assertEqual(self.schedule.accrual_factor(date_tuple[0], date_tuple[1]), conv.accrual_factor)
+
+    def test_reference_period(self):
+        self.assertEqual(self.schedule.reference_period(datetime(2016, 7, 15)),
+                         (datetime(2016, 7, 15).date(), datetime(2017, 1, 15).date()))
+        self.assertEqual(self.schedule.reference_period(datetime(2017, 7, 14)),
+                         (datetime(2017, 1, 15).date(), datetime(2017, 7, 15).date()))
+        with self.assertRaises(ValueError):
+            self.schedule.reference_period(datetime(2017, 7, 15))
+
+    def test_invalid_input(self):
+        with self.assertRaises(ValueError):
+            self.schedule.accrual_factor(datetime(2016, 1, 14), datetime(2016, 3, 1))
+        with self.assertRaises(ValueError):
+            self.schedule.accrual_factor(datetime(2016, 3, 1), datetime(2016, 2, 1))
+        with self.assertRaises(ValueError):
+            schedule.CouponSchedule([datetime(2016, 1, 15), datetime(2016, 1, 15)], 2)
+
+    def test_accrual_periods(self):
+        effective_date, termination_date = datetime(2017, 1, 10), datetime(2018, 3, 31)
+        periods = list(schedule.accrual_periods(effective_date, termination_date, 4, 'ACT/ACT ICMA',
+                                                end_of_month=True))
+        self.assertEqual([period[1] for period in periods],
+                         [datetime(2017, 3, 31).date(), datetime(2017, 6, 30).date(), datetime(2017, 9, 30).date(),
+                          datetime(2017, 12, 31).date(), datetime(2018, 3, 31).date()])
+        self.assertEqual([period[2] for period in periods], [80. / 360., 0.25, 0.25, 0.25, 0.25])
+        periods = list(schedule.accrual_periods(effective_date, termination_date, 4, conventions.DCC30360,
+                                                stub='long_back'))
+        self.assertEqual([period[0] for period in periods],
+                         [datetime(2017, 1, 10).date(), datetime(2017, 4, 10).date(), datetime(2017, 7, 10).date(),
+                          datetime(2017, 10, 10).date()])
+        self.assertEqual(periods[-1][2], 171. / 360.)
+        self.assertEqual(schedule.CouponSchedule.generate(effective_date, termination_date, 4, 'long_front').dates[0],
+                         datetime(2016, 12, 31).date())
+
+    def test_accrual_periods_termination_date(self):
+        periods = list(schedule.accrual_periods(datetime(2016, 8, 31), datetime(2017, 2, 28), 2,
+                                                conventions.DCC30E360ISDA, end_of_month=True))
+        self.assertEqual(periods, [(datetime(2016, 8, 31).date(), datetime(2017, 2, 28).date(), 178. / 360.)])
+        periods = list(schedule.accrual_periods(datetime(2016, 8, 31), datetime(2017, 8, 31), 2,
+                                                conventions.DCC30E360ISDA, end_of_month=True))
+        self.assertEqual([period[2] for period in periods], [0.5, 0.5])
+        with self.assertRaises(ValueError):
+            list(schedule.accrual_periods(datetime(2016, 8, 31), datetime(2017, 8, 31), 5, conventions.DCC30360))
+        with self.assertRaises(ValueError):
+            list(schedule.accrual_periods(datetime(2016, 8, 31), datetime(2017, 8, 31), 2, conventions.DCC30360,
+                                          stub='middle'))
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_accrual_period_arrays(self):
+        for convention in ('ACT/ACT ICMA', 'ACT/365 L', '30E/360 ISDA', 'ACT/ACT ISDA'):
+            for stub in schedule.STUB_TYPES:
+                for frequency in (1, 2, 12):
+                    periods = list(schedule.accrual_periods(datetime(2015, 11, 30), datetime(2030, 2, 28), frequency,
+                                                            convention, stub=stub, end_of_month=True))
+                    starts, ends, factors = schedule.accrual_period_arrays(datetime(2015, 11, 30),
+                                                                           datetime(2030, 2, 28), frequency,
+                                                                           convention, stub=stub, end_of_month=True)
+                    self.assertEqual(starts.tolist(), [period[0] for period in periods])
+                    self.assertEqual(ends.tolist(), [period[1] for period in periods])
+                    self.assertEqual(factors.tolist(), [period[2] for period in periods])
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_accrual_factors(self):
+        starts = np.array([date_tuple[0] for date_tuple in self.test_data], dtype='datetime64[D]')
+        ends = np.array([date_tuple[1] for date_tuple in self.test_data], dtype='datetime64[D]')
+        result = self.schedule.accrual_factors(starts, ends)
+        for idx, date_tuple in enumerate(self.test_data):
+            self.assertEqual(result[idx], self.schedule.accrual_factor(date_tuple[0], date_tuple[1]))
+        with self.assertRaises(ValueError):
+            self.schedule.accrual_factors(ends, starts)
+
+
+class AccrualCacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = cache.AccrualCache(maxsize=2)
+        self.date_1 = datetime.strptime('2017-01-31', '%Y-%m-%d')
+        self.date_2 = datetime.strptime('2017-02-28', '%Y-%m-%d')
+        self.date_3 = datetime.strptime('2017-03-31', '%Y-%m-%d')
+
+    def tearDown(self):
+        pass
+
+    def test_statistics(self):
+        self.assertEqual(self.cache.year_fraction('30/360', self.date_1, self.date_3), 60. / 360.)
+        self.assertEqual(self.cache.year_fraction(conventions.DCC30360, self.date_1, self.date_3), 60. / 360.)
+        self.assertEqual(self.cache.year_fraction(conventions.DCCACT360, self.date_1, self.date_3), 59. / 360.)
+        self.assertEqual(self.cache.info(), {'hits': 1, 'misses': 2, 'evictions': 0, 'size': 2, 'maxsize': 2})
+        self.cache.year_fraction(conventions.DCC30360, self.date_1, self.date_3)
+        self.cache.year_fraction(conventions.DCCACT365Fixed, self.date_1, self.date_3)
+        self.assertEqual(self.cache.info(), {'hits': 2, 'misses': 3, 'evictions': 1, 'size': 2, 'maxsize': 2})
+        self.cache.year_fraction(conventions.DCC30360, self.date_1, self.date_3)
+        self.assertEqual(self.cache.info()['hits'], 3)
+        self.cache.clear()
+        self.assertEqual(self.cache.info(), {'hits': 0, 'misses': 0, 'evictions': 0, 'size': 0, 'maxsize': 2})
+
+    def test_extra_arguments(self):
+        self.assertEqual(self.cache.year_fraction(conventions.DCC30E360ISDA, self.date_1, self.date_2, self.date_3),
+                         30. / 360.)
+        self.assertEqual(self.cache.year_fraction(conventions.DCC30E360ISDA, self.date_1, self.date_2, self.date_2),
+                         28. / 360.)
+        self.assertEqual(self.cache.year_fraction(conventions.DCCACT365L, self.date_1, self.date_2, self.date_3,
+                                                  'annual'), 28. / 365.)
+        self.assertEqual(self.cache.info()['misses'], 3)
+
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class BatchAccrualFactorTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.test_data = []
+        for beg in ('2015-12-31', '2016-01-31', '2016-02-28', '2016-02-29', '2017-01-15', '2019-12-31', '2099-02-28'):
+            date_beg = datetime.strptime(beg, '%Y-%m-%d')
+            for days in (-1, 0, 1, 28, 29, 30, 31, 59, 60, 181, 365, 366, 731, 1461, 10000):
+                self.test_data.append((date_beg, date_beg + timedelta(days=days)))
+        self.starts = np.array([date_tuple[0] for date_tuple in self.test_data], dtype='datetime64[D]')
+        self.ends = np.array([date_tuple[1] for date_tuple in self.test_data], dtype='datetime64[D]')
+
+    def tearDown(self):
+        pass
+
+    def test_two_date_conventions(self):
+        for convention in (conventions.DCC30360, conventions.DCC30E360, conventions.DCC30EP360ISDA,
+                           conventions.DCCACT360, conventions.DCCACT365Fixed, conventions.DCCACT365A,
+                           conventions.DCCNL365, conventions.DCCACTACTISDA):
+            result = batch.accrual_factors(convention, self.starts, self.ends)
+            self.assertEqual(result.dtype, np.float64)
+            for idx, date_tuple in enumerate(self.test_data):
+                self.assertEqual(result[idx], convention(date_tuple[0], date_tuple[1]).accrual_factor)
+
+    def test_DCC30E360ISDA(self):
+        termination_date = datetime.strptime('2016-02-29', '%Y-%m-%d')
+        result = batch.accrual_factors(conventions.DCC30E360ISDA, self.starts, self.ends,
+                                       termination_date=termination_date)
+        for idx, date_tuple in enumerate(self.test_data):
+            conv = conventions.DCC30E360ISDA(date_tuple[0], date_tuple[1], termination_date)
+            self.assertEqual(result[idx], conv.accrual_factor)
+        with self.assertRaises(ValueError):
+            batch.accrual_factors(conventions.DCC30E360ISDA, self.starts, self.ends)
+
+    def test_DCCACT365L(self):
+        date_3 = self.ends + np.timedelta64(30, 'D')
+        for coupon_type in ('semi-annual', 'annual'):
+            result = batch.accrual_factors(conventions.DCCACT365L, self.starts, self.ends,
+                                           coupon_end=date_3, coupon_type=coupon_type)
+            for idx, date_tuple in enumerate(self.test_data):
+                conv = conventions.DCCACT365L(date_tuple[0], date_tuple[1], date_tuple[1] + timedelta(days=30),
+                                              coupon_type)
+                self.assertEqual(result[idx], conv.accrual_factor)
+        with self.assertRaises(ValueError):
+            batch.accrual_factors(conventions.DCCACT365L, self.starts, self.ends, coupon_end=date_3,
+                                  coupon_type='error_input')
+
+    def test_DCCBusiness252(self):
+        calendar = calendars.HolidayCalendar([datetime.strptime('2016-02-09', '%Y-%m-%d')],
+                                             start=datetime(2015, 1, 1), end=datetime(2130, 12, 31))
+        result = batch.accrual_factors(conventions.DCCBusiness252, self.starts, self.ends, calendar=calendar)
+        for idx, date_tuple in enumerate(self.test_data):
+            conv = conventions.DCCBusiness252(date_tuple[0], date_tuple[1], calendar)
+            self.assertEqual(result[idx], conv.accrual_factor)
+        with self.assertRaises(ValueError):
+            batch.accrual_factors(conventions.DCCBusiness252, self.starts, self.ends)
+        with self.assertRaises(ValueError):
+            batch.accrual_factors(conventions.DCCBusiness252, self.starts, self.ends + np.timedelta64(20000, 'D'),
+                                  calendar=calendar)
+
+    def test_convention_name(self):
+        self.assertTrue(np.array_equal(batch.accrual_factors('Bond basis', self.starts, self.ends),
+                                       batch.accrual_factors(conventions.DCC30360, self.starts, self.ends)))
+
+    def test_unsupported_convention(self):
+        with self.assertRaises(ValueError):
+            batch.accrual_factors(object, self.starts, self.ends)
+
+    def test_missing_dates(self):
+        ends = self.ends.copy()
+        ends[3] = np.datetime64('NaT')
+        with self.assertRaisesRegex(ValueError, '"ends" has a missing date \\(NaT\\) at index 3'):
+            batch.accrual_factors(conventions.DCCACT360, self.starts, ends)
+        with self.assertRaisesRegex(ValueError, '"coupon_end"'):
+            batch.accrual_factors(conventions.DCCACT365L, self.starts, self.ends, coupon_end=ends)
+
+    def test_accrual_factor_matrix(self):
+        calendar = calendars.HolidayCalendar([datetime.strptime('2016-02-09', '%Y-%m-%d')],
+                                             start=datetime(2015, 1, 1), end=datetime(2130, 12, 31))
+        options = {'termination_date': datetime(2016, 2, 29), 'coupon_end': self.ends + np.timedelta64(30, 'D'),
+                   'coupon_type': 'annual', 'calendar': calendar}
+        names = ('30/360', conventions.DCC30E360ISDA, 'ACT/365 L', conventions.DCCBusiness252, 'ACT/ACT ISDA')
+        result = batch.accrual_factor_matrix(names, self.starts, self.ends, **options)
+        self.assertEqual(result.shape, (len(self.test_data), len(names)))
+        for k, name in enumerate(names):
+            self.assertTrue(np.array_equal(result[:, k], batch.accrual_factors(name, self.starts, self.ends,
+                                                                               **options)))
+        self.assertEqual(batch.accrual_factor_matrix(['ACT/360'], self.starts[0], self.ends[0]).shape, (1,))
+        with self.assertRaises(ValueError):
+            batch.accrual_factor_matrix(['ACT/360', conventions.DCC30E360ISDA], self.starts, self.ends)
+        with self.assertRaises(ValueError):
+            batch.accrual_factor_matrix([object], self.starts, self.ends)
+
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class ParallelTestCase(unittest.TestCase):
+
+    def setUp(self):
+        random_state = np.random.RandomState(0)
+        self.starts = np.datetime64('1990-01-01') + random_state.randint(0, 20000, 5000)
+        self.ends = self.starts + random_state.randint(-100, 4000, 5000)
+
+    def tearDown(self):
+        pass
+
+    def test_parallel_accrual_factors(self):
+        for convention in ('ACT/ACT ISDA', '30/360', 'NL/365'):
+            result = parallel.parallel_accrual_factors(convention, self.starts, self.ends, workers=2, chunk_size=1234,
+                                                       min_parallel_size=0)
+            self.assertTrue(np.array_equal(result, batch.accrual_factors(convention, self.starts, self.ends)))
+        result = parallel.parallel_accrual_factors(conventions.DCC30E360ISDA, self.starts.reshape(50, 100),
+                                                   self.ends.reshape(50, 100), workers=2, chunk_size=999,
+                                                   min_parallel_size=0, termination_date=self.ends.reshape(50, 100))
+        self.assertEqual(result.shape, (50, 100))
+        self.assertTrue(np.array_equal(result.reshape(-1), batch.accrual_factors(
+            conventions.DCC30E360ISDA, self.starts, self.ends, termination_date=self.ends)))
+
+    def test_sequential_fallback(self):
+        result = parallel.parallel_accrual_factors('ACT/360', self.starts, self.ends)
+        self.assertTrue(np.array_equal(result, batch.accrual_factors('ACT/360', self.starts, self.ends)))
+        with self.assertRaises(ValueError):
+            parallel.parallel_accrual_factors('ACT/360', self.starts, self.ends, chunk_size=0)
+
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class PipelineTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.input_path = os.path.join(self.directory, 'input.csv')
+        with open(self.input_path, 'w') as input_file:
+            input_file.write('id,start,end,convention,termination_date\n'
+                             '1,2017-01-15,2017-03-31,30/360,2017-04-01\n'
+                             '2,2017-01-31,2017-02-28,30E/360 ISDA,2017-04-01\n'
+                             '3,2017-01-31,2017-03-31,ACT/360,\n'
+                             '4,2017-01-31,2017-02-28,Bond basis,\n'
+                             '5,2017-01-31,2017-02-28,30E/360 ISDA,2017-02-28\n')
+
+    def tearDown(self):
+        for name in os.listdir(self.directory):
+            os.remove(os.path.join(self.directory, name))
+        os.rmdir(self.directory)
+
+    def read_factors(self, path):
+        with open(path) as output_file:
+            rows = list(csv.DictReader(output_file))
+        return [float(row['accrual_factor']) for row in rows]
+
+    def test_convention_column(self):
+        output_path = os.path.join(self.directory, 'output.csv')
+        for chunk_size in (1, 2, 100):
+            self.assertEqual(pipeline.process_file(self.input_path, output_path, chunk_size=chunk_size), 5)
+            self.assertEqual(self.read_factors(output_path), [76. / 360., 30. / 360., 59. / 360., 28. / 360.,
+                                                              28. / 360.])
+
+    def test_fixed_convention(self):
+        output_path = os.path.join(self.directory, 'output.csv')
+        pipeline.process_file(self.input_path, output_path, convention='ACT/360', chunk_size=2)
+        self.assertEqual(self.read_factors(output_path), [75. / 360., 28. / 360., 59. / 360., 28. / 360., 28. / 360.])
+        with self.assertRaises(ValueError):
+            pipeline.process_file(self.input_path, output_path, start_column='date_beg')
+
+    def test_main(self):
+        output_path = os.path.join(self.directory, 'output.csv')
+        self.assertEqual(main([self.input_path, output_path, '--convention', 'ACT/365 Fixed']), 0)
+        self.assertEqual(self.read_factors(output_path)[0], 75. / 365.)
+        self.assertEqual(main([self.input_path, output_path, '--convention', 'ACT/366']), 1)
+
+    def test_missing_dates(self):
+        output_path = os.path.join(self.directory, 'output.csv')
+        with open(self.input_path, 'a') as input_file:
+            input_file.write('6,2017-01-31,,ACT/360,\n')
+        for chunk_size in (2, 100):
+            with self.assertRaisesRegex(ValueError, 'column "end" has a missing date in row 6 '):
+                pipeline.process_file(self.input_path, output_path, chunk_size=chunk_size)
+        self.assertEqual(main([self.input_path, output_path]), 1)
+
+    def test_row_width(self):
+        output_path = os.path.join(self.directory, 'output.csv')
+        with open(self.input_path, 'a') as input_file:
+            input_file.write('6,2017-01-31,2017-02-28,ACT/360\n')
+        for chunk_size in (2, 100):
+            with self.assertRaisesRegex(ValueError, 'Row 6 of .* has 4 fields, expected 5'):
+                pipeline.process_file(self.input_path, output_path, chunk_size=chunk_size)
+
+    @unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_parquet(self):
+        parquet_path = os.path.join(self.directory, 'output.parquet')
+        output_path = os.path.join(self.directory, 'output.csv')
+        pipeline.process_file(self.input_path, parquet_path, chunk_size=2)
+        pipeline.process_file(parquet_path, output_path, convention='ACT/360', chunk_size=3)
+        self.assertEqual(self.read_factors(output_path), [75. / 360., 28. / 360., 59. / 360., 28. / 360., 28. / 360.])
+
+
+class ValidationTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.calendar = calendars.HolidayCalendar([date(year, 12, 25) for year in range(1970, 2051)],
+                                                  start=date(1970, 1, 1), end=date(2050, 12, 31))
+        self.schedule = schedule.CouponSchedule.generate(date(1979, 11, 30), date(2041, 2, 28), 4, end_of_month=True)
+        self.cases = [
+            (conventions.DCC30360, ()),
+            (conventions.DCC30E360, ()),
+            # Alternating between a termination date on the end date and elsewhere.
+            (conventions.DCC30E360ISDA,
+             lambda date_beg, date_end: (date_end if date_end.day % 2 else date(2000, 2, 29),)),
+            (conventions.DCC30EP360ISDA, ()),
+            (conventions.DCCACT360, ()),
+            (conventions.DCCACT365Fixed, ()),
+            (conventions.DCCACT365L,
+             lambda date_beg, date_end: (date_end, 'annual' if date_beg.day % 2 else 'semi-annual')),
+            (conventions.DCCACT365A, ()),
+            (conventions.DCCNL365, ()),
+            (conventions.DCCACTACTISDA, ()),
+            (conventions.DCCBusiness252, (self.calendar,)),
+            (conventions.DCCACTACTICMA, (self.schedule,)),
+        ]
+
+    def options(self, convention):
+        # The ACT/ACT ICMA reference sums the periods in another order, and
+        # the BUS/252 reference counts the days one by one.
+        return {'tolerance': 1e-12 if convention is conventions.DCCACTACTICMA else 0.,
+                'max_days': 400 if convention is conventions.DCCBusiness252 else None}
+
+    def test_exhaustive(self):
+        # Month ends and February of a leap year, of a century year which is
+        # not a leap year, and of a common year.
+        # The calendar and schedule of each window cover it and a year around
+        # only, as the references go through all their dates.
+        for first, last in [(date(1999, 12, 1), date(2000, 3, 31)), (date(2099, 12, 1), date(2100, 3, 31)),
+                            (date(2016, 12, 1), date(2017, 3, 31))]:
+            window_arguments = {
+                conventions.DCCBusiness252: (calendars.HolidayCalendar(
+                    [date(year, 12, 25) for year in range(first.year - 1, last.year + 2)],
+                    start=date(first.year - 1, 1, 1), end=date(last.year + 1, 12, 31)),),
+                conventions.DCCACTACTICMA: (schedule.CouponSchedule.generate(
+                    date(first.year - 1, 11, 30), date(last.year + 1, 2, 28), 4, end_of_month=True),),
+            }
+            for convention, arguments in self.cases:
+                mismatch = validation.exhaustive_check(convention, first, last,
+                                                       arguments=window_arguments.get(convention, arguments),
+                                                       **self.options(convention))
+                self.assertIsNone(mismatch, str(mismatch))
+
+    def test_randomized(self):
+        for convention, arguments in self.cases:
+            mismatch = validation.randomized_check(convention, date(1980, 1, 1), date(2040, 12, 31), 3000, seed=1,
+                                                   arguments=arguments, **self.options(convention))
+            self.assertIsNone(mismatch, str(mismatch))
+
+    def test_first_mismatch(self):
+        references = dict(reference.REFERENCES)
+        references[conventions.DCC30360] = reference.thirty_e_360
+        original, validation.REFERENCES = validation.REFERENCES, references
+        try:
+            mismatch = validation.exhaustive_check('30/360', date(2000, 1, 1), date(2000, 12, 31))
+        finally:
+            validation.REFERENCES = original
+        self.assertEqual((mismatch.path, mismatch.date_beg, mismatch.date_end), ('accrual_factor', date(2000, 1, 1),
+                                                                                 date(2000, 1, 31)))
+        self.assertEqual((mismatch.expected, mismatch.actual), (29. / 360., 30. / 360.))
+        self.assertRaises(ValueError, validation.differential_check, '30/360', [], paths=['scalar'])
+
+
+class SolverTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.calendar = calendars.HolidayCalendar([date(2017, 12, 25)], start=date(2017, 1, 1),
+                                                  end=date(2018, 12, 31))
+        self.cases = [
+            (conventions.DCC30360, ()),
+            (conventions.DCC30E360ISDA, (date(2020, 2, 29),)),
+            (conventions.DCC30EP360ISDA, ()),
+            (conventions.DCCACT360, ()),
+            (conventions.DCCACT365L, (date(2020, 3, 1), 'annual')),
+            (conventions.DCCACT365A, ()),
+            (conventions.DCCNL365, ()),
+            (conventions.DCCACTACTISDA, ()),
+        ]
+
+    def test_end_date(self):
+        date_beg = date(2017, 1, 31)
+        for convention, args in self.cases:
+            for days in (0, 1, 28, 29, 30, 59, 365, 366, 1126, 10000):
+                date_end = date_beg + timedelta(days=days)
+                factor = convention.year_fraction(date_beg, date_end, *args)
+                result = solver.end_date(convention, date_beg, factor, *args)
+                self.assertLessEqual(result, date_end)
+                self.assertGreaterEqual(convention.year_fraction(date_beg, result, *args), factor)
+                if result > date_beg:
+                    self.assertLess(convention.year_fraction(date_beg, result - timedelta(days=1), *args), factor)
+        self.assertEqual(solver.end_date('ACT/360', date(2017, 1, 15), 0.5), date(2017, 7, 14))
+        self.assertEqual(solver.end_date('ACT/ACT ISDA', date(2011, 12, 30), 2. / 365. + 1. / 366.),
+                         date(2012, 1, 2))
+        self.assertEqual(solver.end_date('BUS/252', date(2017, 12, 22), 2. / 252., self.calendar),
+                         date(2017, 12, 27))
+
+    def test_act_365_a_leap_day(self):
+        # The accrual factor decreases on 29 February 2020, from 423/365 to
+        # 424/366, so the first date reaching 424/366 is 28 February.
+        self.assertEqual(solver.end_date('ACT/365 A', date(2019, 1, 1), 424. / 366.), date(2020, 2, 28))
+        self.assertEqual(solver.end_date('ACT/365 A', date(2019, 1, 1), 1.159), date(2020, 3, 1))
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, solver.end_date, 'ACT/360', date(2017, 1, 15), -0.5)
+        self.assertRaises(ValueError, solver.end_date, 'BUS/252', date(2017, 1, 2), 3., self.calendar)
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_end_dates(self):
+        starts = [date(2017, 1, 31), date(2019, 1, 1), date(2016, 2, 29)]
+        factors = [0.25, 424. / 366., 1.]
+        for convention, args in self.cases + [(conventions.DCCBusiness252, (self.calendar,))]:
+            kwargs = dict(zip({conventions.DCC30E360ISDA: ('termination_date',),
+                               conventions.DCCACT365L: ('coupon_end', 'coupon_type'),
+                               conventions.DCCBusiness252: ('calendar',)}.get(convention, ()), args))
+            if convention is conventions.DCCBusiness252:
+                starts, factors = [date(2017, 1, 31), date(2017, 12, 22)], [0.25, 2. / 252.]
+            expected = [solver.end_date(convention, start, factor, *args) for start, factor in zip(starts, factors)]
+            result = solver.end_dates(convention, starts, factors, **kwargs)
+            self.assertEqual(result.tolist(), expected)
+
+
+class AccrualStreamTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.calendar = calendars.HolidayCalendar([date(2019, 12, 25)], start=date(2019, 1, 1), end=date(2020, 12, 31))
+        self.schedule = schedule.CouponSchedule.generate(date(2019, 1, 31), date(2020, 12, 31), 4, end_of_month=True)
+        self.cases = [
+            (conventions.DCC30360, ()),
+            (conventions.DCC30E360, ()),
+            (conventions.DCC30E360ISDA, (date(2020, 2, 29),)),
+            (conventions.DCC30EP360ISDA, ()),
+            (conventions.DCCACT360, ()),
+            (conventions.DCCACT365Fixed, ()),
+            (conventions.DCCACT365L, (date(2020, 3, 31), 'annual')),
+            (conventions.DCCACT365A, ()),
+            (conventions.DCCNL365, ()),
+            (conventions.DCCACTACTISDA, ()),
+            (conventions.DCCBusiness252, (self.calendar,)),
+            (conventions.DCCACTACTICMA, (self.schedule,)),
+        ]
+
+    def test_curve(self):
+        date_beg = date(2019, 1, 31)
+        for convention, args in self.cases:
+            curve = accrual.accrual_curve(convention, date_beg, date(2020, 12, 31), *args)
+            self.assertEqual(len(curve), 701)
+            for day, factor in curve:
+                self.assertEqual(factor, convention.year_fraction(date_beg, day, *args))
+
+    def test_curve_options(self):
+        curve = accrual.accrual_curve('ACT/360', date(2019, 12, 20), date(2019, 12, 31), notional=1e6, rate=0.036,
+                                      valuation_calendar=self.calendar)
+        self.assertEqual([day.day for day, _ in curve], [20, 23, 24, 26, 27, 30, 31])
+        self.assertAlmostEqual(curve[-1][1], 1e6 * 0.036 * 11. / 360.)
+
+    def test_datetime_arguments(self):
+        curve = accrual.accrual_curve(conventions.DCC30E360ISDA, datetime(2020, 1, 31), datetime(2020, 3, 1),
+                                      datetime(2020, 2, 29))
+        self.assertEqual(len(curve), 31)
+        self.assertEqual(curve[-1], (date(2020, 3, 1), conventions.DCC30E360ISDA.year_fraction(
+            datetime(2020, 1, 31), datetime(2020, 3, 1), datetime(2020, 2, 29))))
+
+    def test_missing_arguments(self):
+        for convention, args in self.cases:
+            if args:
+                with self.assertRaises(ValueError):
+                    accrual.AccrualStream(convention, date(2019, 1, 31))
+                with self.assertRaises(ValueError):
+                    accrual.accrual_curve(convention, date(2019, 1, 31), date(2019, 2, 28))
+        # The argument is named as in the batch functions.
+        with self.assertRaisesRegex(ValueError, '"coupon_end" is required by the ACT/365 L convention'):
+            accrual.AccrualStream('ACT/365 L', date(2019, 1, 31))
+
+    def test_advance(self):
+        stream = accrual.AccrualStream('30/360', date(2019, 1, 31))
+        self.assertEqual(stream.factor, 0.)
+        self.assertEqual(stream.advance(), 1. / 360.)
+        self.assertEqual(stream.advance(28), 31. / 360.)
+        self.assertEqual((stream.date, stream.advance(0)), (date(2019, 3, 1), 31. / 360.))
+        self.assertEqual(stream.accrued_interest(100., 0.06), 100. * 0.06 * (31. / 360.))
+        self.assertRaises(ValueError, stream.advance, -1)
+        stream = accrual.AccrualStream('BUS/252', date(2020, 12, 30), self.calendar)
+        self.assertEqual([factor for _, factor in stream], [0., 1. / 252.])
+        self.assertRaises(ValueError, stream.advance)
+
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class ColumnarTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.starts = np.array(['2017-01-15', '2017-01-31', '2017-01-31', '2016-02-29', '2020-12-31'],
+                               dtype='datetime64[D]')
+        self.ends = np.array(['2017-03-31', '2017-03-31', '2017-02-28', '2017-02-28', '2021-01-31'],
+                             dtype='datetime64[D]')
+        self.expected = batch.accrual_factors('30/360', self.starts, self.ends)
+
+    def tearDown(self):
+        for name in os.listdir(self.directory):
+            os.remove(os.path.join(self.directory, name))
+        os.rmdir(self.directory)
+
+    def test_npy(self):
+        starts_path = os.path.join(self.directory, 'starts.npy')
+        ends_path = os.path.join(self.directory, 'ends.npy')
+        output_path = os.path.join(self.directory, 'factors.npy')
+        np.save(starts_path, self.starts)
+        # Integer days since 1970-01-01 are read as dates.
+        np.save(ends_path, self.ends.astype(np.int64))
+        self.assertIsInstance(columnar.read_dates(starts_path), np.memmap)
+        factors = columnar.write_accrual_factors('30/360', starts_path, ends_path, output_path, chunk_size=2)
+        self.assertIsInstance(factors, np.memmap)
+        self.assertEqual(factors.tolist(), self.expected.tolist())
+        self.assertEqual(np.load(output_path).tolist(), self.expected.tolist())
+        factors = columnar.write_accrual_factors('30E/360 ISDA', self.starts, self.ends, output_path, chunk_size=2,
+                                                 termination_date=self.ends)
+        self.assertEqual(factors.tolist(), batch.accrual_factors('30E/360 ISDA', self.starts, self.ends,
+                                                                 termination_date=self.ends).tolist())
+        np.save(starts_path, self.starts.astype(float))
+        self.assertRaises(ValueError, columnar.read_dates, starts_path)
+        self.assertRaises(ValueError, columnar.write_accrual_factors, '30/360', self.starts, self.ends[1:],
+                          output_path)
+
+    @unittest.skipIf(pyarrow is None, 'pyarrow is not installed')
+    def test_arrow(self):
+        import pyarrow.feather
+
+        input_path = os.path.join(self.directory, 'dates.feather')
+        output_path = os.path.join(self.directory, 'factors.arrow')
+        table = pyarrow.table({'start': pyarrow.array(self.starts, pyarrow.date32()),
+                               'end': pyarrow.array(self.ends, pyarrow.date32())})
+        pyarrow.feather.write_feather(table, input_path, compression='uncompressed')
+        starts = columnar.read_dates(input_path, 'start')
+        self.assertEqual((starts.dtype, starts.flags.writeable), (np.dtype(np.int32), False))
+        ends = columnar.read_dates(input_path, 'end')
+        self.assertEqual(columnar.write_accrual_factors('30/360', starts, ends, output_path, chunk_size=2), 5)
+        result = pyarrow.ipc.open_file(output_path).read_all()
+        self.assertEqual(result.column('accrual_factor').to_pylist(), self.expected.tolist())
+        self.assertRaises(ValueError, columnar.read_dates, input_path)
+        self.assertRaises(ValueError, columnar.read_dates, output_path)
+
+
+@unittest.skipIf(pd is None, 'pandas is not installed')
+class AccessorTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.frame = pd.DataFrame({
+            'start': pd.to_datetime(['2017-01-15', '2017-01-31', '2017-01-31', None, '2016-02-29']),
+            'end': pd.to_datetime(['2017-03-31', '2017-03-31', '2017-02-28', '2017-02-28', '2017-02-28']),
+            'convention': ['30/360', 'ACT/360', '30/360', 'ACT/360', 'Actual 360'],
+        }, index=list('abcde'))
+
+    def test_dataframe(self):
+        result = self.frame.dcc.accrual_factor('start', 'end', convention='ACT/360')
+        self.assertEqual(result.index.tolist(), list('abcde'))
+        self.assertEqual(result.dropna().tolist(), [75. / 360., 59. / 360., 28. / 360., 365. / 360.])
+        self.assertTrue(np.isnan(result['d']))
+        result = self.frame.dcc.accrual_factor('start', 'end')
+        self.assertEqual(result.dropna().tolist(), [76. / 360., 59. / 360., 28. / 360., 365. / 360.])
+        self.assertRaises(ValueError, self.frame.dcc.accrual_factor, 'start', 'maturity', convention='ACT/360')
+        frame = self.frame.assign(termination_date=self.frame['end'])
+        result = frame.dcc.accrual_factor(convention='30E/360 ISDA')
+        self.assertEqual(result['c'], 28. / 360.)
+
+    def test_unused_missing_dates(self):
+        # A date argument missing from the rows of a convention not using it
+        # does not make their accrual factors missing.
+        frame = self.frame.assign(termination_date=pd.to_datetime([None, None, '2017-02-28', None, None]),
+                                  coupon_end=pd.NaT)
+        frame.loc['c', 'convention'] = '30E/360 ISDA'
+        result = frame.dcc.accrual_factor(convention='ACT/360')
+        self.assertEqual(result.dropna().tolist(), [75. / 360., 59. / 360., 28. / 360., 365. / 360.])
+        result = frame.dcc.accrual_factor()
+        self.assertEqual(result.dropna().tolist(), [76. / 360., 59. / 360., 28. / 360., 365. / 360.])
+        result = frame.dcc.accrual_factor(convention='30E/360 ISDA')
+        self.assertEqual(result.isna().tolist(), [True, True, False, True, True])
+
+    def test_series(self):
+        frame = self.frame.dropna()
+        # The end dates are aligned on the index of the beginning dates.
+        result = frame['start'].dcc.accrual_factor(frame['end'][::-1], conventions.DCCACT365Fixed)
+        self.assertEqual(result.tolist(), [75. / 365., 59. / 365., 28. / 365., 365. / 365.])
+        result = frame['start'].dcc.accrual_factor(datetime(2017, 12, 31), '30E/360 ISDA',
+                                                    termination_date=frame['end'].values)
+        self.assertEqual(result.tolist(), [345. / 360., 330. / 360., 330. / 360., 660. / 360.])
+
+
+class InstrumentationTestCase(unittest.TestCase):
+
+    def tearDown(self):
+        instrumentation.disable()
+        instrumentation.reset()
+
+    def test_scalar(self):
+        date_beg, date_end = datetime(2017, 1, 15), datetime(2017, 3, 31)
+        accrual_cache = cache.AccrualCache()
+        original_property = conventions.DCCACT360.__dict__['accrual_factor']
+        with instrumentation.instrumented():
+            self.assertTrue(instrumentation.is_enabled())
+            self.assertEqual(conventions.DCCACT360(date_beg, date_end).accrual_factor, 75. / 360.)
+            self.assertEqual(conventions.DCCACT360.year_fraction(date_beg, date_end), 75. / 360.)
+            self.assertEqual(conventions.DCC30E360ISDA.year_fraction(date_beg, date_end, date_end), 75. / 360.)
+            accrual_cache.year_fraction('Actual 360', date_beg, date_end)
+            accrual_cache.year_fraction('Actual 360', date_beg, date_end)
+        self.assertFalse(instrumentation.is_enabled())
+        self.assertNotIn('year_fraction', conventions.DCCACT360.__dict__)
+        self.assertIn('accrual_factor', conventions.DCCACT360.__dict__)
+        self.assertIs(conventions.DCCACT360.__dict__['accrual_factor'], original_property)
+        conventions.DCCACT360.year_fraction(date_beg, date_end)
+        statistics = instrumentation.snapshot()
+        self.assertEqual(sorted(statistics), ['30E/360 ISDA', 'ACT/360'])
+        self.assertEqual(sorted(statistics['ACT/360']), ['cached', 'scalar'])
+        self.assertEqual((statistics['ACT/360']['scalar']['calls'], statistics['ACT/360']['cached']['calls']), (3, 2))
+        self.assertEqual(statistics['ACT/360']['scalar']['sizes'], {'1': 3})
+        self.assertGreaterEqual(statistics['ACT/360']['scalar']['seconds'], 0.)
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_batch(self):
+        starts = np.array(['2017-01-15'] * 25, dtype='datetime64[D]')
+        with instrumentation.instrumented():
+            batch.accrual_factors('30/360', starts, starts + 30)
+            batch.accrual_factors(conventions.DCC30360, starts[:3], starts[:3] + 30)
+        batch.accrual_factors('30/360', starts, starts + 30)
+        statistics = json.loads(instrumentation.to_json())
+        self.assertEqual(statistics['30/360']['batch']['calls'], 2)
+        self.assertEqual(statistics['30/360']['batch']['items'], 28)
+        self.assertEqual(statistics['30/360']['batch']['max_size'], 25)
+        self.assertEqual(statistics['30/360']['batch']['sizes'], {'1': 1, '10': 1})
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_accrual_factor_matrix(self):
+        starts = np.array(['2017-01-15'] * 12, dtype='datetime64[D]')
+        with instrumentation.instrumented():
+            batch.accrual_factor_matrix(['30/360', conventions.DCCACT360], starts, starts + 30)
+        statistics = instrumentation.snapshot()
+        self.assertEqual(sorted(statistics), ['30/360', 'ACT/360'])
+        self.assertEqual([statistics[name]['batch']['items'] for name in ('30/360', 'ACT/360')], [12, 12])
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_array_functions(self):
+        # Every public array function records its accrual factors on the batch path.
+        starts = np.array(['2017-01-15', '2017-01-31', '2016-02-29'], dtype='datetime64[D]')
+        ends = starts + 45
+        directory = tempfile.mkdtemp()
+        input_path, output_path = os.path.join(directory, 'input.csv'), os.path.join(directory, 'output')
+        with open(input_path, 'w') as input_file:
+            input_file.write('start,end\n2017-01-15,2017-03-31\n')
+        coupon_schedule = schedule.CouponSchedule.generate(date(2015, 11, 30), date(2020, 11, 30), 4)
+        calls = [
+            ('ACT/360', lambda: batch.accrual_factors('ACT/360', starts, ends)),
+            ('ACT/360', lambda: batch.accrual_factor_matrix(['ACT/360'], starts, ends)),
+            ('ACT/360', lambda: parallel.parallel_accrual_factors('ACT/360', starts, ends, workers=2, chunk_size=2,
+                                                                   min_parallel_size=0)),
+            ('ACT/360', lambda: parallel.parallel_accrual_factors('ACT/360', starts, ends, workers=1)),
+            ('ACT/360', lambda: pipeline.process_file(input_path, output_path + '.csv', convention='ACT/360')),
+            ('ACT/360', lambda: columnar.write_accrual_factors('ACT/360', starts, ends, output_path + '.npy')),
+            ('ACT/360', lambda: cashflows.coupon_cashflows('ACT/360', starts, ends, 100., 0.01, '2017-02-01')),
+            ('ACT/360', lambda: scenarios.shifted_accrual_factors('ACT/360', starts, ends, 1)),
+            ('ACT/360', lambda: solver.end_dates('ACT/360', starts, 0.25)),
+            ('ACT/ACT ICMA', lambda: coupon_schedule.accrual_factors(starts, ends)),
+            ('30/360', lambda: schedule.accrual_period_arrays(datetime(2015, 11, 30), datetime(2020, 11, 30), 4,
+                                                              '30/360')),
+        ]
+        if pd is not None:
+            calls += [
+                ('ACT/360', lambda: pd.Series(starts).dcc.accrual_factor(ends, 'ACT/360')),
+                ('ACT/360', lambda: pd.DataFrame({'start': starts, 'end': ends}).dcc.accrual_factor(
+                    convention='ACT/360')),
+            ]
+        try:
+            for index, (name, call) in enumerate(calls):
+                with self.subTest(index=index):
+                    with instrumentation.instrumented():
+                        call()
+                    self.assertGreaterEqual(instrumentation.snapshot()[name]['batch']['calls'], 1)
+        finally:
+            for file_name in os.listdir(directory):
+                os.remove(os.path.join(directory, file_name))
+            os.rmdir(directory)
+
+    def test_keyword_arguments(self):
+        # Enabling the instrumentation does not change what the calls accept.
+        args = (datetime(2017, 1, 15), datetime(2017, 3, 31), datetime(2017, 6, 30))
+        expected = conventions.DCCACT365L.year_fraction(*args, coupon_type='annual')
+        with instrumentation.instrumented():
+            self.assertEqual(conventions.DCCACT365L.year_fraction(*args, coupon_type='annual'), expected)
+            if np is not None:
+                result = batch.accrual_factors(convention='ACT/360', starts=args[:1], ends=args[1:2])
+                self.assertEqual(result.tolist(), [75. / 360.])
+        statistics = instrumentation.snapshot()
+        self.assertEqual(statistics['ACT/365 L']['scalar']['calls'], 1)
+        if np is not None:
+            self.assertEqual(statistics['ACT/360']['batch']['calls'], 1)
+
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class ServerTestCase(unittest.TestCase):
+
+    def run_session(self, session, window=0.01, unix_path=None):
+        async def run():
+            accrual_server = server.AccrualServer(window=window)
+            if unix_path is None:
+                host, port = await accrual_server.start('127.0.0.1', 0)
+                client = await server.AccrualClient.connect(host, port)
+            else:
+                await accrual_server.start_unix(unix_path)
+                client = await server.AccrualClient.connect_unix(unix_path)
+            try:
+                async with client:
+                    return await session(client), accrual_server
+            finally:
+                await accrual_server.close()
+
+        return asyncio.run(run())
+
+    def test_micro_batches(self):
+        starts = [date(2017, 1, 15) + timedelta(days=k) for k in range(50)]
+
+        async def session(client):
+            return await asyncio.gather(*(client.accrual_factor('ACT/360', start, '2017-03-31') for start in starts))
+
+        factors, accrual_server = self.run_session(session)
+        self.assertEqual(factors, [(date(2017, 3, 31) - start).days / 360. for start in starts])
+        self.assertEqual(accrual_server.request_count, 50)
+        self.assertLess(accrual_server.batch_count, 50)
+
+    def test_options_and_errors(self):
+        async def session(client):
+            return await asyncio.gather(
+                client.accrual_factor('30E/360 ISDA', '2017-01-31', '2017-02-28', termination_date='2017-02-28'),
+                client.accrual_factor('ACT/365 L', '2016-01-15', '2016-07-15', coupon_end='2016-07-15'),
+                client.accrual_factor('ACT/360', '2017-01-15', '2017-02-30'),
+                client.accrual_factor('Unknown', '2017-01-15', '2017-03-31'),
+                return_exceptions=True)
+
+        results, _ = self.run_session(session)
+        self.assertEqual(results[:2], [28. / 360., 182. / 366.])
+        self.assertIsInstance(results[2], ValueError)
+        self.assertIn('Unknown', str(results[3]))
+
+    def test_invalid_dates(self):
+        # Invalid requests fail alone, without delaying the valid requests of
+        # the same micro-batch.
+        async def session(client):
+            return await asyncio.wait_for(asyncio.gather(
+                client.accrual_factor('ACT/360', 10 ** 30, '2017-03-31'),
+                client.accrual_factor('ACT/360', None, '2017-03-31'),
+                client.accrual_factor('ACT/360', '2017-01-15', '2017-03-31', termination_date='20170331'),
+                client.accrual_factor('ACT/360', datetime(2017, 1, 15, 12), '2017-03-31'),
+                client.accrual_factor('ACT/360', '2017-01-15', '2017-03-31'),
+                return_exceptions=True), 5.)
+
+        results, _ = self.run_session(session, window=0.05)
+        for result in results[:3]:
+            self.assertIsInstance(result, ValueError)
+        self.assertIn('"start"', str(results[0]))
+        self.assertEqual(results[3:], [75. / 360., 75. / 360.])
+
+    @unittest.skipIf(not hasattr(asyncio, 'start_unix_server'), 'Unix sockets are not supported')
+    def test_unix_socket(self):
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, 'accrual.sock')
+
+        async def session(client):
+            return await client.accrual_factor('30/360', date(2017, 1, 15), date(2017, 3, 31))
+
+        try:
+            factor, _ = self.run_session(session, window=0., unix_path=path)
+        finally:
+            if os.path.exists(path):
+                os.remove(path)
+            os.rmdir(directory)
+        self.assertEqual(factor, 76. / 360.)
+
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class CashflowsTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.starts = np.array(['2016-01-31', '2016-07-31', '2017-01-31', '2017-07-31'], dtype='datetime64[D]')
+        self.ends = np.array(['2016-07-31', '2017-01-31', '2017-07-31', '2018-01-31'], dtype='datetime64[D]')
+        self.notionals = np.array([1e6, 1e6, 5e5, 5e5])
+        self.valuation_date = date(2017, 3, 15)
+
+    def test_fixed_rate(self):
+        result = cashflows.coupon_cashflows('30/360', self.starts, self.ends, self.notionals, 0.02,
+                                            self.valuation_date)
+        self.assertEqual(result.accrual_factor.tolist(), [0.5] * 4)
+        self.assertEqual(result.amount.tolist(), [1e4, 1e4, 5e3, 5e3])
+        factor = conventions.DCC30360.year_fraction(date(2017, 1, 31), self.valuation_date)
+        self.assertEqual(result.accrued_interest.tolist(), [0., 0., 5e5 * 0.02 * factor, 0.])
+
+    def test_floating_rate(self):
+        fixings = np.array([0.01, 0.012, 0.015, 0.0])
+        result = cashflows.coupon_cashflows(conventions.DCCACT360, self.starts, self.ends, self.notionals, fixings,
+                                            self.valuation_date, spread=0.001)
+        for idx in range(len(fixings)):
+            factor = conventions.DCCACT360.year_fraction(self.starts[idx].item(), self.ends[idx].item())
+            self.assertEqual(result.amount[idx], self.notionals[idx] * (fixings[idx] + 0.001) * factor)
+        self.assertEqual(np.count_nonzero(result.accrued_interest), 1)
+
+    def test_convention_arguments(self):
+        termination_date = date(2018, 1, 31)
+        result = cashflows.coupon_cashflows(conventions.DCC30E360ISDA, self.starts, self.ends, self.notionals, 0.02,
+                                            self.valuation_date, termination_date=termination_date)
+        for idx in range(len(self.starts)):
+            conv = conventions.DCC30E360ISDA(self.starts[idx].item(), self.ends[idx].item(), termination_date)
+            self.assertEqual(result.accrual_factor[idx], conv.accrual_factor)
+        for coupon_type in ('semi-annual', 'annual'):
+            result = cashflows.coupon_cashflows('ACT/365 L', self.starts, self.ends, 1., 0.02, self.valuation_date,
+                                                coupon_type=coupon_type)
+            conv = conventions.DCCACT365L(date(2017, 1, 31), self.valuation_date, date(2017, 7, 31), coupon_type)
+            self.assertEqual(result.accrued_interest[2], 0.02 * conv.accrual_factor)
+        with self.assertRaises(ValueError):
+            cashflows.coupon_cashflows(conventions.DCC30E360ISDA, self.starts, self.ends, 1., 0.02,
+                                       self.valuation_date)
+
+    def test_valuation_dates(self):
+        # Nothing is accrued at a period start, and a period ending at the
+        # valuation date is paid.
+        result = cashflows.coupon_cashflows('30E+/360 ISDA', self.starts, self.ends, 1., 0.02, self.ends)
+        self.assertEqual(result.accrued_interest.tolist(), [0.] * 4)
+        result = cashflows.coupon_cashflows('ACT/ACT ISDA', self.starts, self.ends, 1., 0.02, self.starts)
+        self.assertEqual(result.accrued_interest.tolist(), [0.] * 4)
+
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class ScenarioTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.starts = np.array(['2015-12-31', '2016-02-27', '2016-08-31', '2019-12-30'], dtype='datetime64[D]')
+        self.ends = np.array(['2016-03-01', '2016-08-31', '2017-02-28', '2020-03-02'], dtype='datetime64[D]')
+
+    def _check(self, convention, result, shifts, end_shifts, *args):
+        self.assertEqual(result.shape, (len(self.starts), len(shifts), len(end_shifts)))
+        for i in range(len(self.starts)):
+            for j, shift in enumerate(shifts):
+                for k, end_shift in enumerate(end_shifts):
+                    date_beg = self.starts[i].item() + timedelta(days=shift)
+                    date_end = self.ends[i].item() + timedelta(days=end_shift)
+                    self.assertEqual(result[i, j, k], convention.year_fraction(date_beg, date_end, *args))
+
+    def test_shifted_accrual_factors(self):
+        for convention in (conventions.DCC30360, conventions.DCC30EP360ISDA, conventions.DCCACT365A,
+                           conventions.DCCNL365, conventions.DCCACTACTISDA):
+            result = scenarios.shifted_accrual_factors(convention, self.starts, self.ends, 2)
+            self._check(convention, result, range(-2, 3), range(-2, 3))
+        result = scenarios.shifted_accrual_factors('ACT/360', self.starts, self.ends, [0, 1], [-1])
+        self._check(conventions.DCCACT360, result, [0, 1], [-1])
+
+    def test_convention_arguments(self):
+        termination_date = date(2017, 2, 28)
+        result = scenarios.shifted_accrual_factors(conventions.DCC30E360ISDA, self.starts, self.ends, 1,
+                                                   termination_date=termination_date)
+        self._check(conventions.DCC30E360ISDA, result, range(-1, 2), range(-1, 2), termination_date)
+        result = scenarios.shifted_accrual_factors('ACT/365 L', self.starts[:1], self.ends[:1], 1,
+                                                   coupon_end=[date(2016, 6, 30)], coupon_type='annual')
+        self.assertEqual(result[0, 0, 2], conventions.DCCACT365L.year_fraction(date(2015, 12, 30), date(2016, 3, 2),
+                                                                                date(2016, 6, 30), 'annual'))
+        with self.assertRaises(ValueError):
+            scenarios.shifted_accrual_factors(conventions.DCC30E360ISDA, self.starts, self.ends, 1)
+        with self.assertRaises(ValueError):
+            scenarios.shifted_accrual_factors('ACT/360', self.starts, self.ends, -1)
+
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class ParsingTestCase(unittest.TestCase):
+
+    def setUp(self):
+        beg = date(1, 1, 1)
+        self.dates = [beg + timedelta(days=days) for days in range(0, 3652059, 997)] + [date(9999, 12, 31)]
+        self.strings = [value.isoformat() for value in self.dates]
+
+    def test_parse_dates(self):
+        expected = np.array(self.dates, dtype='datetime64[D]')
+        for values in (self.strings, np.array(self.strings), np.array(self.strings, dtype='S'),
+                       np.array(self.strings, dtype=object), ('\n'.join(self.strings) + '\n').encode(),
+                       '\r\n'.join(self.strings).encode()):
+            result = parsing.parse_dates(values)
+            self.assertEqual(result.dtype, np.dtype('datetime64[D]'))
+            self.assertTrue(np.array_equal(result, expected))
+        self.assertEqual(parsing.parse_dates(self.strings, ordinals=True).tolist(),
+                         [value.toordinal() for value in self.dates])
+        self.assertEqual(parsing.parse_dates([self.strings[:2]]).shape, (1, 2))
+        self.assertEqual(parsing.parse_dates([]).size, 0)
+        self.assertEqual(parsing.parse_dates(b'').size, 0)
+
+    def test_invalid_dates(self):
+        for value in ('2017-02-29', '2017-13-01', '2017-00-10', '2017-04-31', '0000-01-01', '2017-1-15',
+                      '2017/01/15', '2017-01-15T00', ' 2017-01-15', ''):
+            with self.assertRaisesRegex(ValueError, 'at row 2 '):
+                parsing.parse_dates(self.strings[:2] + [value] + self.strings[2:4])
+        with self.assertRaisesRegex(ValueError, 'at row 1 \\(2 invalid values\\)'):
+            parsing.parse_dates(b'2017-01-15\n2017-02-30\n2017-01-15\n2017-02-30\n')
+        with self.assertRaises(ValueError):
+            parsing.parse_dates(np.arange(3))
+
+    def test_accrual_factors(self):
+        starts = parsing.parse_dates(self.strings[:-1])
+        ends = parsing.parse_dates(self.strings[1:])
+        result = batch.accrual_factors('ACT/ACT ISDA', starts, ends)
+        for idx in range(len(result)):
+            self.assertEqual(result[idx], conventions.DCCACTACTISDA.year_fraction(self.dates[idx],
+                                                                                  self.dates[idx + 1]))
+
+
+class LazyImportTestCase(unittest.TestCase):
+
+    def test_scalar_import(self):
+        # A new interpreter, since this module imports the heavy backends.
+        script = ('import sys, datetime, daycountconventions as dcc; '
+                  'dcc.resolve("ACT/360").year_fraction(datetime.date(2017, 1, 15), datetime.date(2017, 3, 31)); '
+                  'dcc.HolidayCalendar; dcc.AccrualCache; dcc.accrual_periods; '
+                  'print(sorted(set(["numpy", "pandas", "pyarrow"]) & set(sys.modules)))')
+        output = subprocess.check_output([sys.executable, '-c', script], cwd=os.path.dirname(os.path.abspath(__file__)))
+        self.assertEqual(output.decode().strip(), '[]')
+
+    def test_lazy_names(self):
+        self.assertIs(daycountconventions.DCC30360, conventions.DCC30360)
+        self.assertIs(daycountconventions.end_date, solver.end_date)
+        self.assertIs(daycountconventions.schedule, schedule)
+        self.assertIn('accrual_factors', dir(daycountconventions))
+        self.assertRaises(AttributeError, getattr, daycountconventions, 'DCC30365')
+
 
 if __name__ == '__main__':
     dcc_suite = unittest.TestLoader().loadTestsFromTestCase(DayCountConventionTestCase)
-    all_suite = unittest.TestSuite([dcc_suite])
+    registry_suite = unittest.TestLoader().loadTestsFromTestCase(RegistryTestCase)
+    calendar_suite = unittest.TestLoader().loadTestsFromTestCase(HolidayCalendarTestCase)
+    schedule_suite = unittest.TestLoader().loadTestsFromTestCase(CouponScheduleTestCase)
+    cache_suite = unittest.TestLoader().loadTestsFromTestCase(AccrualCacheTestCase)
+    batch_suite = unittest.TestLoader().loadTestsFromTestCase(BatchAccrualFactorTestCase)
+    parallel_suite = unittest.TestLoader().loadTestsFromTestCase(ParallelTestCase)
+    pipeline_suite = unittest.TestLoader().loadTestsFromTestCase(PipelineTestCase)
+    validation_suite = unittest.TestLoader().loadTestsFromTestCase(ValidationTestCase)
+    solver_suite = unittest.TestLoader().loadTestsFromTestCase(SolverTestCase)
+    accrual_suite = unittest.TestLoader().loadTestsFromTestCase(AccrualStreamTestCase)
+    columnar_suite = unittest.TestLoader().loadTestsFromTestCase(ColumnarTestCase)
+    accessor_suite = unittest.TestLoader().loadTestsFromTestCase(AccessorTestCase)
+    instrumentation_suite = unittest.TestLoader().loadTestsFromTestCase(InstrumentationTestCase)
+    server_suite = unittest.TestLoader().loadTestsFromTestCase(ServerTestCase)
+    cashflows_suite = unittest.TestLoader().loadTestsFromTestCase(CashflowsTestCase)
+    scenario_suite = unittest.TestLoader().loadTestsFromTestCase(ScenarioTestCase)
+    parsing_suite = unittest.TestLoader().loadTestsFromTestCase(ParsingTestCase)
+    import_suite = unittest.TestLoader().loadTestsFromTestCase(LazyImportTestCase)
+    all_suite = unittest.TestSuite([dcc_suite, registry_suite, calendar_suite, schedule_suite, cache_suite,
+                                    batch_suite, parallel_suite, pipeline_suite, validation_suite,
+                                    solver_suite, accrual_suite, columnar_suite, accessor_suite,
+                                    instrumentation_suite, server_suite, cashflows_suite, scenario_suite,
+                                    parsing_suite, import_suite])
     unittest.TextTestRunner(verbosity=2).run(all_suite)